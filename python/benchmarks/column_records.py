@@ -0,0 +1,71 @@
+"""
+Benchmark of the creation of the column metadata emitted by the sources.
+
+The bulk paths of the sources emit slotted ColumnRecord instead of validated ColumnMetadata, the
+time and the memory allocated by column are expected to be several times lower.
+Run it with ``python benchmarks/column_records.py`` once Metadata Guardian is installed.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from loguru import logger
+
+from metadata_guardian.scanner import _columns_words
+from metadata_guardian.source import ColumnMetadata, ColumnRecord
+
+
+def generate_columns(columns_count: int) -> list[tuple[str, str | None]]:
+    """
+    Generate the names and the comments of the columns, as fetched from a source.
+
+    :param columns_count: the number of columns to generate
+    :return: the column names with their comment
+    """
+    return [
+        (f"column_{index}", f"comment of column {index}" if index % 2 else None)
+        for index in range(columns_count)
+    ]
+
+
+def run(
+    column_type: Callable[..., ColumnMetadata | ColumnRecord],
+    columns: list[tuple[str, str | None]],
+) -> tuple[float, float]:
+    """
+    Create the column metadata of the columns and get their words, as the scanner does.
+
+    :param column_type: the class of the column metadata
+    :param columns: the column names with their comment
+    :return: the elapsed seconds and the peak of the allocated bytes by column
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    columns_metadata = [
+        column_type(column_name=column_name, column_comment=column_comment)
+        for column_name, column_comment in columns
+    ]
+    _columns_words(columns_metadata)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / len(columns)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--columns", type=int, default=200_000)
+    arguments = parser.parse_args()
+    logger.remove()
+
+    columns = generate_columns(columns_count=arguments.columns)
+    print(f"{'column type':>16} {'seconds':>10} {'bytes/column':>14}")
+    for column_type in (ColumnMetadata, ColumnRecord):
+        elapsed, peak = run(column_type=column_type, columns=columns)
+        print(f"{column_type.__name__:>16} {elapsed:>10.3f} {peak:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
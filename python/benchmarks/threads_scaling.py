@@ -0,0 +1,84 @@
+"""
+Benchmark of the scaling of the words validation with the number of Python threads.
+
+The validation releases the GIL, so the throughput is expected to grow with the number of
+threads until the number of cores is reached.
+Run it with ``python benchmarks/threads_scaling.py`` once Metadata Guardian is installed.
+"""
+
+import argparse
+import random
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from metadata_guardian import AvailableCategory, DataRules
+
+
+def generate_words(words_count: int, seed: int = 42) -> list[str]:
+    """
+    Generate column-like words, some of them matching the PII data rules.
+
+    :param words_count: the number of words to generate
+    :param seed: the seed of the random generator
+    :return: the generated words
+    """
+    generator = random.Random(seed)
+    words = []
+    for index in range(words_count):
+        if index % 100 == 0:
+            words.append(generator.choice(["email", "user_phone", "address"]))
+        else:
+            words.append(
+                "_".join(
+                    "".join(generator.choices(string.ascii_lowercase, k=8))
+                    for _ in range(3)
+                )
+            )
+    return words
+
+
+def run(data_rules: DataRules, words: list[str], threads: int, batches: int) -> float:
+    """
+    Validate the batches of words with a pool of threads.
+
+    :param data_rules: the data rules
+    :param words: the words of a batch
+    :param threads: the number of threads
+    :param batches: the number of batches to validate
+    :return: the throughput in words per second
+    """
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: data_rules.validate_words(words), range(batches)))
+        elapsed = time.perf_counter() - start
+    return len(words) * batches / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=20_000)
+    parser.add_argument("--batches", type=int, default=32)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    arguments = parser.parse_args()
+    logger.remove()
+
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+    words = generate_words(words_count=arguments.words)
+    baseline = None
+    print(f"{'threads':>8} {'words/s':>14} {'speedup':>8}")
+    for threads in arguments.threads:
+        throughput = run(
+            data_rules=data_rules,
+            words=words,
+            threads=threads,
+            batches=arguments.batches,
+        )
+        baseline = baseline or throughput
+        print(f"{threads:>8} {throughput:>14,.0f} {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
+from .cache import *
 from .conf import *
 from .data_rules import *
 from .exceptions import *
+from .journal import *
 from .report import *
 from .scanner import *
 from .source import *
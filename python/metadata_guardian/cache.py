@@ -0,0 +1,276 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import pyarrow
+from loguru import logger
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+
+from .data_rules import DataRules, MetadataGuardianResults
+from .sqlite_store import SQLiteStore
+
+_RESULTS_ADAPTER = TypeAdapter(list[MetadataGuardianResults])
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _hash_file_content(file_path: str) -> str:
+    """
+    Hash the content of a file.
+
+    :param file_path: the path of the file
+    :return: the hexadecimal hash of the content
+    """
+    content_hash = hashlib.blake2b()
+    with open(file_path, "rb") as file:
+        while block := file.read(_HASH_BLOCK_SIZE):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+class ContentFilesCache(SQLiteStore):
+    """
+    Content Files Cache instance storing the results of the scanned files in a SQLite database.
+
+    A file is fingerprinted with its path, size and modification time before being scanned, the
+    results are only reused with the same data rules fingerprint. The content is only hashed when
+    the modification time changed but not the size: the results are reused if the hash is the
+    one stored, and the hash is stored with the new results otherwise, so the files are read once
+    by the scan. A file that can no longer be read is not reused.
+    """
+
+    _content_hashes: dict[tuple[str, int, int], str] = PrivateAttr(default_factory=dict)
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        """
+        Create the table of the content files if it does not exist.
+
+        :param connection: the SQLite connection
+        :return:
+        """
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS content_files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT,
+                rules_fingerprint TEXT NOT NULL,
+                results TEXT NOT NULL
+            )
+            """
+        )
+
+    def get_results(
+        self, file_paths: list[str], rules_fingerprint: str
+    ) -> dict[str, list[MetadataGuardianResults]]:
+        """
+        Get the cached results of the files that did not change since they were stored.
+
+        :param file_paths: the paths of the files
+        :param rules_fingerprint: the fingerprint of the data rules used for the scan
+        :return: the cached metadata guardian results by file path, without the changed files
+        """
+        cached_results = {}
+        refreshed_files: list[tuple[Any, ...]] = []
+        for file_path in file_paths:
+            row = self.connection.execute(
+                "SELECT size, mtime_ns, content_hash, results FROM content_files"
+                " WHERE path = ? AND rules_fingerprint = ?",
+                (file_path, rules_fingerprint),
+            ).fetchone()
+            if row is None:
+                continue
+            size, mtime_ns, content_hash, results = row
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.st_size != size:
+                continue
+            if stat.st_mtime_ns != mtime_ns:
+                try:
+                    current_content_hash = _hash_file_content(file_path)
+                except OSError:
+                    continue
+                if current_content_hash != content_hash:
+                    self._content_hashes[
+                        (file_path, stat.st_size, stat.st_mtime_ns)
+                    ] = current_content_hash
+                    continue
+                refreshed_files.append((stat.st_mtime_ns, file_path))
+            cached_results[file_path] = _RESULTS_ADAPTER.validate_json(results)
+        if refreshed_files:
+            with self.connection:
+                self.connection.executemany(
+                    "UPDATE content_files SET mtime_ns = ? WHERE path = ?",
+                    refreshed_files,
+                )
+        logger.debug(
+            f"Reuse the cached results of {len(cached_results)}/{len(file_paths)} files"
+        )
+        return cached_results
+
+    def get_fingerprints(
+        self, file_paths: list[str]
+    ) -> dict[str, tuple[int, int, str | None]]:
+        """
+        Get the fingerprint of the files, to be taken before they are scanned: a file modified
+        during its scan keeps the fingerprint of its former content and is scanned again next time.
+        The files are not read, only the content hash computed by get_results for the same size
+        and modification time is kept.
+
+        :param file_paths: the paths of the files
+        :return: the size, modification time and content hash if known by file path, without the
+        files that could not be read
+        """
+        files_fingerprints = {}
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                logger.debug(f"The file {file_path} could not be fingerprinted")
+                continue
+            files_fingerprints[file_path] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+                self._content_hashes.pop(
+                    (file_path, stat.st_size, stat.st_mtime_ns), None
+                ),
+            )
+        return files_fingerprints
+
+    def set_results(
+        self,
+        files_results: dict[str, list[MetadataGuardianResults]],
+        files_fingerprints: dict[str, tuple[int, int, str | None]],
+        rules_fingerprint: str,
+    ) -> None:
+        """
+        Store the results of the scanned files with the fingerprint they had before their scan.
+        The files without fingerprint are not stored.
+
+        :param files_results: the metadata guardian results by file path
+        :param files_fingerprints: the fingerprints given by get_fingerprints by file path
+        :param rules_fingerprint: the fingerprint of the data rules used for the scan
+        :return:
+        """
+        rows = [
+            (
+                file_path,
+                *files_fingerprints[file_path],
+                rules_fingerprint,
+                _RESULTS_ADAPTER.dump_json(results).decode(),
+            )
+            for file_path, results in files_results.items()
+            if file_path in files_fingerprints
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO content_files"
+                " (path, size, mtime_ns, content_hash, rules_fingerprint, results)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+
+class WordsMatchesCache(BaseModel):
+    """
+    Words Matches Cache instance memoizing the indices of the data rules matching the words.
+
+    The same column names are found in many tables: the words already validated are not sent
+    again to the data rules. The cache is bounded to the most recently used words, it can be
+    shared by the scans of a scanner or by several scanners of the process. The entries are
+    bound to the data rules fingerprint, so the cache can be used with different data rules.
+    """
+
+    max_size: int = 100_000
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    _matches: OrderedDict[tuple[str, str], tuple[int, ...]] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def match_words(
+        self, data_rules: DataRules, words: list[str]
+    ) -> list[tuple[int, ...]]:
+        """
+        Get the indices of the data rules matching each word.
+        Only the words missing from the cache are validated by the data rules, once.
+
+        :param data_rules: the data rules
+        :param words: the words to validate
+        :return: the indices of the matching data rules of each word
+        """
+        rules_fingerprint = data_rules.fingerprint()
+        words_matches: dict[str, tuple[int, ...]] = {}
+        with self._lock:
+            for word in words:
+                if word in words_matches:
+                    continue
+                key = (rules_fingerprint, word)
+                data_rules_indices = self._matches.get(key)
+                if data_rules_indices is not None:
+                    self._matches.move_to_end(key)
+                    self.hits += 1
+                    words_matches[word] = data_rules_indices
+        missing_words = [
+            word for word in dict.fromkeys(words) if word not in words_matches
+        ]
+        if missing_words:
+            missing_matches: list[tuple[int, ...]] = [()] * len(missing_words)
+            for word_index, matched_indices in data_rules.match_words(
+                words=missing_words
+            ):
+                missing_matches[word_index] = tuple(matched_indices)
+            with self._lock:
+                for missing_word, missing_indices in zip(
+                    missing_words, missing_matches
+                ):
+                    missing_word = sys.intern(missing_word)
+                    self._matches[(rules_fingerprint, missing_word)] = missing_indices
+                    self.misses += 1
+                    words_matches[missing_word] = missing_indices
+                while len(self._matches) > self.max_size:
+                    self._matches.popitem(last=False)
+                    self.evictions += 1
+        return [words_matches[word] for word in words]
+
+    def validate_words(
+        self, data_rules: DataRules, words: list[str]
+    ) -> list[MetadataGuardianResults]:
+        """
+        Validate a list of words with the data rules, reusing the cached matches.
+
+        :param data_rules: the data rules
+        :param words: the words to validate
+        :return: the metadata guardian results
+        """
+        return data_rules.results_from_matches(
+            words=words,
+            words_matches=self.match_words(data_rules=data_rules, words=words),
+        )
+
+    def validate_words_arrow(
+        self, data_rules: DataRules, words: list[str]
+    ) -> pyarrow.RecordBatch:
+        """
+        Validate a list of words with the data rules, reusing the cached matches.
+        The record batch has the columns of DataRules.validate_words_arrow.
+
+        :param data_rules: the data rules
+        :param words: the words to validate
+        :return: the metadata guardian results as an Arrow record batch
+        """
+        return data_rules.record_batch_from_matches(
+            words=words,
+            words_matches=self.match_words(data_rules=data_rules, words=words),
+        )
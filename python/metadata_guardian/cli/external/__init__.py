@@ -1,15 +1,26 @@
 import asyncio
+import json
+import os
 
 import typer
 from loguru import logger
+from pyarrow import cpu_count
 
-from ... import ColumnScanner, DataRules
+from ... import (
+    ColumnScanner,
+    DataRules,
+    JsonLinesReportSink,
+    ScanJournal,
+    TablesStateStore,
+)
 from ...source.external.external_metadata_source import ExternalMetadataSource
 
 app = typer.Typer()
 
 
-def get_external_source(source: str, configuration: str) -> ExternalMetadataSource:
+def get_external_source(
+    source: str, configuration: str, bulk_metadata: bool = False
+) -> ExternalMetadataSource:
     sources = list_sources(displayed=False)
     if source not in sources:
         raise ValueError(f"This source is not available in the list: {sources}")
@@ -23,6 +34,14 @@ def get_external_source(source: str, configuration: str) -> ExternalMetadataSour
     except Exception as exception:
         logger.exception("This source initiation failed.")
         raise exception
+    if bulk_metadata:
+        if "bulk_metadata" not in selected_source.model_fields:
+            raise ValueError(
+                f"The bulk metadata is not supported by the source {source}"
+            )
+        return selected_source.model_validate(
+            {**json.loads(configuration), "bulk_metadata": True}
+        )
     return selected_source.parse_raw(configuration)
 
 
@@ -42,14 +61,23 @@ def scan_async(
     configuration: str,
     table_name: str | None = None,
     include_comments: bool = False,
+    journal_path: str | None = None,
+    bulk_metadata: bool = False,
 ) -> None:
-    source = get_external_source(source=external_source, configuration=configuration)
+    source = get_external_source(
+        source=external_source,
+        configuration=configuration,
+        bulk_metadata=bulk_metadata,
+    )
 
     data_rules = DataRules.from_path(path=data_rules_path)
+    journal = ScanJournal(path=journal_path) if journal_path else None
     column_scanner = ColumnScanner(
-        data_rules=data_rules, progression_bar_disabled=False
+        data_rules=data_rules,
+        progression_bar_disabled=False,
+        journal=journal,
     )
-    with source:
+    try:
         with source:
             report = asyncio.run(
                 column_scanner.scan_external_async(
@@ -60,6 +88,9 @@ def scan_async(
                 )
             )
             report.to_console()
+    finally:
+        if journal is not None:
+            journal.close()
 
 
 @app.command(help="Scan the external metadata sources with the ColumnScanner")
@@ -70,12 +101,20 @@ def scan(
     configuration: str,
     table_name: str | None = None,
     include_comments: bool = False,
+    state_path: str | None = None,
+    bulk_metadata: bool = False,
 ) -> None:
-    source = get_external_source(source=external_source, configuration=configuration)
+    source = get_external_source(
+        source=external_source,
+        configuration=configuration,
+        bulk_metadata=bulk_metadata,
+    )
 
     data_rules = DataRules.from_path(path=data_rules_path)
     column_scanner = ColumnScanner(
-        data_rules=data_rules, progression_bar_disabled=False
+        data_rules=data_rules,
+        progression_bar_disabled=False,
+        state_store=TablesStateStore(path=state_path) if state_path else None,
     )
     with source:
         report = column_scanner.scan_external(
@@ -85,3 +124,66 @@ def scan(
             include_comment=include_comments,
         )
         report.to_console()
+
+
+@app.command(
+    help="Sweep all the databases of the external metadata sources with the ColumnScanner"
+)
+def sweep(
+    external_source: str,
+    data_rules_path: str,
+    configuration: str,
+    database_names: list[str] | None = typer.Option(None, "--database-name"),
+    tasks_limit: int = cpu_count(),
+    databases_limit: int = 4,
+    include_comments: bool = False,
+    checkpoint_path: str | None = None,
+    journal_path: str | None = None,
+    output_path: str | None = None,
+    bulk_metadata: bool = False,
+) -> None:
+    source = get_external_source(
+        source=external_source,
+        configuration=configuration,
+        bulk_metadata=bulk_metadata,
+    )
+
+    data_rules = DataRules.from_path(path=data_rules_path)
+    # The checkpointed databases are skipped and already in the output, the journaled tables
+    # are written again by the resumed sweep
+    sink = (
+        JsonLinesReportSink(
+            path=output_path,
+            append=checkpoint_path is not None and os.path.exists(checkpoint_path),
+        )
+        if output_path
+        else None
+    )
+    journal = ScanJournal(path=journal_path) if journal_path else None
+    column_scanner = ColumnScanner(
+        data_rules=data_rules,
+        progression_bar_disabled=False,
+        sink=sink,
+        journal=journal,
+    )
+    try:
+        with source:
+            report = asyncio.run(
+                column_scanner.sweep_external_async(
+                    source,
+                    database_names=database_names or None,
+                    tasks_limit=tasks_limit,
+                    databases_limit=databases_limit,
+                    include_comment=include_comments,
+                    checkpoint_path=checkpoint_path,
+                )
+            )
+    finally:
+        if sink is not None:
+            sink.close()
+        if journal is not None:
+            journal.close()
+    if sink is None:
+        report.to_console()
+    else:
+        logger.info(f"The sweep results are written to {output_path}")
@@ -7,7 +7,9 @@ from ...source.local.local_metadata_source import LocalMetadataSource
 app = typer.Typer()
 
 
-def get_local_source(source: str, path: str) -> LocalMetadataSource:
+def get_local_source(
+    source: str, path: str, flatten_nested: bool = False
+) -> LocalMetadataSource:
     sources = list_sources(displayed=False)
     if source not in sources:
         raise ValueError(f"This source is not available in the list: {sources}")
@@ -15,7 +17,7 @@ def get_local_source(source: str, path: str) -> LocalMetadataSource:
     try:
         selected_source = next(  # type: ignore
             cls for cls in LocalMetadataSource.__subclasses__() if cls.type() == source
-        )(local_path=path)
+        )(local_path=path, flatten_nested=flatten_nested)
     except Exception as exception:
         logger.exception("This source initiation failed.")
         raise exception
@@ -31,8 +33,12 @@ def list_sources(displayed: bool = True) -> list[str]:
 
 
 @app.command(help="Scan the local metadata sources with the ColumnScanner")
-def scan(local_source: str, data_rules_path: str, path: str) -> None:
-    source = get_local_source(source=local_source, path=path)
+def scan(
+    local_source: str, data_rules_path: str, path: str, flatten_nested: bool = False
+) -> None:
+    source = get_local_source(
+        source=local_source, path=path, flatten_nested=flatten_nested
+    )
 
     data_rules = DataRules.from_path(path=data_rules_path)
     column_scanner = ColumnScanner(
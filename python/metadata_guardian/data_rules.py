@@ -1,8 +1,11 @@
+import hashlib
 import importlib.resources
+import itertools
 from collections.abc import Generator
 from enum import Enum
 from typing import Any
 
+import pyarrow
 from loguru import logger
 from pydantic import BaseModel, PrivateAttr
 
@@ -32,10 +35,33 @@ class MetadataGuardianResults(BaseModel):
     data_rules: list[DataRule]
 
 
+def _to_metadata_guardian_results(result: Any) -> MetadataGuardianResults:
+    """
+    Convert the raw results of the Rust binding.
+
+    :param result: the raw metadata guardian results
+    :return: the metadata guardian results
+    """
+    return MetadataGuardianResults(
+        category=result._category,
+        content=result._content,
+        data_rules=[
+            DataRule(
+                rule_name=data_rule.rule_name,
+                regex_pattern=data_rule.pattern,
+                documentation=data_rule.documentation,
+            )
+            for data_rule in result._data_rules
+        ],
+    )
+
+
 class DataRules(BaseModel):
     """Data Rules instances."""
 
     _data_rules: RawDataRules = PrivateAttr()
+    _rules: list[DataRule] | None = PrivateAttr(default=None)
+    _fingerprint: str | None = PrivateAttr(default=None)
 
     def __init__(self, data_rules: RawDataRules, **data: Any) -> None:
         super().__init__(**data)
@@ -97,28 +123,136 @@ class DataRules(BaseModel):
             path = str(resource)
             return cls.from_path(path=path)
 
-    def validate_word(self, word: str) -> MetadataGuardianResults:
+    def fingerprint(self) -> str:
         """
-        Validate a word with the data rules defined.
+        Get the fingerprint of the data rules, it changes as soon as a data rule changes.
+        The data rules are immutable, the fingerprint is computed once.
 
-        :param word: the word to validate
-        :return: the metadata guardian results
+        :return: the hexadecimal hash of the category and the data rules
         """
-        logger.debug(f"Validate the Data Rules with the word {word}")
-        result = self._data_rules.validate_word(word=word)
-        return MetadataGuardianResults(
-            category=result._category,
-            content=result._content,
-            data_rules=[
+        if self._fingerprint is None:
+            rules_hash = hashlib.sha256(self._data_rules.category.encode())
+            for data_rule in self._data_rules.data_rules:
+                for value in (
+                    data_rule.rule_name,
+                    data_rule.pattern,
+                    data_rule.documentation,
+                ):
+                    rules_hash.update(b"\0")
+                    rules_hash.update(value.encode())
+            self._fingerprint = rules_hash.hexdigest()
+        return self._fingerprint
+
+    @property
+    def category(self) -> str:
+        """
+        Get the category of the data rules.
+
+        :return: the category
+        """
+        return self._data_rules.category
+
+    def get_data_rules(self) -> list[DataRule]:
+        """
+        Get the data rules, ordered as their indices.
+
+        :return: the data rules
+        """
+        if self._rules is None:
+            self._rules = [
                 DataRule(
                     rule_name=data_rule.rule_name,
                     regex_pattern=data_rule.pattern,
                     documentation=data_rule.documentation,
                 )
-                for data_rule in result._data_rules
+                for data_rule in self._data_rules.data_rules
+            ]
+        return list(self._rules)
+
+    def match_words(self, words: list[str]) -> list[tuple[int, list[int]]]:
+        """
+        Get the indices of the data rules matching the words.
+
+        :param words: the words to validate
+        :return: the index of each matching word with the indices of its matching data rules
+        """
+        logger.debug(f"Match the Data Rules with {len(words)} words")
+        return self._data_rules.match_words(words)
+
+    def match_words_batch(
+        self, words_batch: list[list[str]]
+    ) -> list[list[tuple[int, ...]]]:
+        """
+        Get the indices of the data rules matching the words of multiple sources in one call.
+        The words are gathered in one flat list with the offsets of each source, validated at
+        once and split back by source.
+
+        :param words_batch: the words of each source
+        :return: the indices of the matching data rules of each word, by source
+        """
+        words = [word for source_words in words_batch for word in source_words]
+        offsets = [0, *itertools.accumulate(map(len, words_batch))]
+        words_matches: list[tuple[int, ...]] = [()] * len(words)
+        for word_index, data_rules_indices in self.match_words(words=words):
+            words_matches[word_index] = tuple(data_rules_indices)
+        return [words_matches[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def results_from_matches(
+        self, words: list[str], words_matches: list[tuple[int, ...]]
+    ) -> list[MetadataGuardianResults]:
+        """
+        Create the metadata guardian results of the words from their matching data rules.
+
+        :param words: the validated words
+        :param words_matches: the indices of the matching data rules of each word
+        :return: the metadata guardian results
+        """
+        rules = self.get_data_rules()
+        return [
+            MetadataGuardianResults(
+                category=self.category,
+                content=word,
+                data_rules=[rules[index] for index in data_rules_indices],
+            )
+            for word, data_rules_indices in zip(words, words_matches)
+            if data_rules_indices
+        ]
+
+    def record_batch_from_matches(
+        self, words: list[str], words_matches: list[tuple[int, ...]]
+    ) -> pyarrow.RecordBatch:
+        """
+        Create the record batch of the words from their matching data rules.
+        The record batch is built natively like the validate_words_arrow results.
+
+        :param words: the validated words
+        :param words_matches: the indices of the matching data rules of each word
+        :return: the metadata guardian results as an Arrow record batch
+        """
+        matched_words = [
+            (word, list(data_rules_indices))
+            for word, data_rules_indices in zip(words, words_matches)
+            if data_rules_indices
+        ]
+        return self._data_rules.record_batch_from_matches(
+            [word for word, _ in matched_words],
+            [
+                (word_index, data_rules_indices)
+                for word_index, (_, data_rules_indices) in enumerate(matched_words)
             ],
         )
 
+    def validate_word(self, word: str) -> MetadataGuardianResults:
+        """
+        Validate a word with the data rules defined.
+
+        :param word: the word to validate
+        :return: the metadata guardian results
+        """
+        logger.debug(f"Validate the Data Rules with the word {word}")
+        result = self._data_rules.validate_word(word=word)
+        return _to_metadata_guardian_results(result)
+
     def validate_words(self, words: list[str]) -> list[MetadataGuardianResults]:
         """
         Validate a list of words with the data rules defined.
@@ -126,45 +260,128 @@ class DataRules(BaseModel):
         :param words: the words to validate
         :return: the metadata guardian results
         """
-        logger.debug(f"Validate the Data Rules with the words {words}")
+        logger.debug(f"Validate the Data Rules with {len(words)} words")
         results = self._data_rules.validate_words(words=words)
-        return [
-            MetadataGuardianResults(
-                category=result._category,
-                content=result._content,
-                data_rules=[
-                    DataRule(
-                        rule_name=data_rule.rule_name,
-                        regex_pattern=data_rule.pattern,
-                        documentation=data_rule.documentation,
+        return [_to_metadata_guardian_results(result) for result in results]
+
+    def validate_words_arrow(self, words: list[str]) -> pyarrow.RecordBatch:
+        """
+        Validate a list of words with the data rules defined, the results stay columnar.
+        The record batch has one row by word and matching data rule with the columns category,
+        content, rule_name, documentation and rule_index, the category, rule name and documentation
+        columns are dictionary encoded.
+
+        :param words: the words to validate
+        :return: the metadata guardian results as an Arrow record batch
+        """
+        logger.debug(f"Validate the Data Rules with {len(words)} words")
+        return self._data_rules.validate_words_arrow(words)
+
+    def validate_arrow(
+        self,
+        array: pyarrow.Array | pyarrow.ChunkedArray,
+        table_ids: pyarrow.Array | pyarrow.ChunkedArray | None = None,
+    ) -> pyarrow.RecordBatch:
+        """
+        Validate the strings of an Arrow string array with the data rules defined, such as the
+        column names fetched from an INFORMATION_SCHEMA view. The Arrow buffers are read without
+        being copied and the strings are lowercased natively, the null strings are skipped.
+        The record batch has the columns of the validate_words_arrow results, with the row_index
+        column referencing the row of the validated string, and the table_id column with the
+        table id of the row when the table ids are given.
+
+        :param array: the strings to validate, a string, large string or string view array
+        :param table_ids: the table id of each row of the array
+        :return: the metadata guardian results as an Arrow record batch
+        """
+        logger.debug(f"Validate the Data Rules with {len(array)} Arrow strings")
+        chunks = (
+            array.chunks if isinstance(array, pyarrow.ChunkedArray) else [array]
+        ) or [pyarrow.array([], type=pyarrow.string())]
+        offsets = itertools.accumulate(map(len, chunks), initial=0)
+        record_batches = [
+            self._data_rules.validate_arrow(chunk, offset)
+            for chunk, offset in zip(chunks, offsets)
+        ]
+        record_batch = record_batches[0]
+        if len(record_batches) > 1:
+            record_batch = pyarrow.RecordBatch.from_arrays(
+                [
+                    pyarrow.concat_arrays(
+                        [batch.column(index) for batch in record_batches]
                     )
-                    for data_rule in result._data_rules
+                    for index in range(record_batch.num_columns)
                 ],
+                schema=record_batch.schema,
             )
-            for result in results
-        ]
+        if table_ids is not None:
+            row_table_ids = table_ids.take(record_batch.column("row_index"))
+            if isinstance(row_table_ids, pyarrow.ChunkedArray):
+                row_table_ids = row_table_ids.combine_chunks()
+            record_batch = record_batch.append_column("table_id", row_table_ids)
+        return record_batch
 
-    def validate_file(self, path: str) -> list[MetadataGuardianResults]:
+    def validate_file(
+        self, path: str, memory_map: bool = False
+    ) -> list[MetadataGuardianResults]:
         """
         Validate a file content with the data rules defined.
 
         :param path: the file path
+        :param memory_map: memory-map the file and validate its chunks in parallel
         :return: the metadata guardian results
         """
         logger.debug(f"Validate the Data Rules in the path {path}")
-        results = self._data_rules.validate_file(path)
-        return [
-            MetadataGuardianResults(
-                category=result._category,
-                content=result._content,
-                data_rules=[
-                    DataRule(
-                        rule_name=data_rule.rule_name,
-                        regex_pattern=data_rule.pattern,
-                        documentation=data_rule.documentation,
-                    )
-                    for data_rule in result._data_rules
-                ],
-            )
-            for result in results
-        ]
+        if memory_map:
+            results = self._data_rules.validate_file_mmap(path)
+        else:
+            results = self._data_rules.validate_file(path)
+        return [_to_metadata_guardian_results(result) for result in results]
+
+    def validate_files(
+        self, paths: list[str], memory_map: bool = False
+    ) -> dict[str, list[MetadataGuardianResults]]:
+        """
+        Validate the content of multiple files in parallel with the data rules defined.
+
+        :param paths: the file paths
+        :param memory_map: memory-map the files and validate their chunks in parallel
+        :return: the metadata guardian results by file path
+        """
+        logger.debug(f"Validate the Data Rules in the paths {paths}")
+        files_results = self._data_rules.validate_files(paths, memory_map=memory_map)
+        return {
+            path: [_to_metadata_guardian_results(result) for result in results]
+            for path, results in files_results
+        }
+
+    def validate_directory(
+        self,
+        directory_path: str,
+        file_names_extension: str,
+        glob_pattern: str | None = None,
+        memory_map: bool = False,
+    ) -> dict[str, list[MetadataGuardianResults]]:
+        """
+        Validate the content of the files of a directory with the data rules defined.
+        The directory is walked and the files are validated in parallel.
+
+        :param directory_path: the directory path
+        :param file_names_extension: the file name extension to include (without the ".")
+        :param glob_pattern: the glob pattern the file paths relative to the directory must match
+        :param memory_map: memory-map the files and validate their chunks in parallel
+        :return: the metadata guardian results by file path
+        """
+        logger.debug(
+            f"Validate the Data Rules in the directory {directory_path} with extension {file_names_extension}"
+        )
+        files_results = self._data_rules.validate_directory(
+            directory_path,
+            file_names_extension,
+            glob_pattern=glob_pattern,
+            memory_map=memory_map,
+        )
+        return {
+            path: [_to_metadata_guardian_results(result) for result in results]
+            for path, results in files_results
+        }
@@ -0,0 +1,305 @@
+import sqlite3
+
+import pyarrow
+from loguru import logger
+from pyarrow import ipc
+from pydantic import TypeAdapter
+
+from .data_rules import MetadataGuardianResults
+from .report import ReportResults
+from .sqlite_store import SQLiteStore
+
+_RESULTS_ADAPTER = TypeAdapter(list[MetadataGuardianResults])
+
+
+def _record_batch_to_bytes(record_batch: pyarrow.RecordBatch) -> bytes:
+    """
+    Serialize a record batch with the Arrow IPC stream format.
+
+    :param record_batch: the record batch to serialize
+    :return: the serialized record batch
+    """
+    buffer = pyarrow.BufferOutputStream()
+    with ipc.new_stream(buffer, record_batch.schema) as writer:
+        writer.write_batch(record_batch)
+    return buffer.getvalue().to_pybytes()
+
+
+def _record_batch_from_bytes(content: bytes) -> pyarrow.RecordBatch:
+    """
+    Deserialize a record batch written with the Arrow IPC stream format.
+
+    :param content: the serialized record batch
+    :return: the record batch
+    """
+    return ipc.open_stream(content).read_next_batch()
+
+
+class ScanJournal(SQLiteStore):
+    """
+    Scan Journal instance recording the results of the scanned tables in a SQLite database.
+
+    The results of a table are recorded once they are written to the report, a restarted scan
+    skips the recorded tables and replays their results instead. The results are only reused
+    with the same scan fingerprint, made of the data rules fingerprint and the scan options.
+    The tables are keyed by the identity of their source, and the tables of a finished scan are
+    cleared once it completes without failed sources.
+    """
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        """
+        Create the table of the scanned tables if it does not exist.
+
+        :param connection: the SQLite connection
+        :return:
+        """
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scanned_tables (
+                source_identity TEXT NOT NULL,
+                database_name TEXT NOT NULL,
+                source TEXT NOT NULL,
+                scan_fingerprint TEXT NOT NULL,
+                results TEXT,
+                record_batch BLOB,
+                PRIMARY KEY (source_identity, source)
+            )
+            """
+        )
+
+    def get_report_results(
+        self, source_identity: str, sources: list[str], scan_fingerprint: str
+    ) -> dict[str, ReportResults]:
+        """
+        Get the recorded report results of the sources already scanned.
+
+        :param source_identity: the identity of the external source
+        :param sources: the sources, as database.table
+        :param scan_fingerprint: the fingerprint of the data rules and the scan options
+        :return: the recorded report results by source, without the sources not scanned yet
+        """
+        recorded_results = {}
+        for source in sources:
+            row = self.connection.execute(
+                "SELECT results, record_batch FROM scanned_tables"
+                " WHERE source_identity = ? AND source = ? AND scan_fingerprint = ?",
+                (source_identity, source, scan_fingerprint),
+            ).fetchone()
+            if row is None:
+                continue
+            results, record_batch = row
+            recorded_results[source] = ReportResults(
+                source=source,
+                results=_RESULTS_ADAPTER.validate_json(results) if results else [],
+                record_batch=_record_batch_from_bytes(record_batch)
+                if record_batch is not None
+                else None,
+            )
+        logger.debug(
+            f"Skip the {len(recorded_results)}/{len(sources)} sources already scanned"
+        )
+        return recorded_results
+
+    def add_report_results(
+        self,
+        source_identity: str,
+        database_name: str,
+        report_results: list[ReportResults],
+        scan_fingerprint: str,
+    ) -> None:
+        """
+        Record the report results of scanned sources.
+
+        :param source_identity: the identity of the external source
+        :param database_name: the database of the sources
+        :param report_results: the report results of the sources
+        :param scan_fingerprint: the fingerprint of the data rules and the scan options
+        :return:
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scanned_tables (source_identity, database_name,"
+                " source, scan_fingerprint, results, record_batch)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        source_identity,
+                        database_name,
+                        source_results.source,
+                        scan_fingerprint,
+                        _RESULTS_ADAPTER.dump_json(source_results.results).decode(),
+                        _record_batch_to_bytes(source_results.record_batch)
+                        if source_results.record_batch is not None
+                        else None,
+                    )
+                    for source_results in report_results
+                ],
+            )
+
+    def clear(
+        self,
+        source_identity: str,
+        database_name: str,
+        sources: list[str] | None = None,
+    ) -> None:
+        """
+        Remove the recorded results of a finished scan.
+
+        :param source_identity: the identity of the external source
+        :param database_name: the scanned database
+        :param sources: the scanned sources, all the sources of the database if None
+        :return:
+        """
+        with self.connection:
+            if sources is None:
+                self.connection.execute(
+                    "DELETE FROM scanned_tables"
+                    " WHERE source_identity = ? AND database_name = ?",
+                    (source_identity, database_name),
+                )
+            else:
+                self.connection.executemany(
+                    "DELETE FROM scanned_tables WHERE source_identity = ? AND source = ?",
+                    [(source_identity, source) for source in sources],
+                )
+
+
+class TablesStateStore(SQLiteStore):
+    """
+    Tables State Store instance keeping the fingerprint and the results of the scanned tables in
+    a SQLite database, for the incremental scans.
+
+    The fingerprint of a table is its version given by the source, or the hash of its column
+    names, the results of a table are only reused while its fingerprint and the scan
+    fingerprint, made of the data rules fingerprint and the scan options, do not change.
+    The tables are keyed by the identity of their source, and the tables dropped from a database
+    are pruned after a scan of the whole database.
+    """
+
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        """
+        Create the table of the tables state if it does not exist.
+
+        :param connection: the SQLite connection
+        :return:
+        """
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tables_state (
+                source_identity TEXT NOT NULL,
+                database_name TEXT NOT NULL,
+                source TEXT NOT NULL,
+                table_fingerprint TEXT NOT NULL,
+                scan_fingerprint TEXT NOT NULL,
+                results TEXT,
+                record_batch BLOB,
+                PRIMARY KEY (source_identity, source)
+            )
+            """
+        )
+
+    def get_report_results(
+        self,
+        source_identity: str,
+        tables_fingerprints: dict[str, str],
+        scan_fingerprint: str,
+    ) -> dict[str, ReportResults]:
+        """
+        Get the stored report results of the tables that did not change since they were stored.
+
+        :param source_identity: the identity of the external source
+        :param tables_fingerprints: the current fingerprint of each table, by source
+        :param scan_fingerprint: the fingerprint of the data rules and the scan options
+        :return: the stored report results by source, without the new or changed tables
+        """
+        stored_results = {}
+        for source, table_fingerprint in tables_fingerprints.items():
+            row = self.connection.execute(
+                "SELECT results, record_batch FROM tables_state"
+                " WHERE source_identity = ? AND source = ? AND table_fingerprint = ?"
+                " AND scan_fingerprint = ?",
+                (source_identity, source, table_fingerprint, scan_fingerprint),
+            ).fetchone()
+            if row is None:
+                continue
+            results, record_batch = row
+            stored_results[source] = ReportResults(
+                source=source,
+                results=_RESULTS_ADAPTER.validate_json(results) if results else [],
+                record_batch=_record_batch_from_bytes(record_batch)
+                if record_batch is not None
+                else None,
+            )
+        logger.debug(
+            f"Reuse the stored results of {len(stored_results)}/{len(tables_fingerprints)} unchanged tables"
+        )
+        return stored_results
+
+    def set_report_results(
+        self,
+        source_identity: str,
+        database_name: str,
+        report_results: list[ReportResults],
+        tables_fingerprints: dict[str, str],
+        scan_fingerprint: str,
+    ) -> None:
+        """
+        Store the report results of the scanned tables with their fingerprint.
+
+        :param source_identity: the identity of the external source
+        :param database_name: the database of the tables
+        :param report_results: the report results of the tables
+        :param tables_fingerprints: the fingerprint of each table, by source
+        :param scan_fingerprint: the fingerprint of the data rules and the scan options
+        :return:
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO tables_state (source_identity, database_name,"
+                " source, table_fingerprint, scan_fingerprint, results, record_batch)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        source_identity,
+                        database_name,
+                        table_results.source,
+                        tables_fingerprints[table_results.source],
+                        scan_fingerprint,
+                        _RESULTS_ADAPTER.dump_json(table_results.results).decode(),
+                        _record_batch_to_bytes(table_results.record_batch)
+                        if table_results.record_batch is not None
+                        else None,
+                    )
+                    for table_results in report_results
+                ],
+            )
+
+    def prune_tables(
+        self, source_identity: str, database_name: str, sources: set[str]
+    ) -> None:
+        """
+        Remove the stored results of the tables dropped from a database.
+
+        :param source_identity: the identity of the external source
+        :param database_name: the scanned database
+        :param sources: the sources of all the current tables of the database
+        :return:
+        """
+        dropped_sources = [
+            (source_identity, source)
+            for (source,) in self.connection.execute(
+                "SELECT source FROM tables_state"
+                " WHERE source_identity = ? AND database_name = ?",
+                (source_identity, database_name),
+            ).fetchall()
+            if source not in sources
+        ]
+        if dropped_sources:
+            logger.debug(
+                f"Prune the stored results of {len(dropped_sources)} dropped tables of {database_name}"
+            )
+            with self.connection:
+                self.connection.executemany(
+                    "DELETE FROM tables_state WHERE source_identity = ? AND source = ?",
+                    dropped_sources,
+                )
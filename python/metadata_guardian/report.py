@@ -1,6 +1,13 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TextIO
+
 import pyarrow
-from pyarrow import csv
-from pydantic import BaseModel, Field
+import pyarrow.compute
+from pyarrow import NativeFile, OSFile, csv, ipc, parquet
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from rich.console import Console
 from rich.markup import escape
 from rich.progress import (
@@ -45,7 +52,7 @@ class ProgressionBar(Progress):
         self,
         item_name: str,
         source_type: str,
-        total: int,
+        total: int | None,
         current_item: str = "Starting",
     ) -> None:
         """
@@ -54,7 +61,7 @@ class ProgressionBar(Progress):
         :param item_name: the name of the item to search
         :param current_item: the name of the current item
         :param source_type: the source type
-        :param total: total of the number of tables
+        :param total: total of the number of tables, None when it is unknown
         :return: the created Task
         """
         task_details = f"[{item_name}]" if item_name else ""
@@ -78,16 +85,542 @@ class ProgressionBar(Progress):
 
 
 class ReportResults(BaseModel):
-    """Metadata Guardian Results."""
+    """
+    Metadata Guardian Results.
+    The results are either a list of metadata guardian results or a columnar record batch.
+    """
 
     source: str
     results: list[MetadataGuardianResults] = Field(default_factory=list)
+    record_batch: pyarrow.RecordBatch | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+_REPORT_SCHEMA = pyarrow.schema(
+    {
+        "category": pyarrow.string(),
+        "source": pyarrow.string(),
+        "content": pyarrow.string(),
+        "name": pyarrow.string(),
+        "documentation": pyarrow.string(),
+    }
+)
+
+
+def _record_batch_to_table(
+    source: str, record_batch: pyarrow.RecordBatch
+) -> pyarrow.Table:
+    """
+    Convert a record batch of metadata guardian results to the report schema.
+
+    :param source: the source of the results
+    :param record_batch: the metadata guardian results as a record batch
+    :return: the report table
+    """
+    return pyarrow.Table.from_arrays(
+        [
+            record_batch.column("category").cast(pyarrow.string()),
+            pyarrow.repeat(source, record_batch.num_rows),
+            pyarrow.compute.utf8_trim_whitespace(record_batch.column("content")),
+            record_batch.column("rule_name").cast(pyarrow.string()),
+            record_batch.column("documentation").cast(pyarrow.string()),
+        ],
+        schema=_REPORT_SCHEMA,
+    )
+
+
+def _report_results_to_table(
+    report_results: Iterable[ReportResults],
+) -> pyarrow.Table:
+    """
+    Convert the report results to the report schema, one row by content and data rule.
+    The columnar results are converted without creating Python objects.
 
+    :param report_results: the report results
+    :return: the report table
+    """
+    tables = []
+    columns: dict[str, list[str]] = {name: [] for name in _REPORT_SCHEMA.names}
+    for report in report_results:
+        for result in report.results:
+            for data_rule in result.data_rules:
+                columns["category"].append(result.category)
+                columns["source"].append(report.source)
+                columns["content"].append(result.content.strip())
+                columns["name"].append(data_rule.rule_name)
+                columns["documentation"].append(data_rule.documentation)
+        if report.record_batch is not None:
+            tables.append(pyarrow.Table.from_pydict(columns, schema=_REPORT_SCHEMA))
+            columns = {name: [] for name in _REPORT_SCHEMA.names}
+            tables.append(
+                _record_batch_to_table(
+                    source=report.source, record_batch=report.record_batch
+                )
+            )
+    tables.append(pyarrow.Table.from_pydict(columns, schema=_REPORT_SCHEMA))
+    return pyarrow.concat_tables(tables)
+
+
+def _sync_file(file: NativeFile | TextIO) -> None:
+    """
+    Flush a file and synchronize it to the storage.
+
+    :param file: the opened file
+    :return:
+    """
+    file.flush()
+    os.fsync(file.fileno())
+
+
+class ReportSink(BaseModel, ABC):
+    """
+    Report Sink Interface.
+    The scanners write the report results of each table or file to the sink as soon as they are
+    ready, the sink is closed when leaving its context.
+    """
+
+    def __enter__(self) -> "ReportSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        self.close()
+
+    @abstractmethod
+    def write(self, report_results: ReportResults) -> None:
+        """
+        Write the report results of a source.
+
+        :param report_results: the report results to write
+        :return:
+        """
+        pass
+
+    def flush(self) -> None:
+        """
+        Flush the results written so far to the file, the buffered results can stay in memory.
+
+        :return:
+        """
+        pass
+
+    def sync(self) -> None:
+        """
+        Write all the results written so far and synchronize them to the storage, they are not
+        lost if the process stops.
+
+        :return:
+        """
+        self.flush()
+
+    def close(self) -> None:
+        """
+        Close the sink, flushing the results not written yet.
+
+        :return:
+        """
+        pass
+
+
+class CsvReportSink(ReportSink):
+    """CSV Report Sink writing the results to a CSV file incrementally."""
+
+    path: str
+    _file: NativeFile | None = PrivateAttr(default=None)
+    _writer: csv.CSVWriter | None = PrivateAttr(default=None)
+
+    @property
+    def writer(self) -> csv.CSVWriter:
+        """
+        Get the CSV writer, the file is created with its header if needed.
+
+        :return: the CSV writer
+        """
+        if self._writer is None:
+            self._file = OSFile(self.path, "wb")
+            self._writer = csv.CSVWriter(self._file, _REPORT_SCHEMA)
+        return self._writer
+
+    def write(self, report_results: ReportResults) -> None:
+        """
+        Write the report results of a source to the CSV file.
 
-class MetadataGuardianReport(BaseModel):
-    """Metadata Guardian Report."""
+        :param report_results: the report results to write
+        :return:
+        """
+        table = _report_results_to_table([report_results])
+        if table.num_rows:
+            self.writer.write_table(table)
+
+    def flush(self) -> None:
+        """
+        Flush the CSV file.
+
+        :return:
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def sync(self) -> None:
+        """
+        Synchronize the CSV file to the storage.
+
+        :return:
+        """
+        if self._file is not None:
+            _sync_file(self._file)
+
+    def close(self) -> None:
+        """
+        Close the CSV file.
+
+        :return:
+        """
+        self.writer.close()
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonLinesReportSink(ReportSink):
+    """
+    JSON Lines Report Sink writing one JSON object by result to a file incrementally.
+    With append, the results are added to the existing file, to resume an interrupted scan.
+    """
+
+    path: str
+    append: bool = False
+    _file: TextIO | None = PrivateAttr(default=None)
+
+    @property
+    def file(self) -> TextIO:
+        """
+        Get the JSON Lines file, it is created if needed.
+
+        :return: the opened file
+        """
+        if self._file is None:
+            self._file = open(self.path, "a" if self.append else "w", encoding="utf-8")
+        return self._file
+
+    def write(self, report_results: ReportResults) -> None:
+        """
+        Write the report results of a source to the JSON Lines file.
+
+        :param report_results: the report results to write
+        :return:
+        """
+        for row in _report_results_to_table([report_results]).to_pylist():
+            self.file.write(json.dumps(row, ensure_ascii=False))
+            self.file.write("\n")
+
+    def flush(self) -> None:
+        """
+        Flush the JSON Lines file.
+
+        :return:
+        """
+        self.file.flush()
+
+    def sync(self) -> None:
+        """
+        Synchronize the JSON Lines file to the storage.
+
+        :return:
+        """
+        _sync_file(self.file)
+
+    def close(self) -> None:
+        """
+        Close the JSON Lines file.
+
+        :return:
+        """
+        self.file.close()
+
+
+_DICTIONARY_COLUMNS = ("category", "source", "name", "documentation")
+_DICTIONARY_REPORT_SCHEMA = pyarrow.schema(
+    {
+        name: pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        if name in _DICTIONARY_COLUMNS
+        else pyarrow.string()
+        for name in _REPORT_SCHEMA.names
+    }
+)
+_DEFAULT_ROW_GROUP_SIZE = 128 * 1024
+
+
+class _BufferedReportSink(ReportSink, ABC):
+    """
+    Buffered Report Sink Interface.
+    The results are buffered until row group size rows are gathered, they are written by row
+    groups of row group size rows, the remaining rows are written when the sink is synchronized
+    or closed.
+    """
+
+    path: str
+    row_group_size: int = _DEFAULT_ROW_GROUP_SIZE
+    compression: str | None = "zstd"
+    _file: NativeFile | None = PrivateAttr(default=None)
+    _tables: list[pyarrow.Table] = PrivateAttr(default_factory=list)
+    _rows_count: int = PrivateAttr(default=0)
+
+    @property
+    def file(self) -> NativeFile:
+        """
+        Get the output file, it is created if needed.
+
+        :return: the opened file
+        """
+        if self._file is None:
+            self._file = OSFile(self.path, "wb")
+        return self._file
+
+    @abstractmethod
+    def write_row_group(self, table: pyarrow.Table) -> None:
+        """
+        Write a row group of the results.
+
+        :param table: the results of the row group, with the report schema
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def close_writer(self) -> None:
+        """
+        Close the writer, creating the file if no results were written.
+
+        :return:
+        """
+        pass
+
+    def _write_row_groups(self, force: bool = False) -> None:
+        """
+        Write the buffered results by row groups.
+
+        :param force: write the last row group even if it is smaller than the row group size
+        :return:
+        """
+        if not self._tables:
+            return
+        table = pyarrow.concat_tables(self._tables)
+        row_groups_count = table.num_rows // self.row_group_size
+        for row_group in range(row_groups_count):
+            self.write_row_group(
+                table.slice(row_group * self.row_group_size, self.row_group_size)
+            )
+        remaining_table = table.slice(row_groups_count * self.row_group_size)
+        self._tables = []
+        self._rows_count = 0
+        if remaining_table.num_rows and force:
+            self.write_row_group(remaining_table)
+        elif remaining_table.num_rows:
+            self._tables.append(remaining_table)
+            self._rows_count = remaining_table.num_rows
+
+    def write(self, report_results: ReportResults) -> None:
+        """
+        Write the report results of a source to the file.
+
+        :param report_results: the report results to write
+        :return:
+        """
+        table = _report_results_to_table([report_results])
+        if table.num_rows:
+            self._tables.append(table)
+            self._rows_count += table.num_rows
+            if self._rows_count >= self.row_group_size:
+                self._write_row_groups()
+
+    def flush(self) -> None:
+        """
+        Flush the row groups written so far, the results of an incomplete row group stay
+        buffered.
+
+        :return:
+        """
+        if self._file is not None:
+            self._file.flush()
+
+    def sync(self) -> None:
+        """
+        Write the buffered results, the last row group can be smaller than the row group size,
+        and synchronize the file to the storage.
+
+        :return:
+        """
+        self._write_row_groups(force=True)
+        if self._file is not None:
+            _sync_file(self._file)
+
+    def close(self) -> None:
+        """
+        Write the remaining results and close the file.
+
+        :return:
+        """
+        self._write_row_groups(force=True)
+        self.close_writer()
+        self.file.close()
+
+
+class ParquetReportSink(_BufferedReportSink):
+    """
+    Parquet Report Sink writing the results to a Parquet file incrementally.
+    The category, source, name and documentation columns are dictionary encoded by row group.
+    """
+
+    _writer: parquet.ParquetWriter | None = PrivateAttr(default=None)
+
+    @property
+    def writer(self) -> parquet.ParquetWriter:
+        """
+        Get the Parquet writer, the file is created if needed.
+
+        :return: the Parquet writer
+        """
+        if self._writer is None:
+            self._writer = parquet.ParquetWriter(
+                self.file,
+                _DICTIONARY_REPORT_SCHEMA,
+                compression=self.compression or "none",
+            )
+        return self._writer
+
+    def write_row_group(self, table: pyarrow.Table) -> None:
+        """
+        Write a row group of the results to the Parquet file.
+
+        :param table: the results of the row group, with the report schema
+        :return:
+        """
+        table = table.combine_chunks()
+        self.writer.write_table(
+            pyarrow.Table.from_arrays(
+                [
+                    table.column(name).dictionary_encode()
+                    if name in _DICTIONARY_COLUMNS
+                    else table.column(name)
+                    for name in _REPORT_SCHEMA.names
+                ],
+                schema=_DICTIONARY_REPORT_SCHEMA,
+            ),
+            row_group_size=self.row_group_size,
+        )
+
+    def close_writer(self) -> None:
+        """
+        Close the Parquet file, writing its footer.
+
+        :return:
+        """
+        self.writer.close()
+
+
+class ArrowIpcReportSink(_BufferedReportSink):
+    """
+    Arrow IPC Report Sink writing the results to an Arrow IPC file incrementally.
+    The category, source, name and documentation columns are dictionary encoded with one
+    dictionary by column for the whole file, the new values of each record batch are written as
+    dictionary deltas. The row group size is the number of rows of the record batches.
+    """
+
+    _writer: ipc.RecordBatchFileWriter | None = PrivateAttr(default=None)
+    _dictionaries: dict[str, pyarrow.Array] = PrivateAttr(
+        default_factory=lambda: {
+            name: pyarrow.array([], type=pyarrow.string())
+            for name in _DICTIONARY_COLUMNS
+        }
+    )
+
+    @property
+    def writer(self) -> ipc.RecordBatchFileWriter:
+        """
+        Get the Arrow IPC writer, the file is created if needed.
+
+        :return: the Arrow IPC writer
+        """
+        if self._writer is None:
+            self._writer = ipc.new_file(
+                self.file,
+                _DICTIONARY_REPORT_SCHEMA,
+                options=ipc.IpcWriteOptions(
+                    compression=self.compression, emit_dictionary_deltas=True
+                ),
+            )
+        return self._writer
+
+    def _dictionary_encode(self, name: str, values: pyarrow.Array) -> pyarrow.Array:
+        """
+        Encode the values with the dictionary of the column, extended with the new values.
+
+        :param name: the name of the column
+        :param values: the values to encode
+        :return: the dictionary array
+        """
+        unique_values = pyarrow.compute.unique(values)
+        new_values = unique_values.filter(
+            pyarrow.compute.invert(
+                pyarrow.compute.is_in(unique_values, value_set=self._dictionaries[name])
+            )
+        )
+        dictionary = pyarrow.concat_arrays([self._dictionaries[name], new_values])
+        self._dictionaries[name] = dictionary
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.compute.index_in(values, value_set=dictionary).cast(
+                pyarrow.int32()
+            ),
+            dictionary,
+        )
+
+    def write_row_group(self, table: pyarrow.Table) -> None:
+        """
+        Write a record batch of the results to the Arrow IPC file.
+
+        :param table: the results of the record batch, with the report schema
+        :return:
+        """
+        table = table.combine_chunks()
+        self.writer.write_batch(
+            pyarrow.RecordBatch.from_arrays(
+                [
+                    self._dictionary_encode(name, table.column(name).chunk(0))
+                    if name in _DICTIONARY_COLUMNS
+                    else table.column(name).chunk(0)
+                    for name in _REPORT_SCHEMA.names
+                ],
+                schema=_DICTIONARY_REPORT_SCHEMA,
+            )
+        )
+
+    def close_writer(self) -> None:
+        """
+        Close the Arrow IPC file, writing its footer.
+
+        :return:
+        """
+        self.writer.close()
+
+
+class MetadataGuardianReport(ReportSink):
+    """
+    Metadata Guardian Report.
+    It is the in-memory report sink, keeping the report results of every source.
+    The sources that could not be scanned are kept with their error in the failed sources.
+    """
 
     report_results: list[ReportResults] = Field(default_factory=list)
+    failed_sources: dict[str, str] = Field(default_factory=dict)
+
+    def write(self, report_results: ReportResults) -> None:
+        """
+        Keep the report results of a source in the report.
+
+        :param report_results: the report results to keep
+        :return:
+        """
+        self.report_results.append(report_results)
 
     def append(self, other_report: "MetadataGuardianReport") -> None:
         """
@@ -96,7 +629,17 @@ class MetadataGuardianReport(BaseModel):
         :param other_report: other report to append
         :return:
         """
-        self.report_results = self.report_results + other_report.report_results
+        self.report_results.extend(other_report.report_results)
+        self.failed_sources.update(other_report.failed_sources)
+
+    def to_arrow(self) -> pyarrow.Table:
+        """
+        Get the metadata guardian results as an Arrow table, one row by content and data rule.
+        The columnar results are converted without creating Python objects.
+
+        :return: the Arrow table of the results
+        """
+        return _report_results_to_table(self.report_results)
 
     def to_console(self) -> None:
         """
@@ -116,16 +659,14 @@ class MetadataGuardianReport(BaseModel):
         _table.add_column("Content", style="cyan", no_wrap=True)
         _table.add_column("Name", style="magenta", no_wrap=True)
         _table.add_column("Documentation")
-        for report in self.report_results:
-            for result in report.results:
-                for data_rule in result.data_rules:
-                    _table.add_row(
-                        result.category,
-                        report.source,
-                        result.content.strip(),
-                        data_rule.rule_name,
-                        data_rule.documentation,
-                    )
+        for row in self.to_arrow().to_pylist():
+            _table.add_row(
+                row["category"],
+                row["source"],
+                row["content"],
+                row["name"],
+                row["documentation"],
+            )
         if _table.rows:
             _console.print(
                 f":exclamation: Metadata Guardian detected {len(_table.rows)} data rules violations."
@@ -136,6 +677,48 @@ class MetadataGuardianReport(BaseModel):
                 ":thumbs_up: No data rules violation were detected by Metadata Guardian."
             )
 
+    def to_parquet(
+        self,
+        file_path: str,
+        row_group_size: int = _DEFAULT_ROW_GROUP_SIZE,
+        compression: str | None = "zstd",
+    ) -> None:
+        """
+        Save the metadata guardian results to a Parquet file.
+        The category, source, name and documentation columns are dictionary encoded.
+
+        :param file_path: the path of the Parquet file
+        :param row_group_size: the number of rows of the row groups
+        :param compression: the compression codec, None to disable the compression
+        :return:
+        """
+        with ParquetReportSink(
+            path=file_path, row_group_size=row_group_size, compression=compression
+        ) as sink:
+            for report_results in self.report_results:
+                sink.write(report_results)
+
+    def to_arrow_ipc(
+        self,
+        file_path: str,
+        row_group_size: int = _DEFAULT_ROW_GROUP_SIZE,
+        compression: str | None = "zstd",
+    ) -> None:
+        """
+        Save the metadata guardian results to an Arrow IPC file.
+        The category, source, name and documentation columns are dictionary encoded.
+
+        :param file_path: the path of the Arrow IPC file
+        :param row_group_size: the number of rows of the record batches
+        :param compression: the compression codec (lz4 or zstd), None to disable the compression
+        :return:
+        """
+        with ArrowIpcReportSink(
+            path=file_path, row_group_size=row_group_size, compression=compression
+        ) as sink:
+            for report_results in self.report_results:
+                sink.write(report_results)
+
     def to_csv(self, file_path: str) -> None:
         """
         Save the metadata guardian results to a CSV file.
@@ -143,31 +726,4 @@ class MetadataGuardianReport(BaseModel):
         :param: file path is the path of the CSV file.
         :return:
         """
-        _schema = pyarrow.schema(
-            {
-                "category": pyarrow.string(),
-                "source": pyarrow.string(),
-                "content": pyarrow.string(),
-                "name": pyarrow.string(),
-                "documentation": pyarrow.string(),
-            }
-        )
-        category = []
-        source = []
-        content = []
-        name = []
-        documentation = []
-
-        for report in self.report_results:
-            for result in report.results:
-                for data_rule in result.data_rules:
-                    category.append(result.category)
-                    source.append(report.source)
-                    content.append(result.content.strip())
-                    name.append(data_rule.rule_name)
-                    documentation.append(data_rule.documentation)
-        _table = pyarrow.Table.from_pydict(
-            dict(zip(_schema.names, (category, source, content, name, documentation))),
-            schema=_schema,
-        )
-        csv.write_csv(_table, file_path)
+        csv.write_csv(self.to_arrow(), file_path)
@@ -1,14 +1,102 @@
 import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
 import os
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import TypeVar
 
 from loguru import logger
 from pyarrow import cpu_count
 from pydantic import BaseModel
 
-from .data_rules import DataRules
-from .report import MetadataGuardianReport, ProgressionBar, ReportResults
-from .source import ExternalMetadataSource, LocalMetadataSource
+from .cache import ContentFilesCache, WordsMatchesCache
+from .data_rules import DataRules, MetadataGuardianResults
+from .journal import ScanJournal, TablesStateStore
+from .metadata_guardian import find_files
+from .report import MetadataGuardianReport, ProgressionBar, ReportResults, ReportSink
+from .source import (
+    ColumnMetadata,
+    ColumnRecord,
+    ExternalMetadataSource,
+    LocalMetadataSource,
+)
+
+T = TypeVar("T")
+
+
+def _read_checkpoint(checkpoint_path: str) -> set[str]:
+    """
+    Read the names of the databases already scanned from the checkpoint file.
+
+    :param checkpoint_path: the path of the checkpoint file
+    :return: the names of the scanned databases, empty if the file does not exist
+    """
+    if not os.path.exists(checkpoint_path):
+        return set()
+    with open(checkpoint_path, encoding="utf-8") as checkpoint_file:
+        return {line.rstrip("\n") for line in checkpoint_file if line.strip()}
+
+
+def _write_checkpoint(checkpoint_path: str, database_name: str) -> None:
+    """
+    Append the name of a scanned database to the checkpoint file.
+
+    :param checkpoint_path: the path of the checkpoint file
+    :param database_name: the name of the scanned database
+    :return:
+    """
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.write(f"{database_name}\n")
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+
+
+def _columns_words(
+    columns_metadata: Iterable[ColumnMetadata | ColumnRecord],
+) -> list[str]:
+    """
+    Get the lowercased words of the columns, their names followed by their comments as with
+    as_list, without a generator by column.
+
+    :param columns_metadata: the columns metadata
+    :return: the words of the columns
+    """
+    words = []
+    for column_metadata in columns_metadata:
+        words.append(column_metadata.column_name.lower())
+        if column_metadata.column_comment:
+            words.append(column_metadata.column_comment.lower())
+    return words
+
+
+def _words_fingerprint(words: list[str]) -> str:
+    """
+    Fingerprint the words of a table, for the sources without table versions.
+
+    :param words: the words of the table
+    :return: the hexadecimal hash of the words
+    """
+    words_hash = hashlib.blake2b()
+    for word in words:
+        words_hash.update(word.encode())
+        words_hash.update(b"\0")
+    return words_hash.hexdigest()
+
+
+def _batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of size elements, the last list can be smaller.
+
+    :param iterable: the iterable to split
+    :param size: the size of the lists
+    :return: the lists of elements
+    """
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
 
 
 class Scanner(BaseModel, ABC):
@@ -59,7 +147,7 @@ class Scanner(BaseModel, ABC):
 
         :param source: the ExternalMetadataSource to scan
         :param database_name: the name of the database
-        :param tasks_limit: the limit of the tasks to run in parallel
+        :param tasks_limit: the limit of the tasks to run in parallel, at most the pool size
         :param table_name: the name of the table
         :param include_comment: the scan include the comment section
         :return: a Metadata Guardian report
@@ -68,10 +156,124 @@ class Scanner(BaseModel, ABC):
 
 
 class ColumnScanner(Scanner):
-    """Column Scanner instance."""
+    """
+    Column Scanner instance.
+    With the Arrow results, the results of each source are kept as an Arrow record batch.
+    When a words cache is defined, the words already validated by a previous table or a previous
+    scan are not validated again.
+    With a batch size, the words of the tables of a database are validated by batches of tables
+    in one call instead of one call by table.
+    With a sink, the results of each table are written to the sink as soon as they are ready
+    instead of being kept in the returned report.
+    With a state store, the external scans are incremental, only the new or changed tables are
+    validated again.
+    With a journal, the asynchronous scans record the results of each table, and a restarted
+    scan skips the tables already recorded, the tables of a scan are cleared from the journal
+    once it completes without failed sources, or once their database is checkpointed. The tables failing in an asynchronous scan are
+    retried up to retries times with an exponential backoff starting at retry backoff seconds,
+    then they are added to the failed sources of the report instead of failing the scan.
+    """
 
     data_rules: DataRules
     progression_bar_disabled: bool = True
+    arrow_results: bool = False
+    words_cache: WordsMatchesCache | None = None
+    batch_size: int | None = None
+    sink: ReportSink | None = None
+    journal: ScanJournal | None = None
+    state_store: TablesStateStore | None = None
+    retries: int = 2
+    retry_backoff: float = 0.5
+
+    def _report_results(self, source: str, words: list[str]) -> ReportResults:
+        """
+        Validate the words of a source, the results stay columnar with the Arrow results.
+        The matches of the words are reused from the words cache when it is defined.
+
+        :param source: the source of the words
+        :param words: the words to validate
+        :return: the report results of the source
+        """
+        if self.words_cache is not None:
+            if self.arrow_results:
+                return ReportResults(
+                    source=source,
+                    record_batch=self.words_cache.validate_words_arrow(
+                        data_rules=self.data_rules, words=words
+                    ),
+                )
+            return ReportResults(
+                source=source,
+                results=self.words_cache.validate_words(
+                    data_rules=self.data_rules, words=words
+                ),
+            )
+        if self.arrow_results:
+            return ReportResults(
+                source=source,
+                record_batch=self.data_rules.validate_words_arrow(words=words),
+            )
+        return ReportResults(
+            source=source, results=self.data_rules.validate_words(words=words)
+        )
+
+    def _report_results_batch(
+        self, sources: list[str], words_batch: list[list[str]]
+    ) -> list[ReportResults]:
+        """
+        Validate the words of multiple sources, by batches of batch size sources in one call.
+        The results are split back by source.
+
+        :param sources: the sources of the words
+        :param words_batch: the words to validate of each source
+        :return: the report results of each source
+        """
+        if self.batch_size is None:
+            return [
+                self._report_results(source=source, words=words)
+                for source, words in zip(sources, words_batch)
+            ]
+        report_results = []
+        for start in range(0, len(sources), self.batch_size):
+            batch_sources = sources[start : start + self.batch_size]
+            batch_words = words_batch[start : start + self.batch_size]
+            if self.words_cache is not None:
+                words_matches = iter(
+                    self.words_cache.match_words(
+                        data_rules=self.data_rules,
+                        words=[word for words in batch_words for word in words],
+                    )
+                )
+                words_matches_batch = [
+                    list(itertools.islice(words_matches, len(words)))
+                    for words in batch_words
+                ]
+            else:
+                words_matches_batch = self.data_rules.match_words_batch(
+                    words_batch=batch_words
+                )
+            for source, words, matches in zip(
+                batch_sources, batch_words, words_matches_batch
+            ):
+                if self.arrow_results:
+                    report_results.append(
+                        ReportResults(
+                            source=source,
+                            record_batch=self.data_rules.record_batch_from_matches(
+                                words=words, words_matches=matches
+                            ),
+                        )
+                    )
+                else:
+                    report_results.append(
+                        ReportResults(
+                            source=source,
+                            results=self.data_rules.results_from_matches(
+                                words=words, words_matches=matches
+                            ),
+                        )
+                    )
+        return report_results
 
     def scan_local(self, source: LocalMetadataSource) -> MetadataGuardianReport:
         """
@@ -89,18 +291,10 @@ class ColumnScanner(Scanner):
                 source_type=source.type(),
                 total=1,
             )
-            words = [
-                word
-                for column_metadata in source.get_column_names()
-                for word in column_metadata.as_list()
-            ]
-            report = MetadataGuardianReport(
-                report_results=[
-                    ReportResults(
-                        source=source.local_path,
-                        results=self.data_rules.validate_words(words=words),
-                    )
-                ]
+            words = _columns_words(source.get_column_names())
+            report = MetadataGuardianReport()
+            (self.sink or report).write(
+                self._report_results(source=source.local_path, words=words)
             )
             progression_bar.update_item(current_item=source.local_path)
         return report
@@ -114,6 +308,10 @@ class ColumnScanner(Scanner):
     ) -> MetadataGuardianReport:
         """
         Scan the column names from the external source using a table name or a database name.
+        With a state store, the scan is incremental: the tables with the same version, or the same
+        column names when the source has no versions, are not validated again and their stored
+        results are merged back in the report. The scan of a whole database prunes the stored
+        results of its dropped tables.
 
         :param source: the ExternalMetadataSource to scan
         :param database_name: the name of the database
@@ -124,64 +322,120 @@ class ColumnScanner(Scanner):
         logger.debug(
             f"[blue]Launch the metadata scanning of the external provider {source.type()} for {database_name}"
         )
+        report = MetadataGuardianReport()
+        sink = self.sink or report
+        scan_fingerprint = f"{self.data_rules.fingerprint()}:{include_comment}"
+        tables_fingerprints: dict[str, str] = {}
+        stored_results: dict[str, ReportResults] = {}
+        scanned_table_sources: set[str] = set()
+        whole_database = not table_name
         with ProgressionBar(disable=self.progression_bar_disabled) as progression_bar:
-            if table_name:
+            tables_columns_metadata: Iterable[
+                tuple[str, Iterable[ColumnMetadata | ColumnRecord] | None]
+            ]
+            if not table_name and source.supports_database_column_names():
                 progression_bar.add_task_with_item(
-                    item_name=database_name,
-                    source_type=source.type(),
-                    total=1,
-                    current_item=table_name,
+                    item_name=database_name, source_type=source.type(), total=None
                 )
-                words = [
-                    word
-                    for column_metadata in source.get_column_names(
-                        database_name=database_name,
-                        table_name=table_name,
-                        include_comment=include_comment,
-                    )
-                    for word in column_metadata.as_list()
-                ]
-                report = MetadataGuardianReport(
-                    report_results=[
-                        ReportResults(
-                            source=f"{database_name}.{table_name}",
-                            results=self.data_rules.validate_words(words=words),
-                        )
-                    ]
+                tables_columns_metadata = source.get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
                 )
-                progression_bar.update_item(current_item=table_name)
             else:
-                report = MetadataGuardianReport()
-                table_names_list = list(
-                    source.get_table_names_list(database_name=database_name)
+                table_names_list = (
+                    [table_name]
+                    if table_name
+                    else list(source.get_table_names_list(database_name=database_name))
                 )
+                if self.state_store is not None:
+                    source_fingerprints = source.get_table_fingerprints(
+                        database_name=database_name, table_names=table_names_list
+                    )
+                    tables_fingerprints = {
+                        f"{database_name}.{table_name}": source_fingerprints[table_name]
+                        for table_name in table_names_list
+                        if table_name in source_fingerprints
+                    }
+                    stored_results = self.state_store.get_report_results(
+                        source_identity=source.identity(),
+                        tables_fingerprints=tables_fingerprints,
+                        scan_fingerprint=scan_fingerprint,
+                    )
                 progression_bar.add_task_with_item(
                     item_name=database_name,
                     source_type=source.type(),
                     total=len(table_names_list),
                 )
-
-                for table_name in table_names_list:
-                    words = [
-                        word
-                        for column_metadata in source.get_column_names(
+                tables_columns_metadata = (
+                    (
+                        table_name,
+                        None
+                        if f"{database_name}.{table_name}" in stored_results
+                        else source.get_column_names(
                             database_name=database_name,
                             table_name=table_name,
                             include_comment=include_comment,
-                        )
-                        for word in column_metadata.as_list()
-                    ]
-                    report.append(
-                        MetadataGuardianReport(
-                            report_results=[
-                                ReportResults(
-                                    source=f"{database_name}.{table_name}",
-                                    results=self.data_rules.validate_words(words=words),
-                                )
-                            ]
-                        )
+                        ),
                     )
+                    for table_name in table_names_list
+                )
+            for tables_batch in _batched(tables_columns_metadata, self.batch_size or 1):
+                sources = []
+                fetched_words = {}
+                for table_name, columns_metadata in tables_batch:
+                    source_name = f"{database_name}.{table_name}"
+                    sources.append(source_name)
+                    if columns_metadata is not None:
+                        fetched_words[source_name] = _columns_words(columns_metadata)
                     progression_bar.update_item(current_item=table_name)
+                if self.state_store is not None:
+                    unversioned_fingerprints = {
+                        source_name: _words_fingerprint(words)
+                        for source_name, words in fetched_words.items()
+                        if source_name not in tables_fingerprints
+                    }
+                    tables_fingerprints.update(unversioned_fingerprints)
+                    stored_results.update(
+                        self.state_store.get_report_results(
+                            source_identity=source.identity(),
+                            tables_fingerprints=unversioned_fingerprints,
+                            scan_fingerprint=scan_fingerprint,
+                        )
+                    )
+                scanned_sources = [
+                    source_name
+                    for source_name in fetched_words
+                    if source_name not in stored_results
+                ]
+                scanned_results = self._report_results_batch(
+                    sources=scanned_sources,
+                    words_batch=[
+                        fetched_words[source_name] for source_name in scanned_sources
+                    ],
+                )
+                results_by_source = {
+                    report_results.source: report_results
+                    for report_results in scanned_results
+                }
+                for source_name in sources:
+                    if source_name in stored_results:
+                        sink.write(stored_results[source_name])
+                    else:
+                        sink.write(results_by_source[source_name])
+                scanned_table_sources.update(sources)
+                if self.state_store is not None and scanned_results:
+                    self.state_store.set_report_results(
+                        source_identity=source.identity(),
+                        database_name=database_name,
+                        report_results=scanned_results,
+                        tables_fingerprints=tables_fingerprints,
+                        scan_fingerprint=scan_fingerprint,
+                    )
+            if self.state_store is not None and whole_database:
+                self.state_store.prune_tables(
+                    source_identity=source.identity(),
+                    database_name=database_name,
+                    sources=scanned_table_sources,
+                )
         return report
 
     async def scan_external_async(
@@ -195,81 +449,490 @@ class ColumnScanner(Scanner):
         """
         Scan the column names from the external source using a table name or a database name.
         Note that it can generate multiple concurrent calls to your metadata source.
+        The column names are fetched with the asyncio methods of the source: with a native asyncio
+        client, hundreds of tasks can be in flight, otherwise the blocking calls run in the
+        default executor. The asyncio connection of the source is closed at the end of the scan.
+        With a connection pool, the tasks limit is capped to the pool size.
+        The tables are fetched by tasks limit workers, the fetched tables are validated and
+        written by chunks of batch size tables, or tasks limit tables without batch size, while
+        the workers fetch the next ones.
 
         :param source: the ExternalMetadataSource to scan
         :param database_name: the name of the database
-        :param tasks_limit: the limit of the tasks to run in parallel
+        :param tasks_limit: the limit of the tasks to run in parallel, at most the pool size
         :param table_name: the name of the table
         :param include_comment: the scan include the comment section
         :return: a Metadata Guardian report
         """
-        semaphore = asyncio.Semaphore(tasks_limit)
+        if source.pool_size is not None:
+            tasks_limit = min(tasks_limit, source.pool_size)
         logger.debug(
             f"[blue]Launch asynchronously the metadata scanning of the external provider {source.type()} for the database {database_name}"
         )
+        report = MetadataGuardianReport()
+        await source.acreate_connection()
+        try:
+            with ProgressionBar(
+                disable=self.progression_bar_disabled
+            ) as progression_bar:
+                await self._scan_database_async(
+                    source=source,
+                    database_name=database_name,
+                    semaphore=asyncio.Semaphore(tasks_limit),
+                    workers_count=tasks_limit,
+                    chunk_size=self.batch_size or tasks_limit,
+                    sink=self.sink or report,
+                    report=report,
+                    progression_bar=progression_bar,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+        finally:
+            await source.aclose_connection()
+        if report.failed_sources:
+            logger.warning(
+                f"{len(report.failed_sources)} sources could not be scanned: {list(report.failed_sources)}"
+            )
+        elif self.journal is not None:
+            self.journal.clear(
+                source_identity=source.identity(),
+                database_name=database_name,
+                sources=[f"{database_name}.{table_name}"] if table_name else None,
+            )
+        return report
 
-        async def async_validate_words(
-            progression_bar: ProgressionBar, table_name: str
-        ) -> ReportResults:
-            async with semaphore:
-                loop = asyncio.get_event_loop()
-                columns_metadata = await loop.run_in_executor(
-                    None,
-                    source.get_column_names,
-                    database_name,
-                    table_name,
-                    include_comment,
+    async def sweep_external_async(
+        self,
+        source: ExternalMetadataSource,
+        database_names: list[str] | None = None,
+        tasks_limit: int = cpu_count(),
+        databases_limit: int = 4,
+        include_comment: bool = False,
+        checkpoint_path: str | None = None,
+    ) -> MetadataGuardianReport:
+        """
+        Scan all the databases of the external source concurrently into one report.
+        The requests of all the databases share the budget of tasks limit tasks, and up to
+        databases limit databases are scanned at the same time.
+        With a checkpoint path, the databases already scanned by an interrupted sweep are skipped.
+        The results of a database are kept until all its tables are scanned, then written to the
+        sink and synchronized to the storage before the database is appended to the checkpoint
+        file, an interrupted database leaves no result in the sink. A database failing is logged, not written and not
+        checkpointed, it is retried by the next sweep.
+
+        :param source: the ExternalMetadataSource to scan
+        :param database_names: the names of the databases, all the databases of the source if None
+        :param tasks_limit: the limit of the tasks to run in parallel, at most the pool size
+        :param databases_limit: the limit of the databases to scan in parallel
+        :param include_comment: the scan include the comment section
+        :param checkpoint_path: the path of the checkpoint file listing the scanned databases
+        :return: a Metadata Guardian report
+        """
+        if source.pool_size is not None:
+            tasks_limit = min(tasks_limit, source.pool_size)
+        if database_names is None:
+            database_names = await asyncio.get_running_loop().run_in_executor(
+                None, lambda: list(source.get_database_names_list())
+            )
+        scanned_database_names = (
+            _read_checkpoint(checkpoint_path) if checkpoint_path else set()
+        )
+        pending_database_names = [
+            database_name
+            for database_name in database_names
+            if database_name not in scanned_database_names
+        ]
+        logger.debug(
+            f"[blue]Launch asynchronously the sweep of {len(pending_database_names)}/{len(database_names)} databases of the external provider {source.type()}"
+        )
+        report = MetadataGuardianReport()
+        sink = self.sink or report
+        semaphore = asyncio.Semaphore(tasks_limit)
+        databases_semaphore = asyncio.Semaphore(databases_limit)
+
+        async def sweep_database(
+            progression_bar: ProgressionBar, database_name: str
+        ) -> None:
+            async with databases_semaphore:
+                database_report = MetadataGuardianReport() if checkpoint_path else None
+                try:
+                    scanned_all_tables = await self._scan_database_async(
+                        source=source,
+                        database_name=database_name,
+                        semaphore=semaphore,
+                        workers_count=tasks_limit,
+                        chunk_size=self.batch_size or tasks_limit,
+                        sink=sink if database_report is None else database_report,
+                        report=report,
+                        progression_bar=ProgressionBar(disable=True),
+                        include_comment=include_comment,
+                    )
+                except Exception as exception:
+                    logger.exception(
+                        f"Error in sweeping the database {database_name} of {source.type()}"
+                    )
+                    report.failed_sources[database_name] = repr(exception)
+                    return
+                progression_bar.update_item(current_item=database_name)
+                if not scanned_all_tables:
+                    if database_report is not None:
+                        logger.warning(
+                            f"The results of the database {database_name} are not written, it is retried by the next sweep"
+                        )
+                    return
+                if database_report is not None:
+                    for report_results in database_report.report_results:
+                        sink.write(report_results)
+                if checkpoint_path:
+                    sink.sync()
+                    _write_checkpoint(checkpoint_path, database_name)
+                    if self.journal is not None:
+                        self.journal.clear(
+                            source_identity=source.identity(),
+                            database_name=database_name,
+                        )
+
+        await source.acreate_connection()
+        try:
+            with ProgressionBar(
+                disable=self.progression_bar_disabled
+            ) as progression_bar:
+                progression_bar.add_task_with_item(
+                    item_name="",
+                    source_type=source.type(),
+                    total=len(pending_database_names),
                 )
-                words = [
-                    word
-                    for column_metadata in columns_metadata
-                    for word in column_metadata.as_list()
-                ]
-                progression_bar.update_item(current_item=table_name)
-                return ReportResults(
-                    source=f"{database_name}.{table_name}",
-                    results=self.data_rules.validate_words(words=words),
+                await asyncio.gather(
+                    *[
+                        sweep_database(
+                            progression_bar=progression_bar,
+                            database_name=database_name,
+                        )
+                        for database_name in pending_database_names
+                    ]
                 )
+        finally:
+            await source.aclose_connection()
+        if report.failed_sources:
+            logger.warning(
+                f"{len(report.failed_sources)} sources could not be scanned: {list(report.failed_sources)}"
+            )
+        elif self.journal is not None:
+            for database_name in pending_database_names:
+                self.journal.clear(
+                    source_identity=source.identity(), database_name=database_name
+                )
+        return report
 
-        with ProgressionBar(disable=self.progression_bar_disabled) as progression_bar:
-            if table_name:
-                tasks = [
-                    async_validate_words(
-                        progression_bar=progression_bar, table_name=table_name
-                    )
-                ]
-            else:
-                table_names_list = source.get_table_names_list(
-                    database_name=database_name
+    async def _retry(
+        self, description: str, coroutine_function: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Await a coroutine, retried up to retries times with an exponential backoff when it fails.
+
+        :param description: the description of the awaited call, for the logs
+        :param coroutine_function: the function creating the coroutine to await
+        :return: the result of the coroutine
+        """
+        for attempt in range(self.retries):
+            try:
+                return await coroutine_function()
+            except Exception as exception:
+                delay = self.retry_backoff * 2**attempt
+                logger.warning(
+                    f"Retry getting {description} in {delay}s after the error: {exception!r}"
                 )
+                await asyncio.sleep(delay)
+        return await coroutine_function()
 
-                tasks = [
-                    async_validate_words(
-                        progression_bar=progression_bar, table_name=table_name
-                    )
-                    for table_name in table_names_list
-                ]
+    async def _scan_database_async(
+        self,
+        source: ExternalMetadataSource,
+        database_name: str,
+        semaphore: asyncio.Semaphore,
+        workers_count: int,
+        chunk_size: int,
+        sink: ReportSink,
+        report: MetadataGuardianReport,
+        progression_bar: ProgressionBar,
+        table_name: str | None = None,
+        include_comment: bool = False,
+    ) -> bool:
+        """
+        Scan the column names of a database, or of one table, and write the results to the sink.
+        The tables recorded in the journal are not fetched again, their recorded results are
+        written instead. Workers fetch the other tables as a rolling pipeline, a slow table only
+        holds its worker, and the fetched tables are validated in a thread and written by chunks
+        of chunk size tables. The tables failing after the retries are added to the failed sources
+        of the report. With the bulk metadata, the batches of tables are validated as they are
+        fetched, and a retried database skips the tables already written.
+
+        :param source: the ExternalMetadataSource to scan
+        :param database_name: the name of the database
+        :param semaphore: the semaphore limiting the requests in flight to the source
+        :param workers_count: the number of tables of the database fetched at the same time
+        :param chunk_size: the number of fetched tables validated and written together
+        :param sink: the sink of the results
+        :param report: the report collecting the failed sources
+        :param progression_bar: the progression bar of the database
+        :param table_name: the name of the table
+        :param include_comment: the scan include the comment section
+        :return: True if all the tables were scanned
+        """
+        scan_fingerprint = f"{self.data_rules.fingerprint()}:{include_comment}"
+
+        async def async_get_words(table_name: str) -> list[str]:
+            async with semaphore:
+                columns_metadata = await source.aget_column_names(
+                    database_name=database_name,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+                return _columns_words(columns_metadata)
+
+        async def async_get_table_names_list() -> list[str]:
+            async with semaphore:
+                return await source.aget_table_names_list(database_name=database_name)
+
+        def get_recorded_results(sources: list[str]) -> dict[str, ReportResults]:
+            if self.journal is None:
+                return {}
+            return self.journal.get_report_results(
+                source_identity=source.identity(),
+                sources=sources,
+                scan_fingerprint=scan_fingerprint,
+            )
+
+        def write_results(
+            sources: list[str],
+            recorded_results: dict[str, ReportResults],
+            scanned_results: list[ReportResults],
+        ) -> None:
+            results_by_source = {
+                **recorded_results,
+                **{
+                    report_results.source: report_results
+                    for report_results in scanned_results
+                },
+            }
+            for source_name in sources:
+                if source_name in results_by_source:
+                    sink.write(results_by_source[source_name])
+            if self.journal is not None and scanned_results:
+                self.journal.add_report_results(
+                    source_identity=source.identity(),
+                    database_name=database_name,
+                    report_results=scanned_results,
+                    scan_fingerprint=scan_fingerprint,
+                )
+
+        if not table_name and source.supports_database_column_names():
             progression_bar.add_task_with_item(
-                item_name=database_name,
-                source_type=source.type(),
-                total=len(tasks),
+                item_name=database_name, source_type=source.type(), total=None
             )
-            report_results = await asyncio.gather(*tasks)
-            report = MetadataGuardianReport(report_results=report_results)
-        return report
+            written_sources: set[str] = set()
+
+            async def async_scan_database_column_names() -> None:
+                async with (
+                    semaphore,
+                    contextlib.aclosing(
+                        source.aget_database_column_names(
+                            database_name=database_name,
+                            include_comment=include_comment,
+                            batch_size=self.batch_size or 1,
+                        )
+                    ) as tables_batches,
+                ):
+                    async for tables_batch in tables_batches:
+                        tables_batch = [
+                            (table_name, columns_metadata)
+                            for table_name, columns_metadata in tables_batch
+                            if f"{database_name}.{table_name}" not in written_sources
+                        ]
+                        sources = [
+                            f"{database_name}.{table_name}"
+                            for table_name, _ in tables_batch
+                        ]
+                        recorded_results = get_recorded_results(sources)
+                        write_results(
+                            sources=sources,
+                            recorded_results=recorded_results,
+                            scanned_results=await asyncio.to_thread(
+                                self._report_results_batch,
+                                sources=[
+                                    source_name
+                                    for source_name in sources
+                                    if source_name not in recorded_results
+                                ],
+                                words_batch=[
+                                    _columns_words(columns_metadata)
+                                    for source_name, (_, columns_metadata) in zip(
+                                        sources, tables_batch
+                                    )
+                                    if source_name not in recorded_results
+                                ],
+                            ),
+                        )
+                        written_sources.update(sources)
+                        for table_name, _ in tables_batch:
+                            progression_bar.update_item(current_item=table_name)
+
+            await self._retry(
+                description=f"the column names of the database {database_name}",
+                coroutine_function=async_scan_database_column_names,
+            )
+            return True
+        if table_name:
+            table_names_list = [table_name]
+        else:
+            table_names_list = await self._retry(
+                description=f"the table names of the database {database_name}",
+                coroutine_function=async_get_table_names_list,
+            )
+        recorded_results = get_recorded_results(
+            [f"{database_name}.{table_name}" for table_name in table_names_list]
+        )
+        progression_bar.add_task_with_item(
+            item_name=database_name,
+            source_type=source.type(),
+            total=len(table_names_list),
+        )
+        recorded_table_names = [
+            table_name
+            for table_name in table_names_list
+            if f"{database_name}.{table_name}" in recorded_results
+        ]
+        write_results(
+            sources=[
+                f"{database_name}.{table_name}" for table_name in recorded_table_names
+            ],
+            recorded_results=recorded_results,
+            scanned_results=[],
+        )
+        for table_name in recorded_table_names:
+            progression_bar.update_item(current_item=table_name)
+        pending_table_names = [
+            table_name
+            for table_name in table_names_list
+            if f"{database_name}.{table_name}" not in recorded_results
+        ]
+        pending_table_names_iterator = iter(pending_table_names)
+        scanned_tables: asyncio.Queue[tuple[str, list[str] | None]] = asyncio.Queue(
+            maxsize=chunk_size
+        )
+        scanned_all_tables = True
+
+        async def async_scan_tables() -> None:
+            nonlocal scanned_all_tables
+            for table_name in pending_table_names_iterator:
+                words: list[str] | None
+                try:
+                    words = await self._retry(
+                        description=f"the column names of {database_name}.{table_name}",
+                        coroutine_function=functools.partial(
+                            async_get_words, table_name=table_name
+                        ),
+                    )
+                except Exception as exception:
+                    source_name = f"{database_name}.{table_name}"
+                    logger.error(f"Error in scanning {source_name}: {exception!r}")
+                    report.failed_sources[source_name] = repr(exception)
+                    scanned_all_tables = False
+                    words = None
+                await scanned_tables.put((table_name, words))
+
+        async def async_write_tables(
+            tables: list[tuple[str, list[str] | None]],
+        ) -> None:
+            scanned_words = [
+                (f"{database_name}.{table_name}", words)
+                for table_name, words in tables
+                if words is not None
+            ]
+            write_results(
+                sources=[source_name for source_name, _ in scanned_words],
+                recorded_results={},
+                scanned_results=await asyncio.to_thread(
+                    self._report_results_batch,
+                    sources=[source_name for source_name, _ in scanned_words],
+                    words_batch=[words for _, words in scanned_words],
+                ),
+            )
+            for table_name, _ in tables:
+                progression_bar.update_item(current_item=table_name)
+
+        workers = [
+            asyncio.ensure_future(async_scan_tables())
+            for _ in range(min(workers_count, len(pending_table_names)))
+        ]
+        try:
+            buffered_tables: list[tuple[str, list[str] | None]] = []
+            for _ in pending_table_names:
+                buffered_tables.append(await scanned_tables.get())
+                if len(buffered_tables) >= chunk_size:
+                    await async_write_tables(buffered_tables)
+                    buffered_tables = []
+            if buffered_tables:
+                await async_write_tables(buffered_tables)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return scanned_all_tables
 
 
 class ContentFilesScanner(BaseModel):
-    """Content Files Scanner instance."""
+    """
+    Content Files Scanner instance.
+    With a sink, the results of the files are written to the sink by batches of batch size files
+    as soon as they are ready instead of being kept in the returned report.
+    """
 
     data_rules: DataRules
     progression_bar_disabled: bool = True
+    cache: ContentFilesCache | None = None
+    sink: ReportSink | None = None
+    batch_size: int = 256
+
+    def _validate_files(
+        self, paths: list[str], memory_map: bool
+    ) -> dict[str, list[MetadataGuardianResults]]:
+        """
+        Validate the files, reusing the cached results of the files that did not change.
 
-    def scan_local_file(self, path: str) -> MetadataGuardianReport:
+        :param paths: the paths of the files to validate
+        :param memory_map: memory-map the files and scan their chunks in parallel
+        :return: the metadata guardian results by file path
+        """
+        if self.cache is None:
+            return self.data_rules.validate_files(paths=paths, memory_map=memory_map)
+        rules_fingerprint = self.data_rules.fingerprint()
+        files_results = self.cache.get_results(
+            file_paths=paths, rules_fingerprint=rules_fingerprint
+        )
+        changed_paths = [path for path in paths if path not in files_results]
+        if changed_paths:
+            files_fingerprints = self.cache.get_fingerprints(file_paths=changed_paths)
+            changed_files_results = self.data_rules.validate_files(
+                paths=changed_paths, memory_map=memory_map
+            )
+            self.cache.set_results(
+                files_results=changed_files_results,
+                files_fingerprints=files_fingerprints,
+                rules_fingerprint=rules_fingerprint,
+            )
+            files_results.update(changed_files_results)
+        return {path: files_results[path] for path in paths}
+
+    def scan_local_file(
+        self, path: str, memory_map: bool = False
+    ) -> MetadataGuardianReport:
         """
         Scan a file with data rules.
+        When a cache is defined, the results of an unchanged file are reused without reading it.
 
         :param path: the path of the file to scan
+        :param memory_map: memory-map the file and scan its chunks in parallel
         :return: a Metadata Guardian report
         """
         logger.debug(
@@ -280,34 +943,67 @@ class ContentFilesScanner(BaseModel):
             progression_bar.add_task_with_item(
                 item_name=path, source_type="files", total=1
             )
-            report = MetadataGuardianReport(
-                report_results=[
-                    ReportResults(
-                        source=path, results=self.data_rules.validate_file(path=path)
-                    )
+            if self.cache is None:
+                results = self.data_rules.validate_file(
+                    path=path, memory_map=memory_map
+                )
+            else:
+                results = self._validate_files(paths=[path], memory_map=memory_map)[
+                    path
                 ]
-            )
+            report = MetadataGuardianReport()
+            (self.sink or report).write(ReportResults(source=path, results=results))
             progression_bar.update_item(current_item=path)
 
         return report
 
     def scan_directory(
-        self, directory_path: str, file_names_extension: str
+        self,
+        directory_path: str,
+        file_names_extension: str,
+        glob_pattern: str | None = None,
+        memory_map: bool = False,
     ) -> MetadataGuardianReport:
         """
         Scan all the files inside directory path with the file name extension.
+        The directory is walked and the files are scanned in parallel.
+        When a cache is defined, the results of the unchanged files are reused without reading them.
+        With a sink, the files are scanned by batches of batch size files.
 
         :param directory_path: the directory path to scan
         :param file_names_extension: the file name extension to include (without the ".")
+        :param glob_pattern: the glob pattern the file paths relative to the directory must match
+        :param memory_map: memory-map the files and scan their chunks in parallel
         :return: a Metadata Guardian report
         """
         logger.debug(
             f"[blue]Launch the metadata scanning the content of the files {directory_path} with extension{file_names_extension}"
         )
         report = MetadataGuardianReport()
-        for root, dirs, files in os.walk(directory_path):
-            for name in files:
-                path = f"{root}/{name}"
-                if name.endswith(f".{file_names_extension}"):
-                    report.append(other_report=self.scan_local_file(path=path))
+        with ProgressionBar(disable=self.progression_bar_disabled) as progression_bar:
+            progression_bar.add_task_with_item(
+                item_name=directory_path, source_type="files", total=1
+            )
+            if self.cache is None and self.sink is None:
+                files_results = self.data_rules.validate_directory(
+                    directory_path=directory_path,
+                    file_names_extension=file_names_extension,
+                    glob_pattern=glob_pattern,
+                    memory_map=memory_map,
+                )
+                for path, results in files_results.items():
+                    report.write(ReportResults(source=path, results=results))
+            else:
+                sink = self.sink or report
+                paths = find_files(
+                    directory_path, file_names_extension, glob_pattern=glob_pattern
+                )
+                for start in range(0, len(paths), self.batch_size):
+                    files_results = self._validate_files(
+                        paths=paths[start : start + self.batch_size],
+                        memory_map=memory_map,
+                    )
+                    for path, results in files_results.items():
+                        sink.write(ReportResults(source=path, results=results))
+            progression_bar.update_item(current_item=directory_path)
         return report
@@ -1,10 +1,13 @@
-from collections.abc import Iterator
-from typing import Any
+import itertools
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, TypeVar
 
 from loguru import logger
 from pydantic import Field
 
-from ..metadata_source import ColumnMetadata
+from ..metadata_source import ColumnMetadata, ColumnRecord
 from .external_metadata_source import (
     ExternalMetadataSource,
     ExternalMetadataSourceException,
@@ -13,17 +16,137 @@ from .external_metadata_source import (
 try:
     import boto3
     import botocore
+    from botocore.config import Config
 
     AWS_INSTALLED = True
 except ImportError:
     logger.debug("AWS optional dependency is not installed.")
     AWS_INSTALLED = False
 
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+
+    AIOBOTOCORE_INSTALLED = True
+except ImportError:
+    logger.debug("AWS asyncio optional dependency is not installed.")
+    AIOBOTOCORE_INSTALLED = False
+
+_T = TypeVar("_T")
+_C = TypeVar("_C", ColumnMetadata, ColumnRecord)
+_ATHENA_MAX_RESULTS = 50
+_END_OF_ITERATION = object()
+
+
+def _prefetch(iterable: Iterable[_T], size: int) -> Iterator[_T]:
+    """
+    Iterate over an iterable in a background thread, up to size elements ahead of the consumer.
+    The errors of the iterable are raised to the consumer.
+
+    :param iterable: the iterable to prefetch
+    :param size: the number of elements prefetched
+    :return: the elements of the iterable
+    """
+    if size <= 0:
+        yield from iterable
+        return
+    elements: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(element: Any, exception: BaseException | None = None) -> bool:
+        while not stopped.is_set():
+            try:
+                elements.put((element, exception), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        exception: BaseException | None = None
+        try:
+            for element in iterable:
+                if not put(element):
+                    return
+        except BaseException as error:
+            exception = error
+        finally:
+            put(_END_OF_ITERATION, exception)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            element, exception = elements.get()
+            if element is _END_OF_ITERATION:
+                if exception is not None:
+                    raise exception
+                return
+            yield element
+    finally:
+        stopped.set()
+
+
+def _glue_columns_metadata(
+    table: dict[str, Any], include_comment: bool, column_type: Callable[..., _C]
+) -> list[_C]:
+    """
+    Get the column names of an AWS Glue table, followed by its partition keys.
+
+    :param table: the AWS Glue table
+    :param include_comment: include the comments
+    :param column_type: ColumnMetadata, or ColumnRecord on the bulk paths
+    :return: the list of the column names
+    """
+    return [
+        column_type(
+            column_name=row["Name"],
+            column_comment=row.get("Comment") if include_comment else None,
+        )
+        for row in itertools.chain(
+            table.get("StorageDescriptor", {}).get("Columns", []),
+            table.get("PartitionKeys", []),
+        )
+    ]
+
+
+def _athena_columns_metadata(
+    table_metadata: dict[str, Any],
+    include_comment: bool,
+    column_type: Callable[..., _C],
+) -> list[_C]:
+    """
+    Get the column names of an AWS Athena table metadata, followed by its partition keys.
+
+    :param table_metadata: the AWS Athena table metadata
+    :param include_comment: include the comments
+    :param column_type: ColumnMetadata, or ColumnRecord on the bulk paths
+    :return: the list of the column names
+    """
+    return [
+        column_type(
+            column_name=row["Name"],
+            column_comment=row.get("Comment") if include_comment else None,
+        )
+        for row in itertools.chain(
+            table_metadata.get("Columns", []), table_metadata.get("PartitionKeys", [])
+        )
+    ]
+
 
 if AWS_INSTALLED:
 
     class AthenaSource(ExternalMetadataSource):
-        """Athena Source instance."""
+        """
+        Athena Source instance.
+        When aiobotocore is installed, the asynchronous scans use an aiobotocore client with up to
+        max pool connections concurrent requests instead of the blocking client.
+        With the bulk metadata, the catalog is walked with the ListTableMetadata pages of the
+        maximum size, which already hold the columns and partition keys of the tables, instead
+        of one GetTableMetadata call by table. Up to prefetch pages pages are fetched in the
+        background while the previous ones are scanned.
+        The clients retry the throttled calls up to max attempts times, with the adaptive retry
+        mode of botocore limiting the client rate.
+        """
 
         s3_staging_dir: str
         catalog_name: str = "AWSDataCatalog"
@@ -31,23 +154,138 @@ if AWS_INSTALLED:
         aws_access_key_id: str | None = None
         aws_secret_access_key: str | None = None
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        max_pool_connections: int = 100
+        max_attempts: int = 10
+        bulk_metadata: bool = False
+        prefetch_pages: int = 2
 
         def create_connection(self) -> None:
             """
             Create Athena connection.
             :return:
             """
+            connection_args = {
+                "config": Config(
+                    retries={"max_attempts": self.max_attempts, "mode": "adaptive"}
+                ),
+                **self.extra_connection_args,
+            }
             self._connection = boto3.client(
                 "athena",
                 region_name=self.region_name,
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
-                **self.extra_connection_args,
+                **connection_args,
             )
 
         def close_connection(self) -> None:
             pass
 
+        async def acreate_connection(self) -> None:
+            """
+            Create the aiobotocore Athena client.
+
+            :return:
+            """
+            if not AIOBOTOCORE_INSTALLED or self._async_connection is not None:
+                return
+            async with self._get_async_connection_lock():
+                if self._async_connection is not None:
+                    return
+                connection_args = {
+                    "config": AioConfig(
+                        max_pool_connections=self.max_pool_connections,
+                        retries={"max_attempts": self.max_attempts, "mode": "adaptive"},
+                    ),
+                    **self.extra_connection_args,
+                }
+                self._async_connection = (
+                    await get_session()
+                    .create_client(
+                        "athena",
+                        region_name=self.region_name,
+                        aws_access_key_id=self.aws_access_key_id,
+                        aws_secret_access_key=self.aws_secret_access_key,
+                        **connection_args,
+                    )
+                    .__aenter__()
+                )
+
+        async def aclose_connection(self) -> None:
+            """
+            Close the aiobotocore Athena client.
+
+            :return:
+            """
+            if self._async_connection is not None:
+                await self._async_connection.close()
+                self._async_connection = None
+
+        async def aget_column_names(
+            self, database_name: str, table_name: str, include_comment: bool = False
+        ) -> list[ColumnMetadata]:
+            """
+            Get the column names from the table with the aiobotocore client.
+
+            :param database_name: the database name
+            :param table_name: the table name
+            :param include_comment: include the comment
+            :return: the list of the column names
+            """
+            if not AIOBOTOCORE_INSTALLED:
+                return await super().aget_column_names(
+                    database_name=database_name,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+            try:
+                await self.acreate_connection()
+                response = await self._async_connection.get_table_metadata(
+                    CatalogName=self.catalog_name,
+                    DatabaseName=database_name,
+                    TableName=table_name,
+                )
+                return _athena_columns_metadata(
+                    table_metadata=response["TableMetadata"],
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
+            except botocore.exceptions.ClientError as error:
+                logger.exception(
+                    f"Error in getting columns name from AWS Athena {database_name}.{table_name} for catalog {self.catalog_name}"
+                )
+                raise ExternalMetadataSourceException(error)
+
+        async def aget_table_names_list(self, database_name: str) -> list[str]:
+            """
+            Get the table names list from the database in AWS Athena with the aiobotocore client.
+
+            :param database_name: the database name
+            :return: the list of the table names of the database
+            """
+            if not AIOBOTOCORE_INSTALLED:
+                return await super().aget_table_names_list(database_name=database_name)
+            try:
+                await self.acreate_connection()
+                table_names: list[str] = []
+                pages = self._async_connection.get_paginator(
+                    "list_table_metadata"
+                ).paginate(
+                    CatalogName=self.catalog_name,
+                    DatabaseName=database_name,
+                    PaginationConfig={"PageSize": _ATHENA_MAX_RESULTS},
+                )
+                async for page in pages:
+                    table_names.extend(
+                        table["Name"] for table in page["TableMetadataList"]
+                    )
+                return table_names
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting table names list from AWS Athena from the database {database_name} for catalog {self.catalog_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         def get_column_names(
             self, database_name: str, table_name: str, include_comment: bool = False
         ) -> Iterator[ColumnMetadata]:
@@ -67,15 +305,11 @@ if AWS_INSTALLED:
                     DatabaseName=database_name,
                     TableName=table_name,
                 )
-                for row in response["TableMetadata"]["Columns"]:
-                    column_name = row["Name"]
-                    column_comment = None
-                    if include_comment:
-                        if "Comment" in row:
-                            column_comment = row["Comment"]
-                    yield ColumnMetadata(
-                        column_name=column_name, column_comment=column_comment
-                    )
+                yield from _athena_columns_metadata(
+                    table_metadata=response["TableMetadata"],
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
             except botocore.exceptions.ClientError as error:
                 logger.exception(
                     f"Error in getting columns name from AWS Athena {database_name}.{table_name} for catalog {self.catalog_name}"
@@ -95,6 +329,7 @@ if AWS_INSTALLED:
                 response = self._connection.list_table_metadata(
                     CatalogName=self.catalog_name,
                     DatabaseName=database_name,
+                    MaxResults=_ATHENA_MAX_RESULTS,
                 )
                 for table in response["TableMetadataList"]:
                     yield table["Name"]
@@ -102,6 +337,7 @@ if AWS_INSTALLED:
                     response = self._connection.list_table_metadata(
                         CatalogName=self.catalog_name,
                         DatabaseName=database_name,
+                        MaxResults=_ATHENA_MAX_RESULTS,
                         NextToken=response["NextToken"],
                     )
                     for table in response["TableMetadataList"]:
@@ -112,6 +348,80 @@ if AWS_INSTALLED:
                 )
                 raise ExternalMetadataSourceException(exception)
 
+        def get_database_names_list(self) -> Iterator[str]:
+            """
+            Get the database names list from the catalog in AWS Athena.
+
+            :return: the list of the database names
+            """
+            try:
+                if not self._connection:
+                    self.create_connection()
+                response = self._connection.list_databases(
+                    CatalogName=self.catalog_name
+                )
+                for database in response["DatabaseList"]:
+                    yield database["Name"]
+                while "NextToken" in response:
+                    response = self._connection.list_databases(
+                        CatalogName=self.catalog_name, NextToken=response["NextToken"]
+                    )
+                    for database in response["DatabaseList"]:
+                        yield database["Name"]
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting the database names list from AWS Athena for catalog {self.catalog_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the tables of the database from the ListTableMetadata
+            pages.
+
+            :param database_name: the database name
+            :param include_comment: include the comments
+            :return: the table names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            try:
+                if not self._connection:
+                    self.create_connection()
+                pages = self._connection.get_paginator("list_table_metadata").paginate(
+                    CatalogName=self.catalog_name,
+                    DatabaseName=database_name,
+                    PaginationConfig={"PageSize": _ATHENA_MAX_RESULTS},
+                )
+                for page in _prefetch(pages, size=self.prefetch_pages):
+                    for table_metadata in page["TableMetadataList"]:
+                        yield (
+                            table_metadata["Name"],
+                            _athena_columns_metadata(
+                                table_metadata=table_metadata,
+                                include_comment=include_comment,
+                                column_type=ColumnRecord,
+                            ),
+                        )
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting columns name from AWS Athena from the database {database_name} for catalog {self.catalog_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         @classmethod
         def type(cls) -> str:
             """
@@ -122,12 +432,25 @@ if AWS_INSTALLED:
             return "AWS Athena"
 
     class GlueSource(ExternalMetadataSource):
-        """Glue Source instance."""
+        """
+        Glue Source instance.
+        When aiobotocore is installed, the asynchronous scans use an aiobotocore client with up to
+        max pool connections concurrent requests instead of the blocking client.
+        With the bulk metadata, the catalog is walked with the GetTables pages, which already hold
+        the columns of the tables, instead of one GetTable call by table. Up to prefetch pages
+        pages are fetched in the background while the previous ones are scanned.
+        The clients retry the throttled calls up to max attempts times, with the adaptive retry
+        mode of botocore limiting the client rate.
+        """
 
         region_name: str | None = None
         aws_access_key_id: str | None = None
         aws_secret_access_key: str | None = None
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        max_pool_connections: int = 100
+        max_attempts: int = 10
+        bulk_metadata: bool = False
+        prefetch_pages: int = 2
 
         def create_connection(self) -> None:
             """
@@ -135,17 +458,120 @@ if AWS_INSTALLED:
 
             :return:
             """
+            connection_args = {
+                "config": Config(
+                    retries={"max_attempts": self.max_attempts, "mode": "adaptive"}
+                ),
+                **self.extra_connection_args,
+            }
             self._connection = boto3.client(
                 "glue",
                 region_name=self.region_name,
                 aws_access_key_id=self.aws_access_key_id,
                 aws_secret_access_key=self.aws_secret_access_key,
-                **self.extra_connection_args,
+                **connection_args,
             )
 
         def close_connection(self) -> None:
             pass
 
+        async def acreate_connection(self) -> None:
+            """
+            Create the aiobotocore Glue client.
+
+            :return:
+            """
+            if not AIOBOTOCORE_INSTALLED or self._async_connection is not None:
+                return
+            async with self._get_async_connection_lock():
+                if self._async_connection is not None:
+                    return
+                connection_args = {
+                    "config": AioConfig(
+                        max_pool_connections=self.max_pool_connections,
+                        retries={"max_attempts": self.max_attempts, "mode": "adaptive"},
+                    ),
+                    **self.extra_connection_args,
+                }
+                self._async_connection = (
+                    await get_session()
+                    .create_client(
+                        "glue",
+                        region_name=self.region_name,
+                        aws_access_key_id=self.aws_access_key_id,
+                        aws_secret_access_key=self.aws_secret_access_key,
+                        **connection_args,
+                    )
+                    .__aenter__()
+                )
+
+        async def aclose_connection(self) -> None:
+            """
+            Close the aiobotocore Glue client.
+
+            :return:
+            """
+            if self._async_connection is not None:
+                await self._async_connection.close()
+                self._async_connection = None
+
+        async def aget_column_names(
+            self, database_name: str, table_name: str, include_comment: bool = False
+        ) -> list[ColumnMetadata]:
+            """
+            Get the column names from AWS Glue table with the aiobotocore client.
+
+            :param database_name: the name of the database
+            :param table_name: the name of the table
+            :param include_comment: include the comments
+            :return: the list of the column names
+            """
+            if not AIOBOTOCORE_INSTALLED:
+                return await super().aget_column_names(
+                    database_name=database_name,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+            try:
+                await self.acreate_connection()
+                response = await self._async_connection.get_table(
+                    DatabaseName=database_name, Name=table_name
+                )
+                return _glue_columns_metadata(
+                    table=response["Table"],
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting columns name from AWS Glue from the table {database_name}.{table_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        async def aget_table_names_list(self, database_name: str) -> list[str]:
+            """
+            Get the table names list from the database in AWS Glue with the aiobotocore client.
+
+            :param database_name: the database name
+            :return: the list of the table names of the database
+            """
+            if not AIOBOTOCORE_INSTALLED:
+                return await super().aget_table_names_list(database_name=database_name)
+            try:
+                await self.acreate_connection()
+                table_names: list[str] = []
+                pages = self._async_connection.get_paginator("get_tables").paginate(
+                    DatabaseName=database_name
+                )
+                async for page in pages:
+                    table_names.extend(table["Name"] for table in page["TableList"])
+                return table_names
+            except botocore.exceptions.ClientError as error:
+                logger.exception(
+                    f"Error in getting table names list from AWS Glue from the database {database_name}"
+                )
+                raise error
+
         def get_column_names(
             self, database_name: str, table_name: str, include_comment: bool = False
         ) -> Iterator[ColumnMetadata]:
@@ -163,21 +589,104 @@ if AWS_INSTALLED:
                 response = self._connection.get_table(
                     DatabaseName=database_name, Name=table_name
                 )
-                for row in response["Table"]["StorageDescriptor"]["Columns"]:
-                    column_name = row["Name"]
-                    column_comment = None
-                    if include_comment:
-                        if "Comment" in row:
-                            column_comment = row["Comment"]
-                    yield ColumnMetadata(
-                        column_name=column_name, column_comment=column_comment
-                    )
+                yield from _glue_columns_metadata(
+                    table=response["Table"],
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
             except botocore.exceptions.ClientError as exception:
                 logger.exception(
                     f"Error in getting columns name from AWS Glue from the table {database_name}.{table_name}"
                 )
                 raise ExternalMetadataSourceException(exception)
 
+        def get_table_fingerprints(
+            self, database_name: str, table_names: Sequence[str] | None = None
+        ) -> dict[str, str]:
+            """
+            Get the version of the tables of the database from the GetTables pages, a single
+            table is read with GetTable.
+
+            :param database_name: the database name
+            :param table_names: the tables to fingerprint, all the tables of the database by default
+            :return: the version id and the update time of each table by table name
+            """
+            try:
+                if not self._connection:
+                    self.create_connection()
+                if table_names is not None and len(table_names) == 1:
+                    tables = [
+                        self._connection.get_table(
+                            DatabaseName=database_name, Name=table_names[0]
+                        )["Table"]
+                    ]
+                else:
+                    pages = self._connection.get_paginator("get_tables").paginate(
+                        DatabaseName=database_name
+                    )
+                    tables = [
+                        table
+                        for page in _prefetch(pages, size=self.prefetch_pages)
+                        for table in page["TableList"]
+                    ]
+                selected_table_names = None if table_names is None else set(table_names)
+                return {
+                    table["Name"]: f"{table.get('VersionId')}:{table.get('UpdateTime')}"
+                    for table in tables
+                    if selected_table_names is None
+                    or table["Name"] in selected_table_names
+                }
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting the tables versions from AWS Glue from the database {database_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the tables of the database from the GetTables pages.
+
+            :param database_name: the database name
+            :param include_comment: include the comments
+            :return: the table names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            try:
+                if not self._connection:
+                    self.create_connection()
+                pages = self._connection.get_paginator("get_tables").paginate(
+                    DatabaseName=database_name
+                )
+                for page in _prefetch(pages, size=self.prefetch_pages):
+                    for table in page["TableList"]:
+                        yield (
+                            table["Name"],
+                            _glue_columns_metadata(
+                                table=table,
+                                include_comment=include_comment,
+                                column_type=ColumnRecord,
+                            ),
+                        )
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    f"Error in getting columns name from AWS Glue from the database {database_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         def get_table_names_list(self, database_name: str) -> Iterator[str]:
             """
             Get the table names list from the database in AWS Glue.
@@ -205,6 +714,25 @@ if AWS_INSTALLED:
                 )
                 raise error
 
+        def get_database_names_list(self) -> Iterator[str]:
+            """
+            Get the database names list from the AWS Glue catalog.
+
+            :return: the list of the database names
+            """
+            try:
+                if not self._connection:
+                    self.create_connection()
+                pages = self._connection.get_paginator("get_databases").paginate()
+                for page in pages:
+                    for database in page["DatabaseList"]:
+                        yield database["Name"]
+            except botocore.exceptions.ClientError as exception:
+                logger.exception(
+                    "Error in getting the database names list from AWS Glue"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         @classmethod
         def type(cls) -> str:
             """
@@ -1,7 +1,13 @@
-from collections.abc import Iterator
+import json
+import posixpath
+import re
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from loguru import logger
+from pyarrow import parquet
+from pyarrow.fs import FileSelector, FileSystem, FileType
 from pydantic import Field
 
 from ..metadata_source import ColumnMetadata
@@ -11,26 +17,227 @@ from .external_metadata_source import (
 )
 
 try:
-    from deltalake import DeltaTable
+    from deltalake import DeltaTable, Schema
 
     DELTA_LAKE_INSTALLED = True
 except ImportError:
     logger.debug("Delta Lake optional dependency is not installed.")
     DELTA_LAKE_INSTALLED = False
 
+
+def _delta_fields(
+    delta_type: Any, prefix: str, include_comment: bool
+) -> Iterator[ColumnMetadata]:
+    """
+    Walk a Delta type, the fields of the nested structs are emitted with their dotted path.
+    The elements of the arrays and the keys and values of the maps are walked with the path of
+    their field.
+
+    :param delta_type: the Delta type
+    :param prefix: the dotted path of the parent field
+    :param include_comment: include the comment
+    :return: the column names of the nested fields
+    """
+    if hasattr(delta_type, "fields"):
+        for field in delta_type.fields:
+            path = f"{prefix}{field.name}"
+            yield ColumnMetadata(
+                column_name=path,
+                column_comment=str(field.metadata)
+                if include_comment and field.metadata
+                else None,
+            )
+            yield from _delta_fields(field.type, f"{path}.", include_comment)
+    elif hasattr(delta_type, "element_type"):
+        yield from _delta_fields(delta_type.element_type, prefix, include_comment)
+    elif hasattr(delta_type, "value_type"):
+        yield from _delta_fields(delta_type.key_type, prefix, include_comment)
+        yield from _delta_fields(delta_type.value_type, prefix, include_comment)
+
+
+_DELTA_LOG = "_delta_log"
+_DELTA_COMMIT = re.compile(r"^(\d{20})\.json$")
+
+
+def _discover_delta_tables(
+    filesystem: FileSystem, root_path: str, workers: int
+) -> list[str]:
+    """
+    Discover the Delta tables under a root path, the directories holding a Delta log.
+    The directories are listed concurrently, level by level, the tables are not walked into.
+
+    :param filesystem: the filesystem of the root path
+    :param root_path: the root path
+    :param workers: the number of concurrent listings
+    :return: the paths of the Delta tables
+    """
+    table_paths: list[str] = []
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="metadata-guardian-delta"
+    ) as executor:
+        directories = [root_path]
+        while directories:
+            next_directories: list[str] = []
+            for directory, children in zip(
+                directories,
+                executor.map(
+                    lambda path: filesystem.get_file_info(FileSelector(path)),
+                    directories,
+                ),
+            ):
+                child_directories = [
+                    child for child in children if child.type == FileType.Directory
+                ]
+                if any(child.base_name == _DELTA_LOG for child in child_directories):
+                    table_paths.append(directory)
+                    continue
+                next_directories.extend(
+                    child.path
+                    for child in child_directories
+                    if not child.base_name.startswith(("_", "."))
+                )
+            directories = next_directories
+    return sorted(table_paths)
+
+
+def _delta_log_versions(filesystem: FileSystem, table_path: str) -> list[int]:
+    """
+    Get the versions of the commits of the Delta log.
+
+    :param filesystem: the filesystem of the Delta table
+    :param table_path: the path of the Delta table
+    :return: the sorted versions of the commits
+    """
+    return sorted(
+        int(match.group(1))
+        for file_info in filesystem.get_file_info(
+            FileSelector(posixpath.join(table_path, _DELTA_LOG))
+        )
+        if (match := _DELTA_COMMIT.match(file_info.base_name))
+    )
+
+
+def _delta_tables_versions(
+    filesystem: FileSystem, table_paths: list[str], workers: int
+) -> list[int]:
+    """
+    Get the last version of the Delta tables, their logs are listed concurrently.
+
+    :param filesystem: the filesystem of the Delta tables
+    :param table_paths: the paths of the Delta tables
+    :param workers: the number of concurrent listings
+    :return: the last version of each Delta table, -1 without commits
+    """
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="metadata-guardian-delta"
+    ) as executor:
+        return list(
+            executor.map(
+                lambda table_path: max(
+                    _delta_log_versions(filesystem, table_path), default=-1
+                ),
+                table_paths,
+            )
+        )
+
+
+def _delta_schema_string(filesystem: FileSystem, table_path: str) -> str:
+    """
+    Get the schema of a Delta table from its log only: the metadata of the last commits after the
+    latest checkpoint, or else the metadata column of the checkpoint. The data files and their
+    statistics are never read.
+
+    :param filesystem: the filesystem of the Delta table
+    :param table_path: the path of the Delta table
+    :return: the schema string of the Delta table
+    """
+    log_path = posixpath.join(table_path, _DELTA_LOG)
+    checkpoint_version = -1
+    checkpoint_paths = []
+    try:
+        with filesystem.open_input_stream(
+            posixpath.join(log_path, "_last_checkpoint")
+        ) as file:
+            last_checkpoint = json.loads(file.read())
+        checkpoint_version = last_checkpoint["version"]
+        parts = last_checkpoint.get("parts")
+        checkpoint_paths = (
+            [
+                posixpath.join(
+                    log_path,
+                    f"{checkpoint_version:020d}.checkpoint.{part:010d}.{parts:010d}.parquet",
+                )
+                for part in range(1, parts + 1)
+            ]
+            if parts
+            else [
+                posixpath.join(
+                    log_path, f"{checkpoint_version:020d}.checkpoint.parquet"
+                )
+            ]
+        )
+    except FileNotFoundError:
+        pass
+    for version in reversed(
+        [
+            version
+            for version in _delta_log_versions(filesystem, table_path)
+            if version > checkpoint_version
+        ]
+    ):
+        with filesystem.open_input_stream(
+            posixpath.join(log_path, f"{version:020d}.json")
+        ) as file:
+            actions = file.read().decode().splitlines()
+        for action in reversed(actions):
+            if '"metaData"' in action and "metaData" in (parsed := json.loads(action)):
+                return parsed["metaData"]["schemaString"]
+    for checkpoint_path in checkpoint_paths:
+        metadata = parquet.read_table(
+            checkpoint_path, columns=["metaData"], filesystem=filesystem
+        ).column("metaData")
+        for action in metadata.to_pylist():
+            if action:
+                return action["schemaString"]
+    raise ExternalMetadataSourceException(f"No metadata in the Delta log {log_path}")
+
+
 if DELTA_LAKE_INSTALLED:
 
     class DeltaTableSource(ExternalMetadataSource):
+        """
+        Delta Table Source instance.
+        With the flatten nested option, the fields of the struct, array and map columns are also
+        returned, named with their dotted path. The schema is read from the Delta log.
+        With the discover tables option, the uri is a root path: the tables are the directories
+        holding a Delta log under it, discovered by up to discovery workers concurrent listings,
+        and named with their path relative to the root path. The schema of a discovered table is
+        read from the last commits or the latest checkpoint of its log only, on the pyarrow
+        filesystem of the uri, the extra connection args of the DeltaTable are not supported.
+        """
+
         uri: str
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        flatten_nested: bool = False
+        discover_tables: bool = False
+        discovery_workers: int = 16
 
         def create_connection(self) -> None:
             """
-            Create the DeltaTable instance.
+            Create the DeltaTable instance, or the filesystem of the root path with the discover
+            tables option.
 
             :return:
             """
-            self._connection = DeltaTable(self.uri, **self.extra_connection_args)
+            if self.discover_tables:
+                if self.extra_connection_args:
+                    raise ExternalMetadataSourceException(
+                        "The extra connection args are not supported with the discover tables"
+                        " option, the tables are read with the pyarrow filesystem of the uri"
+                    )
+                self._connection = FileSystem.from_uri(self.uri)
+            else:
+                self._connection = DeltaTable(self.uri, **self.extra_connection_args)
 
         def close_connection(self) -> None:
             pass
@@ -52,7 +259,21 @@ if DELTA_LAKE_INSTALLED:
             try:
                 if not self._connection:
                     self.create_connection()
-                schema = self._connection.schema()
+                if self.discover_tables:
+                    filesystem, root_path = self._connection
+                    schema = Schema.from_json(
+                        _delta_schema_string(
+                            filesystem,
+                            posixpath.normpath(
+                                posixpath.join(root_path, table_name or ".")
+                            ),
+                        )
+                    )
+                else:
+                    schema = self._connection.schema()
+                if self.flatten_nested:
+                    yield from _delta_fields(schema, "", include_comment)
+                    return
                 for field in schema.fields:
                     column_comment = None
                     if include_comment and field.metadata:
@@ -68,12 +289,61 @@ if DELTA_LAKE_INSTALLED:
 
         def get_table_names_list(self, database_name: str) -> Iterator[str]:
             """
-            Not relevant, just return the current Delta Table URI.
+            Return the current Delta Table URI, or the discovered tables with the discover
+            tables option.
 
             :param database_name: the database name
             :return: the list of the table names of the database
             """
-            yield self.uri
+            if not self.discover_tables:
+                yield self.uri
+                return
+            try:
+                if not self._connection:
+                    self.create_connection()
+                filesystem, root_path = self._connection
+                for table_path in _discover_delta_tables(
+                    filesystem, root_path, workers=self.discovery_workers
+                ):
+                    yield posixpath.relpath(table_path, root_path)
+            except Exception as exception:
+                logger.exception(f"Error in discovering the Delta tables of {self.uri}")
+                raise ExternalMetadataSourceException(exception)
+
+        def get_table_fingerprints(
+            self, database_name: str, table_names: Sequence[str] | None = None
+        ) -> dict[str, str]:
+            """
+            Get the version of the Delta table, or of the discovered tables with the discover
+            tables option. The given table names are not discovered again, their logs are listed
+            by up to discovery workers concurrent listings.
+
+            :param database_name: the database name
+            :param table_names: the tables to fingerprint, all the discovered tables by default
+            :return: the version of the Delta tables by table name
+            """
+            if not self._connection:
+                self.create_connection()
+            if not self.discover_tables:
+                return {self.uri: str(self._connection.version())}
+            filesystem, root_path = self._connection
+            table_names = (
+                list(table_names)
+                if table_names is not None
+                else list(self.get_table_names_list(database_name=database_name))
+            )
+            versions = _delta_tables_versions(
+                filesystem,
+                [
+                    posixpath.normpath(posixpath.join(root_path, table_name))
+                    for table_name in table_names
+                ],
+                workers=self.discovery_workers,
+            )
+            return {
+                table_name: str(version)
+                for table_name, version in zip(table_names, versions)
+            }
 
         @classmethod
         def type(cls) -> str:
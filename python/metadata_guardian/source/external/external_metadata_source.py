@@ -1,22 +1,72 @@
+import asyncio
+import queue
+import threading
 from abc import abstractmethod
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from loguru import logger
 from pydantic import PrivateAttr
 
 from ...exceptions import MetadataGuardianException
-from ..metadata_source import ColumnMetadata, MetadataSource
+from ..metadata_source import ColumnMetadata, ColumnRecord, MetadataSource
+
+_CHECKED_OUT_CONNECTIONS: ContextVar[dict[int, list[Any]] | None] = ContextVar(
+    "checked_out_connections", default=None
+)
 
 
 class ExternalMetadataSource(MetadataSource):
-    """ExternalMetadataSource Source."""
+    """
+    ExternalMetadataSource Source.
+    With a pool size, the connections are pooled: each worker checks out its own connection of
+    the pool, created lazily and checked before being reused, instead of sharing one connection.
+    The source id, such as the account, the project or the uri, tells apart the sources of the
+    same type sharing a journal or a state store.
+    """
 
-    _connection: Any = PrivateAttr()
+    pool_size: int | None = None
+    source_id: str | None = None
+    _shared_connection: Any = PrivateAttr(default=None)
+    _async_connection: Any = PrivateAttr(default=None)
+    _async_connection_lock: tuple[asyncio.AbstractEventLoop, asyncio.Lock] | None = (
+        PrivateAttr(default=None)
+    )
+    _idle_connections: queue.LifoQueue[Any] | None = PrivateAttr(default=None)
+    _pool_semaphore: threading.BoundedSemaphore | None = PrivateAttr(default=None)
+    _pool_executor: ThreadPoolExecutor | None = PrivateAttr(default=None)
+    _pool_lock: "threading.Lock | None" = PrivateAttr(default=None)
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
         self._connection = None
+        if self.pool_size is not None:
+            self._idle_connections = queue.LifoQueue()
+            self._pool_semaphore = threading.BoundedSemaphore(self.pool_size)
+            self._pool_lock = threading.Lock()
+
+    @property
+    def _connection(self) -> Any:
+        """
+        Get the connection checked out by the current worker, or the shared connection.
+
+        :return: the connection of the source
+        """
+        checked_out = (_CHECKED_OUT_CONNECTIONS.get() or {}).get(id(self))
+        if checked_out is not None:
+            return checked_out[0]
+        return self._shared_connection
+
+    @_connection.setter
+    def _connection(self, connection: Any) -> None:
+        checked_out = (_CHECKED_OUT_CONNECTIONS.get() or {}).get(id(self))
+        if checked_out is not None:
+            checked_out[0] = connection
+        else:
+            self._shared_connection = connection
 
     def __enter__(self) -> "ExternalMetadataSource":
         try:
@@ -31,6 +81,7 @@ class ExternalMetadataSource(MetadataSource):
     def __exit__(self, exc_type, exc_val, exc_tb) -> "ExternalMetadataSource":  # type: ignore
         try:
             self.close_connection()
+            self.close_connection_pool()
         except Exception as exception:
             logger.exception(
                 "Error raised while closing the Metadata Source connection"
@@ -65,6 +116,328 @@ class ExternalMetadataSource(MetadataSource):
         """
         pass
 
+    def get_database_names_list(self) -> Iterator[str]:
+        """
+        Get the database names list from the source, to sweep all its databases.
+
+        :return: the list of the database names
+        """
+        raise ExternalMetadataSourceException(
+            f"Listing the databases is not supported by the {self.type()} source"
+        )
+
+    def identity(self) -> str:
+        """
+        The identity of the source, keying its tables in the journal and the state store.
+
+        :return: the type of the source and its source id
+        """
+        return f"{self.type()}:{self.source_id or ''}"
+
+    def get_table_fingerprints(
+        self, database_name: str, table_names: Sequence[str] | None = None
+    ) -> dict[str, str]:
+        """
+        Get the version of the tables of the database, changing when a table changes, to only
+        rescan the new or changed tables in the incremental scans. The tables without a version
+        are fingerprinted with the hash of their column names.
+
+        :param database_name: the database name
+        :param table_names: the tables to fingerprint, all the tables of the database by default
+        :return: the version of each table by table name, empty if the source has no versions
+        """
+        return {}
+
+    def supports_database_column_names(self) -> bool:
+        """
+        Whether the source fetches the column names of a whole database in bulk.
+        The scanners use get_database_column_names instead of one call by table when it does.
+
+        :return: True if the column names of a database are fetched in bulk
+        """
+        return False
+
+    def get_database_column_names(
+        self, database_name: str, include_comment: bool = False
+    ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+        """
+        Get the column names of every table of the database, table by table.
+        By default, the column names of each table are fetched with get_column_names, the sources
+        supporting it fetch the column names of the whole database in bulk.
+
+        :param database_name: the database name
+        :param include_comment: include the comment
+        :return: the table names with their list of the column names
+        """
+        for table_name in self.get_table_names_list(database_name=database_name):
+            yield (
+                table_name,
+                list(
+                    self.get_column_names(
+                        database_name=database_name,
+                        table_name=table_name,
+                        include_comment=include_comment,
+                    )
+                ),
+            )
+
+    async def aget_column_names(
+        self,
+        database_name: str,
+        table_name: str,
+        include_comment: bool = False,
+    ) -> list[ColumnMetadata]:
+        """
+        Get the column names from the schema asynchronously.
+        By default, get_column_names runs in the default executor of the event loop, or with a
+        connection of the pool in a thread of the pool, the sources having an asyncio client
+        override it to avoid blocking a thread by request.
+
+        :param database_name: the database name
+        :param table_name: the table name
+        :param include_comment: include the comment
+        :return: the list of the column names
+        """
+
+        def get_column_names() -> list[ColumnMetadata]:
+            with self.checkout_connection():
+                return list(
+                    self.get_column_names(
+                        database_name=database_name,
+                        table_name=table_name,
+                        include_comment=include_comment,
+                    )
+                )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_pool_executor(), get_column_names
+        )
+
+    async def aget_table_names_list(self, database_name: str) -> list[str]:
+        """
+        Get the table names list from the database asynchronously.
+        By default, get_table_names_list runs in the default executor of the event loop, or with a
+        connection of the pool in a thread of the pool.
+
+        :param database_name: the database name
+        :return: the list of the table names of the database
+        """
+
+        def get_table_names_list() -> list[str]:
+            with self.checkout_connection():
+                return list(self.get_table_names_list(database_name=database_name))
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_pool_executor(), get_table_names_list
+        )
+
+    async def aget_database_column_names(
+        self,
+        database_name: str,
+        include_comment: bool = False,
+        batch_size: int = 1,
+        prefetch_batches: int = 2,
+    ) -> AsyncGenerator[
+        list[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]], None
+    ]:
+        """
+        Get the column names of every table of the database asynchronously, by batches of batch
+        size tables. By default, get_database_column_names runs in the default executor of the
+        event loop, or with a connection of the pool in a thread of the pool, up to prefetch
+        batches batches ahead of the consumer: the batches are processed as they arrive instead
+        of gathering the whole database first.
+
+        :param database_name: the database name
+        :param include_comment: include the comment
+        :param batch_size: the number of tables by batch
+        :param prefetch_batches: the number of batches fetched ahead of the consumer
+        :return: the batches of the table names with their list of the column names
+        """
+        loop = asyncio.get_running_loop()
+        batches: asyncio.Queue[
+            tuple[
+                list[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]] | None,
+                BaseException | None,
+            ]
+        ] = asyncio.Queue()
+        slots = threading.Semaphore(prefetch_batches)
+        stopped = threading.Event()
+
+        def put(
+            batch: list[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]] | None,
+            exception: BaseException | None = None,
+        ) -> bool:
+            while not stopped.is_set():
+                if slots.acquire(timeout=0.1):
+                    loop.call_soon_threadsafe(batches.put_nowait, (batch, exception))
+                    return True
+            return False
+
+        def produce() -> None:
+            exception: BaseException | None = None
+            try:
+                with self.checkout_connection():
+                    batch: list[
+                        tuple[str, Sequence[ColumnMetadata | ColumnRecord]]
+                    ] = []
+                    for table_columns in self.get_database_column_names(
+                        database_name=database_name, include_comment=include_comment
+                    ):
+                        batch.append(table_columns)
+                        if len(batch) >= batch_size:
+                            if not put(batch):
+                                return
+                            batch = []
+                    if batch and not put(batch):
+                        return
+            except BaseException as error:
+                exception = error
+            finally:
+                put(None, exception)
+
+        producer = loop.run_in_executor(self._get_pool_executor(), produce)
+        try:
+            while True:
+                batch, exception = await batches.get()
+                slots.release()
+                if batch is None:
+                    if exception is not None:
+                        raise exception
+                    return
+                yield batch
+        finally:
+            stopped.set()
+            await producer
+
+    @contextmanager
+    def checkout_connection(self) -> Iterator[None]:
+        """
+        Check out a connection of the pool for the current worker, the connection methods of the
+        source use it until it is checked in again. An idle connection failing the health check is
+        replaced, a new connection is created when there is no idle connection and the workers
+        wait when the pool size connections are checked out. Without pool size, the shared
+        connection is used.
+
+        :return:
+        """
+        if self._pool_semaphore is None or self._idle_connections is None:
+            yield
+            return
+        with self._pool_semaphore:
+            try:
+                checked_out = [self._idle_connections.get_nowait()]
+            except queue.Empty:
+                checked_out = [None]
+            token = _CHECKED_OUT_CONNECTIONS.set(
+                {**(_CHECKED_OUT_CONNECTIONS.get() or {}), id(self): checked_out}
+            )
+            try:
+                if checked_out[0] is not None and not self.is_connection_alive():
+                    logger.debug(f"Replace a dead connection of the {self.type()} pool")
+                    self._close_checked_out_connection()
+                    checked_out[0] = None
+                if checked_out[0] is None:
+                    self.create_connection()
+                yield
+            finally:
+                _CHECKED_OUT_CONNECTIONS.reset(token)
+                if checked_out[0] is not None:
+                    self._idle_connections.put(checked_out[0])
+
+    def is_connection_alive(self) -> bool:
+        """
+        Health check of the connection before it is reused from the pool.
+
+        :return: True if the connection can be reused
+        """
+        return True
+
+    def close_connection_pool(self) -> None:
+        """
+        Close the idle connections of the pool and its threads.
+
+        :return:
+        """
+        if self._pool_lock is None or self._idle_connections is None:
+            return
+        with self._pool_lock:
+            if self._pool_executor is not None:
+                self._pool_executor.shutdown(wait=True)
+                self._pool_executor = None
+        while True:
+            try:
+                connection = self._idle_connections.get_nowait()
+            except queue.Empty:
+                break
+            token = _CHECKED_OUT_CONNECTIONS.set(
+                {**(_CHECKED_OUT_CONNECTIONS.get() or {}), id(self): [connection]}
+            )
+            try:
+                self._close_checked_out_connection()
+            finally:
+                _CHECKED_OUT_CONNECTIONS.reset(token)
+
+    def _close_checked_out_connection(self) -> None:
+        """
+        Close the checked out connection, the errors are only logged.
+
+        :return:
+        """
+        try:
+            self.close_connection()
+        except Exception:
+            logger.debug(
+                f"Error raised while closing a connection of the {self.type()} pool"
+            )
+
+    def _get_pool_executor(self) -> ThreadPoolExecutor | None:
+        """
+        Get the threads of the pool, one by connection, created lazily.
+
+        :return: the executor of the pool, None without pool size
+        """
+        if self.pool_size is None or self._pool_lock is None:
+            return None
+        with self._pool_lock:
+            if self._pool_executor is None:
+                self._pool_executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size,
+                    thread_name_prefix=f"{self.type()} pool",
+                )
+            return self._pool_executor
+
+    def _get_async_connection_lock(self) -> asyncio.Lock:
+        """
+        Get the lock of the running event loop guarding the creation of the asyncio connection,
+        so the concurrent tasks of a scan create one connection.
+
+        :return: the asyncio lock
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_connection_lock is None
+            or self._async_connection_lock[0] is not loop
+        ):
+            self._async_connection_lock = (loop, asyncio.Lock())
+        return self._async_connection_lock[1]
+
+    async def acreate_connection(self) -> None:
+        """
+        Create the asyncio connection of the source, bound to the running event loop.
+        Nothing is created by default.
+
+        :return:
+        """
+        pass
+
+    async def aclose_connection(self) -> None:
+        """
+        Close the asyncio connection of the source.
+
+        :return:
+        """
+        pass
+
     @abstractmethod
     def create_connection(self) -> None:
         """
@@ -1,10 +1,13 @@
-from collections.abc import Iterator
+import contextlib
+import itertools
+import operator
+from collections.abc import Iterator, Sequence
 from typing import Any
 
 from loguru import logger
 from pydantic import Field
 
-from ..metadata_source import ColumnMetadata
+from ..metadata_source import ColumnMetadata, ColumnRecord
 from .external_metadata_source import (
     ExternalMetadataSource,
     ExternalMetadataSourceException,
@@ -18,15 +21,31 @@ except ImportError:
     logger.debug("GCP optional dependency is not installed.")
     GCP_INSTALLED = False
 
+try:
+    from google.cloud import bigquery_storage
+
+    BQSTORAGE_INSTALLED = True
+except ImportError:
+    logger.debug("GCP BigQuery Storage optional dependency is not installed.")
+    BQSTORAGE_INSTALLED = False
+
 if GCP_INSTALLED:
 
     class BigQuerySource(ExternalMetadataSource):
-        """Instance of a BigQuery source."""
+        """
+        Instance of a BigQuery source.
+        With the bulk metadata, the column names, descriptions and nested field paths of a whole
+        dataset are read with one INFORMATION_SCHEMA.COLUMN_FIELD_PATHS query instead of one
+        GetTable call by table, the rows are streamed as Arrow record batches with the BigQuery
+        Storage Read API when it is installed, and grouped by table as they arrive. A region qualifier, such as region-us, scans all the datasets
+        of the region, the tables are then named dataset.table.
+        """
 
         service_account_json_path: str
         project: str | None = None
         location: str | None = None
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        bulk_metadata: bool = False
 
         def create_connection(self) -> None:
             """
@@ -110,6 +129,133 @@ if GCP_INSTALLED:
                 )
                 raise exception
 
+        def get_table_fingerprints(
+            self, database_name: str, table_names: Sequence[str] | None = None
+        ) -> dict[str, str]:
+            """
+            Get the last modification time of the tables of the dataset.
+
+            :param database_name: in that case the dataset
+            :param table_names: the tables to fingerprint, all the tables of the dataset by default
+            :return: the last modification time of each table by table name
+            """
+            try:
+                if not self._connection:
+                    self.create_connection()
+                query = f"SELECT table_id, last_modified_time FROM `{database_name}.__TABLES__`"
+                job_config = None
+                if table_names is not None:
+                    query += " WHERE table_id IN UNNEST(@table_names)"
+                    job_config = bigquery.QueryJobConfig(
+                        query_parameters=[
+                            bigquery.ArrayQueryParameter(
+                                "table_names", "STRING", list(table_names)
+                            )
+                        ]
+                    )
+                query_job = self._connection.query(query, job_config=job_config)
+                return {
+                    row.table_id: str(row.last_modified_time)
+                    for row in query_job.result()
+                }
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting the tables modification time from BigQuery {database_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        def get_database_names_list(self) -> Iterator[str]:
+            """
+            Get the dataset names list from the GCP project.
+
+            :return: the list of the dataset names
+            """
+            try:
+                if not self._connection:
+                    self.create_connection()
+                for dataset in self._connection.list_datasets(project=self.project):
+                    yield dataset.dataset_id
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting the dataset names list from BigQuery {self.project}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the tables of the dataset, or of the region, from the
+            INFORMATION_SCHEMA.COLUMN_FIELD_PATHS view, nested fields included.
+
+            :param database_name: in that case the dataset, or the region qualifier
+            :param include_comment: include the comments
+            :return: the table names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            try:
+                if not self._connection:
+                    self.create_connection()
+                region_wide = database_name.lower().startswith("region-")
+                query_job = self._connection.query(
+                    "SELECT table_schema, table_name, field_path, description"
+                    f" FROM `{database_name}.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS`"
+                    " ORDER BY table_schema, table_name"
+                )
+                rows = query_job.result()
+                with (
+                    bigquery_storage.BigQueryReadClient.from_service_account_json(
+                        self.service_account_json_path
+                    )
+                    if BQSTORAGE_INSTALLED
+                    else contextlib.nullcontext()
+                ) as bqstorage_client:
+                    fields = itertools.chain.from_iterable(
+                        zip(
+                            record_batch.column("table_schema").to_pylist(),
+                            record_batch.column("table_name").to_pylist(),
+                            record_batch.column("field_path").to_pylist(),
+                            record_batch.column("description").to_pylist(),
+                        )
+                        for record_batch in rows.to_arrow_iterable(
+                            bqstorage_client=bqstorage_client
+                        )
+                    )
+                    for (table_schema, table_name), table_fields in itertools.groupby(
+                        fields, key=operator.itemgetter(0, 1)
+                    ):
+                        yield (
+                            f"{table_schema}.{table_name}"
+                            if region_wide
+                            else table_name,
+                            [
+                                ColumnRecord(
+                                    column_name=field_path,
+                                    column_comment=description
+                                    if include_comment and description
+                                    else None,
+                                )
+                                for _, _, field_path, description in table_fields
+                            ],
+                        )
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting the column field paths from BigQuery {database_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         @classmethod
         def type(cls) -> str:
             """
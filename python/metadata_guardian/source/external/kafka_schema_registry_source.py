@@ -1,12 +1,16 @@
 import json
-from collections.abc import Iterator
+import re
+import urllib.parse
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 from loguru import logger
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from ..metadata_source import ColumnMetadata
+from ..metadata_source import ColumnMetadata, ColumnRecord
+from ..nested_fields import _avro_fields
 from .external_metadata_source import (
     ExternalMetadataSource,
     ExternalMetadataSourceException,
@@ -20,6 +24,210 @@ except ImportError:
     logger.debug("Kafka Schema Registry optional dependency is not installed.")
     KAFKA_SCHEMA_REGISTRY_INSTALLED = False
 
+try:
+    import httpx
+
+    HTTPX_INSTALLED = True
+except ImportError:
+    logger.debug("Kafka Schema Registry asyncio optional dependency is not installed.")
+    HTTPX_INSTALLED = False
+
+_PROTOBUF_COMMENT = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+_PROTOBUF_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[A-Za-z_.][\w.]*|\d+|\S')
+
+_SchemaFields = list[tuple[str, str | None]]
+_C = TypeVar("_C", ColumnMetadata, ColumnRecord)
+
+
+def _json_schema_fields(
+    json_schema: Any, prefix: str, root: Any, visiting: frozenset[str]
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Walk a JSON Schema, the properties of the nested objects are emitted with their dotted path
+    and their description. The items of the arrays, the combined schemas and the local
+    references are walked with the path of their property, a reference is only followed once
+    by path.
+
+    :param json_schema: the parsed JSON Schema
+    :param prefix: the dotted path of the parent property
+    :param root: the root JSON Schema, to resolve the local references
+    :param visiting: the references being walked
+    :return: the property paths with their description
+    """
+    if not isinstance(json_schema, dict):
+        return
+    reference = json_schema.get("$ref")
+    if isinstance(reference, str) and reference.startswith("#"):
+        if reference not in visiting:
+            target = root
+            for segment in reference.lstrip("#").strip("/").split("/"):
+                if not segment:
+                    continue
+                segment = segment.replace("~1", "/").replace("~0", "~")
+                target = target.get(segment) if isinstance(target, dict) else None
+            yield from _json_schema_fields(target, prefix, root, visiting | {reference})
+    for keyword in ("allOf", "anyOf", "oneOf"):
+        for sub_schema in json_schema.get(keyword, []):
+            yield from _json_schema_fields(sub_schema, prefix, root, visiting)
+    properties = json_schema.get("properties")
+    if isinstance(properties, dict):
+        for name, property_schema in properties.items():
+            path = f"{prefix}{name}"
+            description = (
+                property_schema.get("description")
+                if isinstance(property_schema, dict)
+                else None
+            )
+            yield path, description or None
+            yield from _json_schema_fields(property_schema, f"{path}.", root, visiting)
+    items = json_schema.get("items")
+    for item_schema in items if isinstance(items, list) else [items]:
+        yield from _json_schema_fields(item_schema, prefix, root, visiting)
+    additional_properties = json_schema.get("additionalProperties")
+    yield from _json_schema_fields(additional_properties, prefix, root, visiting)
+
+
+def _protobuf_messages(schema_str: str) -> dict[str, list[tuple[str, str]]]:
+    """
+    Parse the messages of a Protobuf schema, with their field names and types.
+    The nested messages are named with their parent message, as Parent.Nested, the fields of
+    the oneofs belong to their message and the type of a map field is the type of its values.
+    The field options between brackets are skipped with their aggregate values.
+
+    :param schema_str: the Protobuf schema
+    :return: the fields of each message, in the order of the schema
+    """
+    tokens = _PROTOBUF_TOKEN.findall(_PROTOBUF_COMMENT.sub("", schema_str))
+    messages: dict[str, list[tuple[str, str]]] = {}
+    position = 0
+
+    def skip_statement() -> None:
+        nonlocal position
+        brackets = 0
+        while position < len(tokens) and (
+            brackets or tokens[position] not in (";", "{")
+        ):
+            if tokens[position] == "[":
+                brackets += 1
+            elif tokens[position] == "]":
+                brackets -= 1
+            position += 1
+        if position < len(tokens) and tokens[position] == "{":
+            depth = 0
+            while position < len(tokens):
+                if tokens[position] == "{":
+                    depth += 1
+                elif tokens[position] == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                position += 1
+        position += 1
+
+    def parse_body(message_name: str, fields: list[tuple[str, str]]) -> None:
+        nonlocal position
+        while position < len(tokens) and tokens[position] != "}":
+            token = tokens[position]
+            if token == "message":
+                parse_message(scope=f"{message_name}.")
+            elif token == "oneof":
+                position += 3
+                parse_body(message_name, fields)
+            elif token == "map" and tokens[position + 1 : position + 2] == ["<"]:
+                fields.append((tokens[position + 6], tokens[position + 4]))
+                skip_statement()
+            elif token in ("enum", "extend", "option", "reserved", "extensions", ";"):
+                skip_statement()
+            else:
+                if token in ("repeated", "optional", "required"):
+                    position += 1
+                fields.append((tokens[position + 1], tokens[position]))
+                skip_statement()
+        position += 1
+
+    def parse_message(scope: str) -> None:
+        nonlocal position
+        message_name = f"{scope}{tokens[position + 1]}"
+        fields: list[tuple[str, str]] = []
+        messages[message_name] = fields
+        position += 3
+        parse_body(message_name, fields)
+
+    while position < len(tokens):
+        if tokens[position] == "message":
+            parse_message(scope="")
+        else:
+            skip_statement()
+    return messages
+
+
+def _protobuf_fields(
+    messages: dict[str, list[tuple[str, str]]],
+    message_name: str,
+    prefix: str,
+    visiting: frozenset[str],
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Walk a Protobuf message, the fields of the nested messages are emitted with their dotted
+    path. A recursive message is only walked once by path.
+
+    :param messages: the fields of each message
+    :param message_name: the name of the message to walk
+    :param prefix: the dotted path of the parent field
+    :param visiting: the names of the messages being walked
+    :return: the field paths, without comment
+    """
+    for field_name, field_type in messages[message_name]:
+        path = f"{prefix}{field_name}"
+        yield path, None
+        field_type = field_type.lstrip(".")
+        scopes = message_name.split(".")
+        nested_message = next(
+            (
+                candidate
+                for candidate in (
+                    ".".join(scopes[:index] + [field_type])
+                    for index in range(len(scopes), -1, -1)
+                )
+                if candidate in messages
+            ),
+            next(
+                (name for name in messages if field_type.endswith(f".{name}")),
+                None,
+            ),
+        )
+        if nested_message is not None and nested_message not in visiting:
+            yield from _protobuf_fields(
+                messages, nested_message, f"{path}.", visiting | {nested_message}
+            )
+
+
+def _schema_fields(
+    schema_str: str, schema_type: str | None, comment_field_name: str
+) -> _SchemaFields:
+    """
+    Get the field paths of a schema of the Schema Registry, the nested fields included.
+    The Protobuf schemas are walked from their first message, as the Schema Registry serializers.
+
+    :param schema_str: the schema
+    :param schema_type: the type of the schema, AVRO, PROTOBUF or JSON
+    :param comment_field_name: the name of the comment attribute of the Avro fields
+    :return: the dotted field paths with their comment
+    """
+    if schema_type == "PROTOBUF":
+        messages = _protobuf_messages(schema_str)
+        if not messages:
+            return []
+        message_name = next(iter(messages))
+        return list(
+            _protobuf_fields(messages, message_name, "", frozenset({message_name}))
+        )
+    schema = json.loads(schema_str)
+    if schema_type == "JSON":
+        return list(_json_schema_fields(schema, "", schema, frozenset()))
+    return list(_avro_fields(schema, "", comment_field_name, {}, frozenset()))
+
+
 if KAFKA_SCHEMA_REGISTRY_INSTALLED:
 
     class KafkaSchemaRegistryAuthentication(Enum):
@@ -28,7 +236,15 @@ if KAFKA_SCHEMA_REGISTRY_INSTALLED:
         USER_PWD = 1
 
     class KafkaSchemaRegistrySource(ExternalMetadataSource):
-        """Instance of a Kafka Schema Registry source."""
+        """
+        Instance of a Kafka Schema Registry source.
+        The Avro, Protobuf and JSON Schema subjects are walked down to their nested fields, named
+        with their dotted path. The fields are parsed once by schema id, the subjects sharing a
+        schema are not parsed again. With the bulk metadata, the latest versions of the subjects
+        are fetched by up to fetch workers concurrent requests.
+        When httpx is installed, the asynchronous scans call the Schema Registry REST API with an
+        httpx client of up to max connections concurrent requests instead of the blocking client.
+        """
 
         url: str
         ssl_certificate_location: str | None = None
@@ -38,6 +254,10 @@ if KAFKA_SCHEMA_REGISTRY_INSTALLED:
         )
         comment_field_name: str = "doc"
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        max_connections: int = 100
+        bulk_metadata: bool = False
+        fetch_workers: int = 16
+        _schemas_fields: dict[Any, _SchemaFields] = PrivateAttr(default_factory=dict)
 
         def create_connection(self) -> None:
             """
@@ -60,6 +280,95 @@ if KAFKA_SCHEMA_REGISTRY_INSTALLED:
             """
             self._connection.__exit__()
 
+        async def acreate_connection(self) -> None:
+            """
+            Create the httpx client of the Kafka Schema Registry REST API.
+            The basic authentication and the CA location are read from the extra connection args.
+
+            :return:
+            """
+            if HTTPX_INSTALLED and self._async_connection is None:
+                if self.authenticator == KafkaSchemaRegistryAuthentication.USER_PWD:
+                    user_info = self.extra_connection_args.get("basic.auth.user.info")
+                    self._async_connection = httpx.AsyncClient(
+                        base_url=self.url,
+                        auth=tuple(user_info.split(":", 1)) if user_info else None,
+                        cert=(self.ssl_certificate_location, self.ssl_key_location)
+                        if self.ssl_certificate_location
+                        else None,
+                        verify=self.extra_connection_args.get("ssl.ca.location", True),
+                        limits=httpx.Limits(max_connections=self.max_connections),
+                    )
+                else:
+                    raise NotImplementedError()
+
+        async def aclose_connection(self) -> None:
+            """
+            Close the httpx client of the Kafka Schema Registry REST API.
+
+            :return:
+            """
+            if self._async_connection is not None:
+                await self._async_connection.aclose()
+                self._async_connection = None
+
+        async def aget_column_names(
+            self, database_name: str, table_name: str, include_comment: bool = False
+        ) -> list[ColumnMetadata]:
+            """
+            Get the column names from the latest version of the subject with the httpx client.
+
+            :param database_name: not relevant
+            :param table_name: the subject name
+            :param include_comment: include the comment
+            :return: the list of the column names
+            """
+            if not HTTPX_INSTALLED:
+                return await super().aget_column_names(
+                    database_name=database_name,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+            try:
+                await self.acreate_connection()
+                response = await self._async_connection.get(
+                    f"/subjects/{urllib.parse.quote(table_name, safe='')}/versions/latest"
+                )
+                response.raise_for_status()
+                registered_schema = response.json()
+                return self._columns_metadata(
+                    schema_id=registered_schema.get("id"),
+                    schema_str=registered_schema["schema"],
+                    schema_type=registered_schema.get("schemaType"),
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting columns name from the Kafka Schema Registry {table_name}"
+                )
+                raise exception
+
+        async def aget_table_names_list(self, database_name: str) -> list[str]:
+            """
+            Get all the subjects from the Schema Registry with the httpx client.
+
+            :param database_name: not relevant in that case
+            :return: the list of the table names of the database
+            """
+            if not HTTPX_INSTALLED:
+                return await super().aget_table_names_list(database_name=database_name)
+            try:
+                await self.acreate_connection()
+                response = await self._async_connection.get("/subjects")
+                response.raise_for_status()
+                return list(response.json())
+            except Exception as exception:
+                logger.exception(
+                    "Error all the subjects from the subject in the Kafka Schema Registry"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         def get_column_names(
             self, database_name: str, table_name: str, include_comment: bool = False
         ) -> Iterator[ColumnMetadata]:
@@ -75,18 +384,13 @@ if KAFKA_SCHEMA_REGISTRY_INSTALLED:
                 if not self._connection:
                     self.create_connection()
                 registered_schema = self._connection.get_latest_version(table_name)
-                for field in json.loads(registered_schema.schema.schema_str)["fields"]:
-                    column_name = field["name"]
-                    column_comment = None
-                    if (
-                        include_comment
-                        and self.comment_field_name in field
-                        and field[self.comment_field_name]
-                    ):
-                        column_comment = field[self.comment_field_name]
-                    yield ColumnMetadata(
-                        column_name=column_name, column_comment=column_comment
-                    )
+                yield from self._columns_metadata(
+                    schema_id=registered_schema.schema_id,
+                    schema_str=registered_schema.schema.schema_str,
+                    schema_type=registered_schema.schema.schema_type,
+                    include_comment=include_comment,
+                    column_type=ColumnMetadata,
+                )
             except Exception as exception:
                 logger.exception(
                     f"Error in getting columns name from the Kafka Schema Registry {table_name}"
@@ -110,6 +414,93 @@ if KAFKA_SCHEMA_REGISTRY_INSTALLED:
                 )
                 raise ExternalMetadataSourceException(exception)
 
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the subjects, their latest versions are fetched
+            concurrently.
+
+            :param database_name: not relevant in that case
+            :param include_comment: include the comments
+            :return: the subject names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            subjects = list(self.get_table_names_list(database_name=database_name))
+            connection = self._connection
+            try:
+                with ThreadPoolExecutor(
+                    max_workers=self.fetch_workers,
+                    thread_name_prefix="metadata-guardian-schema-registry",
+                ) as executor:
+                    for subject, registered_schema in zip(
+                        subjects, executor.map(connection.get_latest_version, subjects)
+                    ):
+                        yield (
+                            subject,
+                            self._columns_metadata(
+                                schema_id=registered_schema.schema_id,
+                                schema_str=registered_schema.schema.schema_str,
+                                schema_type=registered_schema.schema.schema_type,
+                                include_comment=include_comment,
+                                column_type=ColumnRecord,
+                            ),
+                        )
+            except Exception as exception:
+                logger.exception(
+                    "Error in getting columns name of the subjects from the Kafka Schema Registry"
+                )
+                raise ExternalMetadataSourceException(exception)
+
+        def _columns_metadata(
+            self,
+            schema_id: Any,
+            schema_str: str,
+            schema_type: str | None,
+            include_comment: bool,
+            column_type: Callable[..., _C],
+        ) -> list[_C]:
+            """
+            Get the column names of a schema, parsed once by schema id.
+
+            :param schema_id: the id of the schema in the Schema Registry
+            :param schema_str: the schema
+            :param schema_type: the type of the schema, AVRO, PROTOBUF or JSON
+            :param include_comment: include the comment
+            :param column_type: ColumnMetadata, or ColumnRecord on the bulk paths
+            :return: the list of the column names
+            """
+            schema_fields = (
+                self._schemas_fields.get(schema_id) if schema_id is not None else None
+            )
+            if schema_fields is None:
+                schema_fields = _schema_fields(
+                    schema_str=schema_str,
+                    schema_type=schema_type,
+                    comment_field_name=self.comment_field_name,
+                )
+                if schema_id is not None:
+                    self._schemas_fields[schema_id] = schema_fields
+            return [
+                column_type(
+                    column_name=column_name,
+                    column_comment=column_comment if include_comment else None,
+                )
+                for column_name, column_comment in schema_fields
+            ]
+
         @classmethod
         def type(cls) -> str:
             """
@@ -1,11 +1,12 @@
-from collections.abc import Iterator
+import itertools
+from collections.abc import Iterator, Sequence
 from enum import Enum
 from typing import Any
 
 from loguru import logger
 from pydantic import Field
 
-from ..metadata_source import ColumnMetadata
+from ..metadata_source import ColumnMetadata, ColumnRecord
 from .external_metadata_source import (
     ExternalMetadataSource,
     ExternalMetadataSourceException,
@@ -19,6 +20,14 @@ except ImportError:
     logger.debug("MySQL optional dependency is not installed.")
     MYSQL_INSTALLED = False
 
+try:
+    import aiomysql
+
+    AIOMYSQL_INSTALLED = True
+except ImportError:
+    logger.debug("MySQL asyncio optional dependency is not installed.")
+    AIOMYSQL_INSTALLED = False
+
 if MYSQL_INSTALLED:
 
     class MySQLAuthenticator(Enum):
@@ -27,7 +36,13 @@ if MYSQL_INSTALLED:
         USER_PWD = 1
 
     class MySQLSource(ExternalMetadataSource):
-        """Instance of a MySQL source."""
+        """
+        Instance of a MySQL source.
+        With the bulk metadata, the column names of all the tables of the database are streamed
+        from one information_schema.COLUMNS query instead of one query by table.
+        When aiomysql is installed, the asynchronous scans use a pool of async pool size
+        connections instead of the blocking connection.
+        """
 
         user: str
         password: str
@@ -35,6 +50,8 @@ if MYSQL_INSTALLED:
         database: str | None = None
         authenticator: MySQLAuthenticator = MySQLAuthenticator.USER_PWD
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        bulk_metadata: bool = False
+        async_pool_size: int = 32
 
         def create_connection(self) -> None:
             """
@@ -52,6 +69,122 @@ if MYSQL_INSTALLED:
                     **self.extra_connection_args,
                 )
 
+        def close_connection(self) -> None:
+            """
+            Close the MySQL connection.
+
+            :return:
+            """
+            if self._connection and self._connection.open:
+                self._connection.close()
+
+        def is_connection_alive(self) -> bool:
+            """
+            Ping the MySQL connection before it is reused from the pool.
+
+            :return: True if the connection answers
+            """
+            try:
+                self._connection.ping(reconnect=False)
+                return True
+            except pymysql.err.Error:
+                return False
+
+        async def acreate_connection(self) -> None:
+            """
+            Create the aiomysql connections pool based on the MySQLAuthenticator.
+
+            :return:
+            """
+            if not AIOMYSQL_INSTALLED or self._async_connection is not None:
+                return
+            async with self._get_async_connection_lock():
+                if self._async_connection is not None:
+                    return
+                if self.authenticator == MySQLAuthenticator.USER_PWD:
+                    self._async_connection = await aiomysql.create_pool(
+                        host=self.host,
+                        user=self.user,
+                        password=self.password,
+                        db=self.database,
+                        maxsize=self.async_pool_size,
+                        cursorclass=aiomysql.DictCursor,
+                        **self.extra_connection_args,
+                    )
+
+        async def aclose_connection(self) -> None:
+            """
+            Close the aiomysql connections pool.
+
+            :return:
+            """
+            if self._async_connection is not None:
+                self._async_connection.close()
+                await self._async_connection.wait_closed()
+                self._async_connection = None
+
+        async def aget_column_names(
+            self, database_name: str, table_name: str, include_comment: bool = False
+        ) -> list[ColumnMetadata]:
+            """
+            Get column names from the table with a connection of the aiomysql pool.
+
+            :param database_name: the database name
+            :param table_name: the table name
+            :param include_comment: include the comment
+            :return: the list of the column names
+            """
+            if not AIOMYSQL_INSTALLED:
+                return await super().aget_column_names(
+                    database_name=database_name,
+                    table_name=table_name,
+                    include_comment=include_comment,
+                )
+            try:
+                await self.acreate_connection()
+                async with self._async_connection.acquire() as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(
+                            f"SHOW FULL COLUMNS FROM {database_name}.{table_name}"
+                        )
+                        rows = await cursor.fetchall()
+                return [
+                    ColumnMetadata(
+                        column_name=row["Field"],
+                        column_comment=row["Comment"]
+                        if include_comment and row["Comment"]
+                        else None,
+                    )
+                    for row in rows
+                ]
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting columns name from MySQL {database_name}.{table_name}"
+                )
+                raise exception
+
+        async def aget_table_names_list(self, database_name: str) -> list[str]:
+            """
+            Get the table names list from the MySQL database with a connection of the aiomysql pool.
+
+            :param database_name: the database name
+            :return: the list of the table names of the database
+            """
+            if not AIOMYSQL_INSTALLED:
+                return await super().aget_table_names_list(database_name=database_name)
+            try:
+                await self.acreate_connection()
+                async with self._async_connection.acquire() as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute(f"SHOW TABLES IN {database_name}")
+                        rows = await cursor.fetchall()
+                return [list(row.values())[0] for row in rows]
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting table names from the database {database_name} in MySQL"
+                )
+                raise ExternalMetadataSourceException(exception)
+
         def get_column_names(
             self, database_name: str, table_name: str, include_comment: bool = False
         ) -> Iterator[ColumnMetadata]:
@@ -85,6 +218,64 @@ if MYSQL_INSTALLED:
             finally:
                 cursor.close()
 
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the tables of the database with one information_schema query.
+            The rows are streamed with a server-side cursor and grouped by table.
+
+            :param database_name: the database name
+            :param include_comment: include the comment
+            :return: the table names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            try:
+                if not self._connection or not self._connection.open:
+                    self.create_connection()
+                cursor = self._connection.cursor(pymysql.cursors.SSDictCursor)
+                cursor.execute(
+                    "SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name,"
+                    " COLUMN_COMMENT AS column_comment"
+                    " FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = %s"
+                    " ORDER BY TABLE_NAME, ORDINAL_POSITION",
+                    (database_name,),
+                )
+                for table_name, rows in itertools.groupby(
+                    cursor, key=lambda row: row["table_name"]
+                ):
+                    yield (
+                        table_name,
+                        [
+                            ColumnRecord(
+                                column_name=row["column_name"],
+                                column_comment=row["column_comment"]
+                                if include_comment and row["column_comment"]
+                                else None,
+                            )
+                            for row in rows
+                        ],
+                    )
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting columns name from the database {database_name} in MySQL"
+                )
+                raise ExternalMetadataSourceException(exception)
+            finally:
+                cursor.close()
+
         def get_table_names_list(self, database_name: str) -> Iterator[str]:
             """
             Get the table names list from the MySQL database.
@@ -109,6 +300,26 @@ if MYSQL_INSTALLED:
             finally:
                 cursor.close()
 
+        def get_database_names_list(self) -> Iterator[str]:
+            """
+            Get the database names list from MySQL.
+
+            :return: the list of the database names
+            """
+            try:
+                if not self._connection or not self._connection.open:
+                    self.create_connection()
+                cursor = self._connection.cursor()
+                cursor.execute("SHOW DATABASES")
+                rows = cursor.fetchall()
+                for row in rows:
+                    yield row["Database"]
+            except Exception as exception:
+                logger.exception("Error in getting the database names in MySQL")
+                raise ExternalMetadataSourceException(exception)
+            finally:
+                cursor.close()
+
         @classmethod
         def type(cls) -> str:
             """
@@ -1,11 +1,12 @@
-from collections.abc import Iterator
+import itertools
+from collections.abc import Iterator, Sequence
 from enum import Enum
 from typing import Any
 
 from loguru import logger
 from pydantic import Field
 
-from ..metadata_source import ColumnMetadata
+from ..metadata_source import ColumnMetadata, ColumnRecord
 from .external_metadata_source import (
     ExternalMetadataSource,
     ExternalMetadataSourceException,
@@ -14,6 +15,7 @@ from .external_metadata_source import (
 try:
     import snowflake.connector
     from snowflake.connector.converter_null import SnowflakeNoConverterToPython
+    from snowflake.connector.errors import NotSupportedError
 
     SNOWFLAKE_INSTALLED = True
 except ImportError:
@@ -30,7 +32,11 @@ if SNOWFLAKE_INSTALLED:
         TOKEN = 3
 
     class SnowflakeSource(ExternalMetadataSource):
-        """Instance of a Snowflake source."""
+        """
+        Instance of a Snowflake source.
+        With the bulk metadata, the column names of all the tables of the schema are read with one
+        INFORMATION_SCHEMA.COLUMNS query instead of one query by table.
+        """
 
         sf_account: str
         sf_user: str
@@ -42,6 +48,8 @@ if SNOWFLAKE_INSTALLED:
         oauth_host: str | None = None
         authenticator: SnowflakeAuthenticator = SnowflakeAuthenticator.USER_PWD
         extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+        bulk_metadata: bool = False
+        fetch_size: int = 10_000
 
         def create_connection(self) -> None:
             """
@@ -87,6 +95,14 @@ if SNOWFLAKE_INSTALLED:
             """
             self._connection.close()
 
+        def is_connection_alive(self) -> bool:
+            """
+            Check that the Snowflake connection is still open before it is reused from the pool.
+
+            :return: True if the connection is open
+            """
+            return not self._connection.is_closed()
+
         def get_column_names(
             self, database_name: str, table_name: str, include_comment: bool = False
         ) -> Iterator[ColumnMetadata]:
@@ -122,6 +138,80 @@ if SNOWFLAKE_INSTALLED:
             finally:
                 cursor.close()
 
+        def supports_database_column_names(self) -> bool:
+            """
+            Whether the column names of a whole database are fetched in bulk.
+
+            :return: True with the bulk metadata
+            """
+            return self.bulk_metadata
+
+        def _fetch_rows(self, cursor: Any) -> Iterator[tuple[Any, ...]]:
+            """
+            Stream the rows of the executed query, as Arrow batches when the result supports it.
+
+            :param cursor: the cursor of the executed query
+            :return: the rows
+            """
+            try:
+                arrow_batches = cursor.fetch_arrow_batches()
+            except NotSupportedError:
+                while rows := cursor.fetchmany(self.fetch_size):
+                    yield from rows
+                return
+            for arrow_batch in arrow_batches:
+                yield from zip(*(column.to_pylist() for column in arrow_batch.columns))
+
+        def get_database_column_names(
+            self, database_name: str, include_comment: bool = False
+        ) -> Iterator[tuple[str, Sequence[ColumnMetadata | ColumnRecord]]]:
+            """
+            Get the column names of all the tables of the schema with one INFORMATION_SCHEMA query.
+            The rows are streamed and grouped by table.
+
+            :param database_name: the database name
+            :param include_comment: include the comment
+            :return: the table names with their list of the column names
+            """
+            if not self.bulk_metadata:
+                yield from super().get_database_column_names(
+                    database_name=database_name, include_comment=include_comment
+                )
+                return
+            try:
+                if not self._connection or self._connection.is_closed():
+                    self.create_connection()
+                cursor = self._connection.cursor()
+                cursor.execute(
+                    "SELECT TABLE_NAME, COLUMN_NAME, COMMENT"
+                    f' FROM "{database_name}".INFORMATION_SCHEMA.COLUMNS'
+                    " WHERE TABLE_SCHEMA = %s"
+                    " ORDER BY TABLE_NAME, ORDINAL_POSITION",
+                    (self.schema_name,),
+                )
+                for table_name, rows in itertools.groupby(
+                    self._fetch_rows(cursor), key=lambda row: row[0]
+                ):
+                    yield (
+                        table_name.upper(),
+                        [
+                            ColumnRecord(
+                                column_name=column_name,
+                                column_comment=column_comment
+                                if include_comment
+                                else None,
+                            )
+                            for _, column_name, column_comment in rows
+                        ],
+                    )
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting columns name from Snowflake {database_name}.{self.schema_name}"
+                )
+                raise ExternalMetadataSourceException(exception)
+            finally:
+                cursor.close()
+
         def get_table_names_list(self, database_name: str) -> Iterator[str]:
             """
             Get the table names list from the Snowflake database.
@@ -146,6 +236,68 @@ if SNOWFLAKE_INSTALLED:
             finally:
                 cursor.close()
 
+        def get_table_fingerprints(
+            self, database_name: str, table_names: Sequence[str] | None = None
+        ) -> dict[str, str]:
+            """
+            Get the last alteration time of the tables of the schema.
+
+            :param database_name: the database name
+            :param table_names: the tables to fingerprint, all the tables of the schema by default
+            :return: the last alteration time of each table by table name
+            """
+            try:
+                if not self._connection or self._connection.is_closed():
+                    self.create_connection()
+                cursor = self._connection.cursor()
+                query = (
+                    f'SELECT TABLE_NAME, LAST_ALTERED FROM "{database_name}".INFORMATION_SCHEMA.TABLES'
+                    " WHERE TABLE_SCHEMA = %s"
+                )
+                parameters: tuple[str, ...] = (self.schema_name,)
+                if table_names is not None and len(table_names) == 1:
+                    query += " AND TABLE_NAME = %s"
+                    parameters += (table_names[0].upper(),)
+                cursor.execute(query, parameters)
+                selected_table_names = (
+                    None
+                    if table_names is None
+                    else {table_name.upper() for table_name in table_names}
+                )
+                return {
+                    table_name.upper(): str(last_altered)
+                    for table_name, last_altered in cursor.fetchall()
+                    if selected_table_names is None
+                    or table_name.upper() in selected_table_names
+                }
+            except Exception as exception:
+                logger.exception(
+                    f"Error in getting the tables alteration time from the database {database_name} in Snowflake"
+                )
+                raise ExternalMetadataSourceException(exception)
+            finally:
+                cursor.close()
+
+        def get_database_names_list(self) -> Iterator[str]:
+            """
+            Get the database names list from Snowflake.
+
+            :return: the list of the database names
+            """
+            try:
+                if not self._connection or self._connection.is_closed():
+                    self.create_connection()
+                cursor = self._connection.cursor()
+                cursor.execute("SHOW DATABASES")
+                rows = cursor.fetchall()
+                for row in rows:
+                    yield row[1]
+            except Exception as exception:
+                logger.exception("Error in getting the database names in Snowflake")
+                raise ExternalMetadataSourceException(exception)
+            finally:
+                cursor.close()
+
         @classmethod
         def type(cls) -> str:
             """
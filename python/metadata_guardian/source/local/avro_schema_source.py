@@ -1,7 +1,9 @@
+import json
 from collections.abc import Iterator
 
 from loguru import logger
 
+from ..nested_fields import _avro_fields
 from .local_metadata_source import ColumnMetadata, LocalMetadataSource
 
 try:
@@ -29,6 +31,12 @@ if AVRO_INSTALLED:
 
             :return: the list of the column names
             """
+            if self.flatten_nested:
+                for column_name, _ in _avro_fields(
+                    json.loads(self.read()), "", "doc", {}, frozenset()
+                ):
+                    yield ColumnMetadata(column_name=column_name)
+                return
             schema = parse(self.read())
             for field in schema.fields:
                 yield ColumnMetadata(column_name=field.name)
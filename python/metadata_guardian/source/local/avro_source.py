@@ -3,6 +3,7 @@ from collections.abc import Iterator
 
 from loguru import logger
 
+from ..nested_fields import _avro_fields
 from .local_metadata_source import ColumnMetadata, LocalMetadataSource
 
 try:
@@ -47,14 +48,18 @@ if AVRO_INSTALLED:
 
         def get_column_names(self) -> Iterator[ColumnMetadata]:
             """
-            Get column names from the AVRO file.
+            Get column names from the AVRO file header.
 
             :return: the list of the column names
             """
             reader = self.read()
             schema = json.loads(reader.meta["avro.schema"])
-            for field in schema["fields"]:
-                yield ColumnMetadata(column_name=field["name"])
+            if self.flatten_nested:
+                for column_name, _ in _avro_fields(schema, "", "doc", {}, frozenset()):
+                    yield ColumnMetadata(column_name=column_name)
+            else:
+                for field in schema["fields"]:
+                    yield ColumnMetadata(column_name=field["name"])
 
         @property
         def namespace(self) -> str:
@@ -7,14 +7,20 @@ from pyarrow.fs import FileSystem, LocalFileSystem
 from pydantic import Field
 
 from ..metadata_source import ColumnMetadata, MetadataSource
+from ..nested_fields import _arrow_schema_fields
 
 
 class LocalMetadataSource(MetadataSource):
-    """LocalMetadata Source contract."""
+    """
+    LocalMetadata Source contract.
+    With the flatten nested option, the fields of the struct, list and map columns are also
+    returned, named with their dotted path.
+    """
 
     local_path: str
     fs: FileSystem = LocalFileSystem()
     extra_connection_args: dict[str, Any] = Field(default_factory=dict)
+    flatten_nested: bool = False
 
     class Config:
         arbitrary_types_allowed = True
@@ -29,11 +35,22 @@ class LocalMetadataSource(MetadataSource):
             self.local_path, filesystem=self.fs, **self.extra_connection_args
         )
 
+    def read_schema(self) -> pyarrow.Schema:
+        """
+        Read the schema of the source local file.
+
+        :return: the Arrow schema
+        """
+        return self.read().schema
+
     def get_column_names(self) -> Iterator[ColumnMetadata]:
         """
         Get the column names from the schema.
 
         :return: the list of the column names
         """
-        for column_name in self.read().schema.names:
+        schema = self.read_schema()
+        for column_name in (
+            _arrow_schema_fields(schema) if self.flatten_nested else schema.names
+        ):
             yield ColumnMetadata(column_name=column_name)
@@ -1,12 +1,13 @@
-from collections.abc import Iterator
-
 from pyarrow.orc import ORCFile
 
-from .local_metadata_source import ColumnMetadata, LocalMetadataSource
+from .local_metadata_source import LocalMetadataSource
 
 
 class ORCSource(LocalMetadataSource):
-    """Instance for a local ORC file."""
+    """
+    Instance for a local ORC file.
+    The schema is read from the file footer.
+    """
 
     def read(self) -> ORCFile:
         """
@@ -16,15 +17,6 @@ class ORCSource(LocalMetadataSource):
         """
         return ORCFile(self.local_path)
 
-    def get_column_names(self) -> Iterator[ColumnMetadata]:
-        """
-        Get the column names from the schema.
-
-        :return: the list of the column names
-        """
-        for column_name in self.read().schema.names:
-            yield ColumnMetadata(column_name=column_name)
-
     @classmethod
     def type(cls) -> str:
         """
@@ -1,8 +1,25 @@
+import pyarrow
+from pyarrow import parquet
+from pyarrow.fs import FileType
+
 from .local_metadata_source import LocalMetadataSource
 
 
 class ParquetSource(LocalMetadataSource):
-    """Instance for a local Parquet file."""
+    """
+    Instance for a local Parquet file.
+    The schema of a Parquet file is read from its footer, without discovering a dataset.
+    """
+
+    def read_schema(self) -> pyarrow.Schema:
+        """
+        Read the schema from the footer of the Parquet file, or from the dataset of a directory.
+
+        :return: the Arrow schema
+        """
+        if self.fs.get_file_info(self.local_path).type != FileType.File:
+            return super().read_schema()
+        return parquet.read_schema(self.local_path, filesystem=self.fs)
 
     @classmethod
     def type(cls) -> str:
@@ -34,6 +34,55 @@ class ColumnMetadata(Metadata):
             yield self.column_comment.lower()
 
 
+class ColumnRecord:
+    """
+    Column Record instance, a slotted column metadata created without validation.
+    The sources emit it on their bulk paths, where the pydantic validation of millions of
+    ColumnMetadata is too costly. It has the attributes and the as_list of ColumnMetadata and is
+    equal to the ColumnMetadata of the same column.
+    """
+
+    __slots__ = ("column_name", "column_comment")
+
+    def __init__(self, column_name: str, column_comment: str | None = None) -> None:
+        self.column_name = column_name
+        self.column_comment = column_comment
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnRecord, ColumnMetadata)):
+            return (self.column_name, self.column_comment) == (
+                other.column_name,
+                other.column_comment,
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnRecord(column_name={self.column_name!r},"
+            f" column_comment={self.column_comment!r})"
+        )
+
+    def as_list(self) -> Iterator[str]:
+        """
+        Return as a raw list of strings.
+
+        :return: a list of string
+        """
+        yield self.column_name.lower()
+        if self.column_comment:
+            yield self.column_comment.lower()
+
+    def to_column_metadata(self) -> ColumnMetadata:
+        """
+        Convert to a validated ColumnMetadata.
+
+        :return: the column metadata
+        """
+        return ColumnMetadata(
+            column_name=self.column_name, column_comment=self.column_comment
+        )
+
+
 class MetadataSource(BaseModel, ABC):
     """Metadata Source contract."""
 
@@ -0,0 +1,122 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pyarrow
+from pyarrow import types
+
+
+def _arrow_fields(arrow_type: pyarrow.DataType, prefix: str) -> Iterator[str]:
+    """
+    Walk an Arrow type, the fields of the nested structs are emitted with their dotted path.
+    The values of the lists, the keys and items of the maps and the values of the dictionaries
+    are walked with the path of their field.
+
+    :param arrow_type: the Arrow type
+    :param prefix: the dotted path of the parent field
+    :return: the field paths
+    """
+    if types.is_struct(arrow_type):
+        for index in range(arrow_type.num_fields):
+            field = arrow_type.field(index)
+            path = f"{prefix}{field.name}"
+            yield path
+            yield from _arrow_fields(field.type, f"{path}.")
+    elif types.is_map(arrow_type):
+        yield from _arrow_fields(arrow_type.key_type, prefix)
+        yield from _arrow_fields(arrow_type.item_type, prefix)
+    elif (
+        types.is_list(arrow_type)
+        or types.is_large_list(arrow_type)
+        or types.is_fixed_size_list(arrow_type)
+    ):
+        yield from _arrow_fields(arrow_type.value_type, prefix)
+    elif types.is_dictionary(arrow_type):
+        yield from _arrow_fields(arrow_type.value_type, prefix)
+
+
+def _arrow_schema_fields(schema: pyarrow.Schema) -> Iterator[str]:
+    """
+    Get the field paths of an Arrow schema, the nested fields included.
+
+    :param schema: the Arrow schema
+    :return: the dotted field paths
+    """
+    for field in schema:
+        yield field.name
+        yield from _arrow_fields(field.type, f"{field.name}.")
+
+
+def _avro_fields(
+    avro_type: Any,
+    prefix: str,
+    comment_field_name: str,
+    named_types: dict[str, Any],
+    visiting: frozenset[str],
+) -> Iterator[tuple[str, str | None]]:
+    """
+    Walk an Avro type, the fields of the nested records are emitted with their dotted path.
+    The items of the arrays, the values of the maps and the branches of the unions are walked
+    with the path of their field, a recursive record is only walked once by path.
+
+    :param avro_type: the parsed Avro type
+    :param prefix: the dotted path of the parent field
+    :param comment_field_name: the name of the comment attribute of the fields
+    :param named_types: the named types already defined, by name
+    :param visiting: the names of the records being walked
+    :return: the field paths with their comment
+    """
+    if isinstance(avro_type, str):
+        if avro_type in named_types and avro_type not in visiting:
+            yield from _avro_fields(
+                named_types[avro_type],
+                prefix,
+                comment_field_name,
+                named_types,
+                visiting,
+            )
+    elif isinstance(avro_type, list):
+        for union_type in avro_type:
+            yield from _avro_fields(
+                union_type, prefix, comment_field_name, named_types, visiting
+            )
+    elif isinstance(avro_type, dict):
+        type_name = avro_type.get("type")
+        if type_name in ("record", "error", "enum", "fixed"):
+            name = avro_type.get("name", "")
+            namespace = avro_type.get("namespace")
+            full_name = f"{namespace}.{name}" if namespace else name
+            named_types.setdefault(name, avro_type)
+            named_types.setdefault(full_name, avro_type)
+            if type_name in ("enum", "fixed") or full_name in visiting:
+                return
+            visiting = visiting | {name, full_name}
+            for field in avro_type.get("fields", []):
+                path = f"{prefix}{field['name']}"
+                yield path, field.get(comment_field_name) or None
+                yield from _avro_fields(
+                    field.get("type"),
+                    f"{path}.",
+                    comment_field_name,
+                    named_types,
+                    visiting,
+                )
+        elif type_name == "array":
+            yield from _avro_fields(
+                avro_type.get("items"),
+                prefix,
+                comment_field_name,
+                named_types,
+                visiting,
+            )
+        elif type_name == "map":
+            yield from _avro_fields(
+                avro_type.get("values"),
+                prefix,
+                comment_field_name,
+                named_types,
+                visiting,
+            )
+        elif isinstance(type_name, (dict, list)):
+            yield from _avro_fields(
+                type_name, prefix, comment_field_name, named_types, visiting
+            )
@@ -0,0 +1,63 @@
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import TypeVar
+
+from loguru import logger
+from pydantic import BaseModel, PrivateAttr
+
+_S = TypeVar("_S", bound="SQLiteStore")
+
+
+class SQLiteStore(BaseModel, ABC):
+    """
+    SQLite Store Interface of the stores kept in a SQLite database.
+    The connection is opened on first use, creating the tables if needed, and closed when
+    leaving the context of the store.
+    """
+
+    path: str
+    _connection: sqlite3.Connection | None = PrivateAttr(default=None)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __enter__(self: _S) -> _S:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
+        self.close()
+
+    @abstractmethod
+    def create_tables(self, connection: sqlite3.Connection) -> None:
+        """
+        Create the tables of the store if they do not exist.
+
+        :param connection: the SQLite connection
+        :return:
+        """
+        pass
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the SQLite connection, the database is created if needed.
+
+        :return: the SQLite connection
+        """
+        with self._lock:
+            if self._connection is None:
+                logger.debug(f"Open the {type(self).__name__} {self.path}")
+                connection = sqlite3.connect(self.path)
+                self.create_tables(connection)
+                self._connection = connection
+            return self._connection
+
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+
+        :return:
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
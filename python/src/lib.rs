@@ -1,9 +1,14 @@
 extern crate pyo3;
 
+mod record_batch;
+
 use ::metadata_guardian::crate_version;
+use ::metadata_guardian::files;
 use ::metadata_guardian::DataRule;
 use ::metadata_guardian::DataRules;
 use ::metadata_guardian::MetadataGuardianError;
+use ::metadata_guardian::MetadataGuardianFileResults;
+use ::metadata_guardian::MetadataGuardianMatches;
 use ::metadata_guardian::MetadataGuardianResults;
 use pyo3::create_exception;
 use pyo3::exceptions::PyException;
@@ -117,47 +122,267 @@ impl RawDataRules {
         })
     }
 
-    /// Validate a list of words using the data rules already defined.
-    pub fn validate_words(&self, words: Vec<String>) -> PyResult<Vec<RawMetadataGuardianResults>> {
-        let words: Vec<&str> = words.iter().map(AsRef::as_ref).collect();
-        let data_rules = self._data_rules.validate_words(words);
-        Ok(data_rules
+    /// Category of the data rules.
+    #[getter]
+    fn category(&self) -> &str {
+        &self._data_rules.category
+    }
+
+    /// Data rules used by the Metadata Guardian.
+    #[getter]
+    fn data_rules(&self) -> Vec<RawDataRule> {
+        self._data_rules
+            .data_rules
             .iter()
-            .map(|metadata_guardian_results| {
-                RawMetadataGuardianResults::from(metadata_guardian_results)
+            .map(|data_rule| RawDataRule {
+                rule_name: data_rule.rule_name.clone(),
+                pattern: data_rule.pattern.clone(),
+                documentation: data_rule.documentation.clone(),
+            })
+            .collect()
+    }
+
+    /// Validate a list of words using the data rules already defined.
+    /// The GIL is released during the validation.
+    pub fn validate_words(
+        &self,
+        py: Python<'_>,
+        words: Vec<String>,
+    ) -> PyResult<Vec<RawMetadataGuardianResults>> {
+        Ok(py.detach(|| {
+            self._data_rules
+                .validate_words(words)
+                .iter()
+                .map(RawMetadataGuardianResults::from)
+                .collect()
+        }))
+    }
+
+    /// Validate a list of words using the data rules already defined.
+    /// The results are returned as a `pyarrow.RecordBatch` with one row by word and matching rule.
+    /// The GIL is released during the validation.
+    pub fn validate_words_arrow(&self, py: Python<'_>, words: Vec<String>) -> PyResult<Py<PyAny>> {
+        let record_batch = py
+            .detach(|| {
+                let matches = self._data_rules.match_words(&words);
+                record_batch::matches_to_record_batch(&self._data_rules, &words, &matches)
+            })
+            .map_err(|error| PyMetadataGuardianError::new_err(error.to_string()))?;
+        record_batch::to_pyarrow(py, record_batch)
+    }
+
+    /// Build the `pyarrow.RecordBatch` of words from the indices of their matching data rules,
+    /// with the columns of `validate_words_arrow`, for the matches computed or cached elsewhere.
+    pub fn record_batch_from_matches(
+        &self,
+        py: Python<'_>,
+        words: Vec<String>,
+        words_matches: Vec<(usize, Vec<usize>)>,
+    ) -> PyResult<Py<PyAny>> {
+        let rules_count = self._data_rules.data_rules.len();
+        if let Some((content_index, _)) =
+            words_matches
+                .iter()
+                .find(|(content_index, data_rules_indices)| {
+                    *content_index >= words.len()
+                        || data_rules_indices.iter().any(|&index| index >= rules_count)
+                })
+        {
+            return Err(PyMetadataGuardianError::new_err(format!(
+                "The matches {content_index} reference a missing word or data rule"
+            )));
+        }
+        let matches: Vec<MetadataGuardianMatches> = words_matches
+            .into_iter()
+            .map(
+                |(content_index, data_rules_indices)| MetadataGuardianMatches {
+                    content_index,
+                    data_rules_indices,
+                },
+            )
+            .collect();
+        let record_batch = py
+            .detach(|| record_batch::matches_to_record_batch(&self._data_rules, &words, &matches))
+            .map_err(|error| PyMetadataGuardianError::new_err(error.to_string()))?;
+        record_batch::to_pyarrow(py, record_batch)
+    }
+
+    /// Validate the strings of a `pyarrow` string array using the data rules already defined.
+    /// The Arrow buffers are read without being copied and the strings are lowercased natively.
+    /// The results are returned as a `pyarrow.RecordBatch` with one row by string and matching
+    /// rule, the row_index column references the string by its index shifted by the row offset.
+    /// The GIL is released during the validation.
+    #[pyo3(signature = (array, row_offset=0))]
+    pub fn validate_arrow(
+        &self,
+        py: Python<'_>,
+        array: &Bound<'_, PyAny>,
+        row_offset: u64,
+    ) -> PyResult<Py<PyAny>> {
+        let array = record_batch::from_pyarrow(array)?;
+        let record_batch = py
+            .detach(|| {
+                let words = record_batch::lowercase_strings(array.as_ref())?;
+                let matches = self._data_rules.match_words(&words);
+                let record_batch =
+                    record_batch::matches_to_record_batch(&self._data_rules, &words, &matches)?;
+                record_batch::with_row_indices(record_batch, &matches, row_offset)
             })
-            .collect())
+            .map_err(|error| PyMetadataGuardianError::new_err(error.to_string()))?;
+        record_batch::to_pyarrow(py, record_batch)
+    }
+
+    /// Get the indices of the data rules matching the words, only the matching words are returned
+    /// with their index in the list of words.
+    /// The GIL is released during the validation.
+    pub fn match_words(&self, py: Python<'_>, words: Vec<String>) -> Vec<(usize, Vec<usize>)> {
+        py.detach(|| {
+            self._data_rules
+                .match_words(&words)
+                .into_iter()
+                .map(|matches| (matches.content_index, matches.data_rules_indices))
+                .collect()
+        })
     }
 
     /// Validate the word using the data rules already defined.
-    pub fn validate_word(&self, word: &str) -> PyResult<RawMetadataGuardianResults> {
-        let metadata_guardian_result = self._data_rules.validate_word(word);
-        Ok(RawMetadataGuardianResults::from(&metadata_guardian_result))
+    /// The GIL is released during the validation.
+    pub fn validate_word(
+        &self,
+        py: Python<'_>,
+        word: String,
+    ) -> PyResult<RawMetadataGuardianResults> {
+        Ok(py.detach(|| RawMetadataGuardianResults::from(&self._data_rules.validate_word(word))))
     }
 
     /// Validate the file content using the data rules already defined.
-    pub fn validate_file(&self, uri: &str) -> PyResult<Vec<RawMetadataGuardianResults>> {
-        let data_rules = self
-            ._data_rules
-            .validate_file(uri)
-            .map_err(PyMetadataGuardianError::from_raw)?;
-        Ok(data_rules
-            .iter()
-            .map(|metadata_guardian_results| {
-                RawMetadataGuardianResults::from(metadata_guardian_results)
-            })
-            .collect())
+    /// The GIL is released during the reading and the validation of the file.
+    pub fn validate_file(
+        &self,
+        py: Python<'_>,
+        uri: String,
+    ) -> PyResult<Vec<RawMetadataGuardianResults>> {
+        py.detach(|| {
+            let data_rules = self
+                ._data_rules
+                .validate_file(&uri)
+                .map_err(PyMetadataGuardianError::from_raw)?;
+            Ok(data_rules
+                .iter()
+                .map(RawMetadataGuardianResults::from)
+                .collect())
+        })
+    }
+
+    /// Validate the file content by memory-mapping the file using the data rules already defined.
+    /// The GIL is released during the reading and the validation of the file.
+    pub fn validate_file_mmap(
+        &self,
+        py: Python<'_>,
+        uri: String,
+    ) -> PyResult<Vec<RawMetadataGuardianResults>> {
+        py.detach(|| {
+            let data_rules = self
+                ._data_rules
+                .validate_file_mmap(&uri)
+                .map_err(PyMetadataGuardianError::from_raw)?;
+            Ok(data_rules
+                .iter()
+                .map(RawMetadataGuardianResults::from)
+                .collect())
+        })
+    }
+
+    /// Validate the content of multiple files using the data rules already defined.
+    /// The GIL is released during the reading and the validation of the files.
+    #[pyo3(signature = (paths, memory_map=false))]
+    pub fn validate_files(
+        &self,
+        py: Python<'_>,
+        paths: Vec<String>,
+        memory_map: bool,
+    ) -> PyResult<Vec<(String, Vec<RawMetadataGuardianResults>)>> {
+        py.detach(|| {
+            let files_results = self
+                ._data_rules
+                .validate_files(&paths, memory_map)
+                .map_err(PyMetadataGuardianError::from_raw)?;
+            Ok(raw_files_results(files_results))
+        })
+    }
+
+    /// Validate the content of the files of a directory using the data rules already defined.
+    /// The GIL is released during the walk of the directory and the validation of the files.
+    #[pyo3(signature = (directory_path, file_names_extension, glob_pattern=None, memory_map=false))]
+    pub fn validate_directory(
+        &self,
+        py: Python<'_>,
+        directory_path: String,
+        file_names_extension: String,
+        glob_pattern: Option<String>,
+        memory_map: bool,
+    ) -> PyResult<Vec<(String, Vec<RawMetadataGuardianResults>)>> {
+        py.detach(|| {
+            let files_results = self
+                ._data_rules
+                .validate_directory(
+                    &directory_path,
+                    &file_names_extension,
+                    glob_pattern.as_deref(),
+                    memory_map,
+                )
+                .map_err(PyMetadataGuardianError::from_raw)?;
+            Ok(raw_files_results(files_results))
+        })
     }
 }
 
+/// Convert the results of the files for the Python binding.
+fn raw_files_results(
+    files_results: Vec<MetadataGuardianFileResults<'_>>,
+) -> Vec<(String, Vec<RawMetadataGuardianResults>)> {
+    files_results
+        .into_iter()
+        .map(|file_results| {
+            let results = file_results
+                .results
+                .iter()
+                .map(RawMetadataGuardianResults::from)
+                .collect();
+            (file_results.path, results)
+        })
+        .collect()
+}
+
 #[pyfunction]
 fn rust_core_version() -> &'static str {
     crate_version()
 }
 
+/// Find the files of a directory with the file name extension and matching the glob pattern.
+/// The GIL is released during the walk of the directory.
+#[pyfunction]
+#[pyo3(signature = (directory_path, file_names_extension, glob_pattern=None))]
+fn find_files(
+    py: Python<'_>,
+    directory_path: String,
+    file_names_extension: String,
+    glob_pattern: Option<String>,
+) -> PyResult<Vec<String>> {
+    py.detach(|| {
+        files::find_files(
+            &directory_path,
+            &file_names_extension,
+            glob_pattern.as_deref(),
+        )
+        .map_err(PyMetadataGuardianError::from_raw)
+    })
+}
+
 #[pymodule]
 fn metadata_guardian(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(rust_core_version, m)?)?;
+    m.add_function(wrap_pyfunction!(find_files, m)?)?;
     m.add_class::<RawDataRule>()?;
     m.add_class::<RawDataRules>()?;
     m.add_class::<RawMetadataGuardianResults>()?;
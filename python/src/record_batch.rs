@@ -0,0 +1,172 @@
+//! Arrow record batches of the Metadata Guardian results exported to `pyarrow`.
+
+use std::borrow::Cow;
+use std::iter;
+use std::sync::Arc;
+
+use ::metadata_guardian::DataRules;
+use ::metadata_guardian::MetadataGuardianMatches;
+use arrow::array::{
+    make_array, Array, ArrayRef, AsArray, DictionaryArray, Int32Array, RecordBatch, StringArray,
+    StructArray, UInt32Array, UInt64Array,
+};
+use arrow::datatypes::{DataType, Field, FieldRef, Int32Type, Schema};
+use arrow::error::ArrowError;
+use arrow::ffi::{from_ffi, to_ffi, FFI_ArrowArray, FFI_ArrowSchema};
+use pyo3::prelude::*;
+
+/// Dictionary type of the category and data rules columns.
+fn dictionary_type() -> DataType {
+    DataType::Dictionary(Box::new(DataType::Int32), Box::new(DataType::Utf8))
+}
+
+/// Build the record batch of the matches, one row by content and matching data rule.
+///
+/// The category, rule name and documentation columns are dictionary encoded: their values are
+/// stored once and every row only references them by index.
+pub(crate) fn matches_to_record_batch<S: AsRef<str>>(
+    data_rules: &DataRules,
+    contents: &[S],
+    matches: &[MetadataGuardianMatches],
+) -> Result<RecordBatch, ArrowError> {
+    let rows_count = matches
+        .iter()
+        .map(|content_matches| content_matches.data_rules_indices.len())
+        .sum();
+    let mut matched_contents = Vec::with_capacity(rows_count);
+    let mut rule_indices = Vec::with_capacity(rows_count);
+    for content_matches in matches {
+        let content = contents[content_matches.content_index].as_ref();
+        for &rule_index in &content_matches.data_rules_indices {
+            matched_contents.push(content);
+            rule_indices.push(rule_index as u32);
+        }
+    }
+    let rule_keys = Int32Array::from_iter_values(rule_indices.iter().map(|&index| index as i32));
+
+    let category: ArrayRef = Arc::new(DictionaryArray::<Int32Type>::try_new(
+        Int32Array::from(vec![0; rows_count]),
+        Arc::new(StringArray::from(vec![data_rules.category.as_str()])),
+    )?);
+    let rule_name: ArrayRef = Arc::new(DictionaryArray::<Int32Type>::try_new(
+        rule_keys.clone(),
+        Arc::new(StringArray::from_iter_values(
+            data_rules
+                .data_rules
+                .iter()
+                .map(|data_rule| data_rule.rule_name.as_str()),
+        )),
+    )?);
+    let documentation: ArrayRef = Arc::new(DictionaryArray::<Int32Type>::try_new(
+        rule_keys,
+        Arc::new(StringArray::from_iter_values(
+            data_rules
+                .data_rules
+                .iter()
+                .map(|data_rule| data_rule.documentation.as_str()),
+        )),
+    )?);
+    let content: ArrayRef = Arc::new(StringArray::from(matched_contents));
+    let rule_index: ArrayRef = Arc::new(UInt32Array::from(rule_indices));
+
+    let schema = Schema::new(vec![
+        Field::new("category", dictionary_type(), false),
+        Field::new("content", DataType::Utf8, false),
+        Field::new("rule_name", dictionary_type(), false),
+        Field::new("documentation", dictionary_type(), false),
+        Field::new("rule_index", DataType::UInt32, false),
+    ]);
+    RecordBatch::try_new(
+        Arc::new(schema),
+        vec![category, content, rule_name, documentation, rule_index],
+    )
+}
+
+/// Append the row index column to the record batch of the matches, one row by content and
+/// matching data rule: the index of the content in the validated array, shifted by the row offset.
+pub(crate) fn with_row_indices(
+    record_batch: RecordBatch,
+    matches: &[MetadataGuardianMatches],
+    row_offset: u64,
+) -> Result<RecordBatch, ArrowError> {
+    let row_index: ArrayRef = Arc::new(UInt64Array::from_iter_values(matches.iter().flat_map(
+        |content_matches| {
+            iter::repeat_n(
+                row_offset + content_matches.content_index as u64,
+                content_matches.data_rules_indices.len(),
+            )
+        },
+    )));
+    let mut fields: Vec<FieldRef> = record_batch.schema().fields().iter().cloned().collect();
+    fields.push(Arc::new(Field::new("row_index", DataType::UInt64, false)));
+    let mut columns = record_batch.columns().to_vec();
+    columns.push(row_index);
+    RecordBatch::try_new(Arc::new(Schema::new(fields)), columns)
+}
+
+/// Lowercase the strings of an Arrow string array, the null strings are empty.
+///
+/// The strings without uppercase characters are borrowed from the Arrow buffers without being
+/// copied, only the other ones are lowercased into new strings.
+pub(crate) fn lowercase_strings(array: &dyn Array) -> Result<Vec<Cow<'_, str>>, ArrowError> {
+    fn lowercase<'a>(strings: impl Iterator<Item = Option<&'a str>>) -> Vec<Cow<'a, str>> {
+        strings
+            .map(|string| match string {
+                Some(string) if string.chars().any(char::is_uppercase) => {
+                    Cow::Owned(string.to_lowercase())
+                }
+                Some(string) => Cow::Borrowed(string),
+                None => Cow::Borrowed(""),
+            })
+            .collect()
+    }
+
+    match array.data_type() {
+        DataType::Utf8 => Ok(lowercase(array.as_string::<i32>().iter())),
+        DataType::LargeUtf8 => Ok(lowercase(array.as_string::<i64>().iter())),
+        DataType::Utf8View => Ok(lowercase(array.as_string_view().iter())),
+        data_type => Err(ArrowError::InvalidArgumentError(format!(
+            "Expected a string array, got an array of {data_type}"
+        ))),
+    }
+}
+
+/// Import a `pyarrow.Array` through the Arrow C data interface.
+///
+/// The buffers are shared with `pyarrow` without being copied, `pyarrow` releases them once the
+/// imported array is dropped.
+pub(crate) fn from_pyarrow(array: &Bound<'_, PyAny>) -> PyResult<ArrayRef> {
+    let mut ffi_array = FFI_ArrowArray::empty();
+    let mut ffi_schema = FFI_ArrowSchema::empty();
+    array.call_method1(
+        "_export_to_c",
+        (
+            &mut ffi_array as *mut FFI_ArrowArray as usize,
+            &mut ffi_schema as *mut FFI_ArrowSchema as usize,
+        ),
+    )?;
+    // SAFETY: `pyarrow` exported a valid array and its schema into the C data interface structs.
+    let data = unsafe { from_ffi(ffi_array, &ffi_schema) }
+        .map_err(|error| crate::PyMetadataGuardianError::new_err(error.to_string()))?;
+    Ok(make_array(data))
+}
+
+/// Export the record batch to a `pyarrow.RecordBatch` through the Arrow C data interface.
+///
+/// The buffers are moved to `pyarrow` without being copied, they are released once the
+/// `pyarrow.RecordBatch` is garbage collected.
+pub(crate) fn to_pyarrow(py: Python<'_>, record_batch: RecordBatch) -> PyResult<Py<PyAny>> {
+    let data = StructArray::from(record_batch).into_data();
+    let (array, schema) = to_ffi(&data)
+        .map_err(|error| crate::PyMetadataGuardianError::new_err(error.to_string()))?;
+    let array = Box::new(array);
+    let schema = Box::new(schema);
+    let record_batch = py.import("pyarrow")?.getattr("RecordBatch")?.call_method1(
+        "_import_from_c",
+        (
+            &*array as *const FFI_ArrowArray as usize,
+            &*schema as *const FFI_ArrowSchema as usize,
+        ),
+    )?;
+    Ok(record_batch.unbind())
+}
@@ -0,0 +1,4 @@
+from typing import Any
+
+create_pool: Any
+DictCursor: Any
@@ -2,3 +2,4 @@ from typing import Any
 
 DeltaTable: Any
 DataCatalog: Any
+Schema: Any
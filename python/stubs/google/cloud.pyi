@@ -1,3 +1,4 @@
 from typing import Any
 
 bigquery: Any
+bigquery_storage: Any
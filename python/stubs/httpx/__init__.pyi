@@ -0,0 +1,4 @@
+from typing import Any
+
+AsyncClient: Any
+Limits: Any
@@ -5,3 +5,4 @@ RawDataRule: Any
 RawMetadataGuardianResults: Any
 MetadataGuardianError: type[Exception]
 rust_core_version: Callable[[], str]
+find_files: Callable[..., list[str]]
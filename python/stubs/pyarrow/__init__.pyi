@@ -6,3 +6,21 @@ cpu_count: Any
 string: Any
 Table: Any
 csv: Any
+RecordBatch: Any
+repeat: Any
+concat_tables: Any
+array: Any
+int32: Any
+uint32: Any
+DictionaryArray: Any
+parquet: Any
+ipc: Any
+dictionary: Any
+Array: Any
+BufferOutputStream: Any
+concat_arrays: Any
+DataType: Any
+types: Any
+ChunkedArray: Any
+NativeFile: Any
+OSFile: Any
@@ -0,0 +1,7 @@
+from typing import Any
+
+utf8_trim_whitespace: Any
+unique: Any
+invert: Any
+is_in: Any
+index_in: Any
@@ -2,3 +2,5 @@ from typing import Any
 
 FileSystem: Any
 LocalFileSystem: Any
+FileType: Any
+FileSelector: Any
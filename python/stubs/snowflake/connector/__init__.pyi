@@ -3,3 +3,4 @@ from typing import Any
 connect: Any
 converter_null: Any
 SnowflakeConnection: Any
+errors: Any
@@ -1,6 +1,13 @@
-from metadata_guardian.cli.external import get_external_source
+import json
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from metadata_guardian.cli.external import get_external_source, sweep
 from metadata_guardian.cli.local import get_local_source
-from metadata_guardian.source import MySQLSource, ParquetSource
+from metadata_guardian.source import GlueSource, MySQLSource, ParquetSource
 
 
 def test_get_external_source_():
@@ -16,6 +23,27 @@ def test_get_external_source_():
     assert source == expected
 
 
+def test_get_external_source_bulk_metadata():
+    source = "AWS Glue"
+    configuration = '{"region_name": "region"}'
+    expected = GlueSource(region_name="region", bulk_metadata=True)
+
+    source = get_external_source(
+        source=source, configuration=configuration, bulk_metadata=True
+    )
+
+    assert source == expected
+
+
+def test_get_external_source_bulk_metadata_not_supported():
+    configuration = '{"uri": "uri"}'
+
+    with pytest.raises(ValueError):
+        get_external_source(
+            source="Delta Table", configuration=configuration, bulk_metadata=True
+        )
+
+
 def test_get_local_source_():
     source = "Parquet"
     path = "path"
@@ -24,3 +52,55 @@ def test_get_local_source_():
     source = get_local_source(source=source, path=path)
 
     assert source == expected
+
+
+@patch("snowflake.connector")
+def test_sweep_should_not_duplicate_the_journaled_results(mock_connection, tmpdir):
+    failing_tables = {"TABLE_2"}
+    mocked_cursor = mock_connection.connect().cursor.return_value
+
+    def fetchall():
+        query = mocked_cursor.execute.call_args[0][0]
+        if query.startswith("SHOW TABLES"):
+            return [("DATABASE", "TABLE_1"), ("DATABASE", "TABLE_2")]
+        table_name = query.split(".")[-1].strip('"')
+        if table_name in failing_tables:
+            raise ConnectionError("connection reset")
+        return [("DATABASE", table_name, "master", "", "", "", "", "", "")]
+
+    mocked_cursor.fetchall.side_effect = fetchall
+    journal_path = str(tmpdir.join("journal.db"))
+    output_path = str(tmpdir.join("results.jsonl"))
+    sweep_arguments = dict(
+        external_source="Snowflake",
+        data_rules_path=os.path.join(
+            os.path.dirname(__file__), "..", "resources", "example_rules.yaml"
+        ),
+        configuration=json.dumps(
+            {
+                "sf_account": "sf_account",
+                "sf_user": "sf_user",
+                "sf_password": "sf_password",
+                "warehouse": "warehouse",
+                "schema_name": "PUBLIC",
+            }
+        ),
+        database_names=["DATABASE"],
+        tasks_limit=1,
+        journal_path=journal_path,
+        output_path=output_path,
+    )
+
+    sweep(**sweep_arguments)
+    failing_tables.clear()
+    sweep(**sweep_arguments)
+
+    with open(output_path) as output_file:
+        assert sorted(json.loads(line)["source"] for line in output_file) == [
+            "DATABASE.TABLE_1",
+            "DATABASE.TABLE_2",
+        ]
+    with sqlite3.connect(journal_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM scanned_tables").fetchone() == (
+            0,
+        )
@@ -1,6 +1,10 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from metadata_guardian.source import AthenaSource, ColumnMetadata, GlueSource
+from metadata_guardian.source.external.aws_source import _prefetch
 
 
 @patch("boto3.client")
@@ -106,3 +110,241 @@ def test_glue_source_get_table_names_list(mock_connection):
     table_name_list = GlueSource().get_table_names_list(database_name=database_name)
 
     assert list(table_name_list) == expected
+
+
+@patch("boto3.client")
+def test_glue_source_get_database_column_names_in_bulk(mock_connection):
+    database_name = "test_database"
+    pages = [
+        {
+            "TableList": [
+                {
+                    "Name": "t1",
+                    "StorageDescriptor": {
+                        "Columns": [
+                            {"Name": "email", "Type": "string", "Comment": "comment"}
+                        ]
+                    },
+                    "PartitionKeys": [{"Name": "country", "Type": "string"}],
+                },
+            ]
+        },
+        {"TableList": [{"Name": "v1"}]},
+    ]
+    mock_connection.return_value = mock_connection
+    mock_connection.get_paginator.return_value.paginate.return_value = iter(pages)
+    expected = [
+        (
+            "t1",
+            [
+                ColumnMetadata(column_name="email", column_comment="comment"),
+                ColumnMetadata(column_name="country"),
+            ],
+        ),
+        ("v1", []),
+    ]
+
+    source = GlueSource(bulk_metadata=True)
+    database_column_names = source.get_database_column_names(
+        database_name=database_name, include_comment=True
+    )
+
+    assert list(database_column_names) == expected
+    assert source.supports_database_column_names()
+    mock_connection.get_paginator.assert_called_once_with("get_tables")
+    mock_connection.get_table.assert_not_called()
+
+
+@patch("boto3.client")
+def test_athena_source_get_database_column_names_in_bulk(mock_connection):
+    database_name = "test_database"
+    pages = [
+        {
+            "TableMetadataList": [
+                {
+                    "Name": "t1",
+                    "Columns": [
+                        {"Name": "email", "Type": "string", "Comment": "comment"}
+                    ],
+                    "PartitionKeys": [{"Name": "country", "Type": "string"}],
+                },
+            ]
+        },
+        {"TableMetadataList": [{"Name": "v1", "Columns": []}]},
+    ]
+    mock_connection.return_value = mock_connection
+    mock_connection.get_paginator.return_value.paginate.return_value = iter(pages)
+    expected = [
+        (
+            "t1",
+            [
+                ColumnMetadata(column_name="email", column_comment="comment"),
+                ColumnMetadata(column_name="country"),
+            ],
+        ),
+        ("v1", []),
+    ]
+
+    source = AthenaSource(s3_staging_dir="s3_test", bulk_metadata=True)
+    database_column_names = source.get_database_column_names(
+        database_name=database_name, include_comment=True
+    )
+
+    assert list(database_column_names) == expected
+    assert source.supports_database_column_names()
+    mock_connection.get_paginator.assert_called_once_with("list_table_metadata")
+    mock_connection.get_paginator.return_value.paginate.assert_called_once_with(
+        CatalogName="AWSDataCatalog",
+        DatabaseName=database_name,
+        PaginationConfig={"PageSize": 50},
+    )
+    mock_connection.get_table_metadata.assert_not_called()
+    assert mock_connection.call_args.kwargs["config"].retries == {
+        "max_attempts": 10,
+        "mode": "adaptive",
+    }
+
+
+def test_prefetch_should_raise_the_errors_of_the_iterable():
+    def pages():
+        yield 1
+        raise KeyboardInterrupt
+
+    iterator = _prefetch(pages(), size=2)
+
+    assert next(iterator) == 1
+    with pytest.raises(KeyboardInterrupt):
+        next(iterator)
+
+
+def async_pages(*pages):
+    async def iterate_pages():
+        for page in pages:
+            yield page
+
+    return iterate_pages()
+
+
+def test_glue_source_acreate_connection_with_adaptive_retries():
+    mock_client = MagicMock()
+    mock_session = MagicMock()
+    mock_session.create_client.return_value.__aenter__ = AsyncMock(
+        return_value=mock_client
+    )
+    source = GlueSource(region_name="eu-west-1", max_attempts=5)
+
+    with (
+        patch(
+            "metadata_guardian.source.external.aws_source.AIOBOTOCORE_INSTALLED", True
+        ),
+        patch(
+            "metadata_guardian.source.external.aws_source.get_session",
+            return_value=mock_session,
+            create=True,
+        ),
+        patch(
+            "metadata_guardian.source.external.aws_source.AioConfig", create=True
+        ) as mock_config,
+    ):
+        asyncio.run(source.acreate_connection())
+
+    assert source._async_connection is mock_client
+    mock_config.assert_called_once_with(
+        max_pool_connections=100, retries={"max_attempts": 5, "mode": "adaptive"}
+    )
+    assert mock_session.create_client.call_args.args == ("glue",)
+    assert mock_session.create_client.call_args.kwargs["config"] is (
+        mock_config.return_value
+    )
+
+
+def test_glue_source_aget_table_names_list_pages():
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = async_pages(
+        {"TableList": [{"Name": "table_1"}, {"Name": "table_2"}]},
+        {"TableList": [{"Name": "table_3"}]},
+    )
+    mock_client.get_table = AsyncMock(
+        return_value={
+            "Table": {
+                "Name": "table_1",
+                "StorageDescriptor": {
+                    "Columns": [{"Name": "address_id", "Comment": "comment"}]
+                },
+                "PartitionKeys": [],
+            }
+        }
+    )
+    source = GlueSource()
+    source._async_connection = mock_client
+
+    with patch(
+        "metadata_guardian.source.external.aws_source.AIOBOTOCORE_INSTALLED", True
+    ):
+        table_names_list = asyncio.run(
+            source.aget_table_names_list(database_name="test_database")
+        )
+        column_names = asyncio.run(
+            source.aget_column_names(
+                database_name="test_database",
+                table_name="table_1",
+                include_comment=True,
+            )
+        )
+
+    assert table_names_list == ["table_1", "table_2", "table_3"]
+    assert column_names == [
+        ColumnMetadata(column_name="address_id", column_comment="comment")
+    ]
+    mock_client.get_paginator.assert_called_once_with("get_tables")
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        DatabaseName="test_database"
+    )
+    mock_client.get_table.assert_awaited_once_with(
+        DatabaseName="test_database", Name="table_1"
+    )
+
+
+def test_athena_source_aget_table_names_list_pages():
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = async_pages(
+        {"TableMetadataList": [{"Name": "table_1"}]},
+        {"TableMetadataList": [{"Name": "table_2"}]},
+    )
+    mock_client.get_table_metadata = AsyncMock(
+        return_value={
+            "TableMetadata": {
+                "Name": "table_1",
+                "Columns": [{"Name": "timestamp", "Comment": "comment"}],
+                "PartitionKeys": [{"Name": "day"}],
+            }
+        }
+    )
+    source = AthenaSource(s3_staging_dir="s3_test")
+    source._async_connection = mock_client
+
+    with patch(
+        "metadata_guardian.source.external.aws_source.AIOBOTOCORE_INSTALLED", True
+    ):
+        table_names_list = asyncio.run(
+            source.aget_table_names_list(database_name="test_database")
+        )
+        column_names = asyncio.run(
+            source.aget_column_names(
+                database_name="test_database",
+                table_name="table_1",
+                include_comment=True,
+            )
+        )
+
+    assert table_names_list == ["table_1", "table_2"]
+    assert column_names == [
+        ColumnMetadata(column_name="timestamp", column_comment="comment"),
+        ColumnMetadata(column_name="day"),
+    ]
+    mock_client.get_paginator.assert_called_once_with("list_table_metadata")
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        CatalogName="AWSDataCatalog",
+        DatabaseName="test_database",
+        PaginationConfig={"PageSize": 50},
+    )
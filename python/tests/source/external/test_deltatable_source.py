@@ -1,9 +1,14 @@
 from unittest.mock import patch
 
-from deltalake import Field, Schema
-from deltalake.schema import PrimitiveType
+import pyarrow
+import pytest
+from deltalake import DeltaTable, Field, Schema, write_deltalake
+from deltalake.schema import ArrayType, MapType, PrimitiveType, StructType
 
 from metadata_guardian.source import ColumnMetadata, DeltaTableSource
+from metadata_guardian.source.external.external_metadata_source import (
+    ExternalMetadataSourceException,
+)
 
 
 @patch("deltalake.DeltaTable")
@@ -40,3 +45,101 @@ def test_deltatable_source_get_column_names(mock_connection):
     column_names = delta_table.get_column_names(include_comment=True)
 
     assert list(column_names) == expected
+
+
+@patch("deltalake.DeltaTable")
+def test_deltatable_source_get_column_names_flatten_nested(mock_connection):
+    uri = "s3://test_table"
+    contact_type = StructType(
+        [Field("email", PrimitiveType("string"), True, {"comment": "email"})]
+    )
+    schema = Schema(
+        fields=[
+            Field("customer", contact_type, True),
+            Field("phones", ArrayType(contact_type), True),
+            Field("addresses", MapType(PrimitiveType("string"), contact_type), True),
+        ],
+    )
+    mock_connection.schema.return_value = schema
+    expected = [
+        ColumnMetadata(column_name="customer"),
+        ColumnMetadata(
+            column_name="customer.email", column_comment="{'comment': 'email'}"
+        ),
+        ColumnMetadata(column_name="phones"),
+        ColumnMetadata(
+            column_name="phones.email", column_comment="{'comment': 'email'}"
+        ),
+        ColumnMetadata(column_name="addresses"),
+        ColumnMetadata(
+            column_name="addresses.email", column_comment="{'comment': 'email'}"
+        ),
+    ]
+
+    delta_table = DeltaTableSource(uri=uri, flatten_nested=True)
+    delta_table._connection = mock_connection
+    column_names = delta_table.get_column_names(include_comment=True)
+
+    assert list(column_names) == expected
+
+
+def test_deltatable_source_discover_tables(tmp_path):
+    table = pyarrow.table({"customer": [{"email": "email"}], "id": [1]})
+    write_deltalake(str(tmp_path / "sales" / "orders"), table)
+    write_deltalake(str(tmp_path / "sales" / "orders"), table, mode="append")
+    DeltaTable(str(tmp_path / "sales" / "orders")).create_checkpoint()
+    write_deltalake(
+        str(tmp_path / "sales" / "orders"),
+        table.append_column("phone", pyarrow.array(["phone"])),
+        mode="overwrite",
+        schema_mode="overwrite",
+    )
+    write_deltalake(str(tmp_path / "users"), table)
+    (tmp_path / "tmp").mkdir()
+    expected = {
+        "sales/orders": [
+            ColumnMetadata(column_name="customer"),
+            ColumnMetadata(column_name="customer.email"),
+            ColumnMetadata(column_name="id"),
+            ColumnMetadata(column_name="phone"),
+        ],
+        "users": [
+            ColumnMetadata(column_name="customer"),
+            ColumnMetadata(column_name="customer.email"),
+            ColumnMetadata(column_name="id"),
+        ],
+    }
+
+    source = DeltaTableSource(
+        uri=str(tmp_path), discover_tables=True, flatten_nested=True
+    )
+    table_names = list(source.get_table_names_list(database_name=None))
+
+    assert {
+        table_name: list(source.get_column_names(table_name=table_name))
+        for table_name in table_names
+    } == expected
+    assert source.get_table_fingerprints(database_name=None) == {
+        "sales/orders": "2",
+        "users": "0",
+    }
+    with patch(
+        "metadata_guardian.source.external.deltatable_source._discover_delta_tables"
+    ) as discover_delta_tables:
+        assert source.get_table_fingerprints(
+            database_name=None, table_names=["users"]
+        ) == {"users": "0"}
+    discover_delta_tables.assert_not_called()
+
+
+def test_deltatable_source_discover_tables_should_reject_the_extra_connection_args(
+    tmp_path,
+):
+    source = DeltaTableSource(
+        uri=str(tmp_path),
+        discover_tables=True,
+        extra_connection_args={"storage_options": {"AWS_REGION": "eu-west-1"}},
+    )
+
+    with pytest.raises(ExternalMetadataSourceException):
+        source.create_connection()
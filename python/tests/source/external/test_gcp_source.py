@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pyarrow
 from google.cloud import bigquery
 
 from metadata_guardian.source import BigQuerySource, ColumnMetadata
@@ -58,3 +59,51 @@ def test_big_query_source_get_table_names_list(mock_connection):
     )
 
     assert list(table_names_list) == expected
+
+
+@patch("google.cloud.bigquery.Client.from_service_account_json")
+def test_big_query_source_get_database_column_names(mock_connection):
+    service_account_json_path = ""
+    dataset_name = "region-us"
+    rows = pyarrow.table(
+        {
+            "table_schema": ["dataset", "dataset", "dataset", "other_dataset"],
+            "table_name": ["customers", "customers", "customers", "users"],
+            "field_path": ["contact", "contact.email", "id", "name"],
+            "description": [None, "the email", None, "the name"],
+        }
+    )
+    mock_connection.return_value = mock_connection
+    mock_connection.query.return_value.result.return_value.to_arrow_iterable.return_value = iter(
+        rows.to_batches(max_chunksize=2)
+    )
+    expected = [
+        (
+            "dataset.customers",
+            [
+                ColumnMetadata(column_name="contact"),
+                ColumnMetadata(column_name="contact.email", column_comment="the email"),
+                ColumnMetadata(column_name="id"),
+            ],
+        ),
+        (
+            "other_dataset.users",
+            [ColumnMetadata(column_name="name", column_comment="the name")],
+        ),
+    ]
+    source = BigQuerySource(
+        service_account_json_path=service_account_json_path, bulk_metadata=True
+    )
+
+    database_column_names = source.get_database_column_names(
+        database_name=dataset_name, include_comment=True
+    )
+
+    assert list(database_column_names) == expected
+    assert source.supports_database_column_names()
+    assert (
+        "`region-us.INFORMATION_SCHEMA.COLUMN_FIELD_PATHS`"
+        in (mock_connection.query.call_args.args[0])
+    )
+    mock_connection.get_table.assert_not_called()
+    mock_connection.query.return_value.result.return_value.to_arrow.assert_not_called()
@@ -1,4 +1,6 @@
-from unittest.mock import patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from confluent_kafka.schema_registry import RegisteredSchema, Schema
 
@@ -7,6 +9,9 @@ from metadata_guardian.source import (
     KafkaSchemaRegistryAuthentication,
     KafkaSchemaRegistrySource,
 )
+from metadata_guardian.source.external.kafka_schema_registry_source import (
+    _schema_fields,
+)
 
 
 @patch("confluent_kafka.schema_registry.SchemaRegistryClient")
@@ -72,3 +77,261 @@ def test_kafka_schema_registry_source_get_table_names_list(mock_connection):
 
     assert list(subjects_list) == expected
     assert source.authenticator == KafkaSchemaRegistryAuthentication.USER_PWD
+
+
+@patch("confluent_kafka.schema_registry.SchemaRegistryClient")
+def test_kafka_schema_registry_source_get_column_names_nested(mock_connection):
+    subject_name = "subject_name"
+    expected = [
+        ColumnMetadata(column_name="email"),
+        ColumnMetadata(column_name="address"),
+        ColumnMetadata(column_name="address.street", column_comment="street"),
+        ColumnMetadata(column_name="phones"),
+        ColumnMetadata(column_name="phones.number"),
+        ColumnMetadata(column_name="contacts"),
+        ColumnMetadata(column_name="contacts.street", column_comment="street"),
+    ]
+
+    source = KafkaSchemaRegistrySource(url="url")
+    schema_str = """{
+        "fields": [
+            {"name": "email", "type": "string"},
+            {
+                "name": "address",
+                "type": [
+                    "null",
+                    {
+                        "fields": [{"name": "street", "type": "string", "doc": "street"}],
+                        "name": "Address",
+                        "type": "record"
+                    }
+                ]
+            },
+            {
+                "name": "phones",
+                "type": {
+                    "items": {
+                        "fields": [{"name": "number", "type": "string"}],
+                        "name": "Phone",
+                        "type": "record"
+                    },
+                    "type": "array"
+                }
+            },
+            {"name": "contacts", "type": {"type": "map", "values": "Address"}}
+        ],
+        "name": "Customer",
+        "type": "record"
+    }"""
+    mock_connection.get_latest_version.return_value = RegisteredSchema(
+        schema_id=1,
+        schema=Schema(schema_str, "AVRO", []),
+        subject=subject_name,
+        version=1,
+        guid="test-guid-123",
+    )
+    source._connection = mock_connection
+
+    column_names = source.get_column_names(
+        database_name=None, table_name=subject_name, include_comment=True
+    )
+
+    assert list(column_names) == expected
+
+
+@patch("confluent_kafka.schema_registry.SchemaRegistryClient")
+def test_kafka_schema_registry_source_get_database_column_names(mock_connection):
+    protobuf_schema_str = """
+        syntax = "proto3";
+        message Customer {
+            string email = 1;
+            repeated Phone phones = 2;
+            message Phone {
+                string number = 1;
+            }
+        }
+    """
+    json_schema_str = """{
+        "definitions": {
+            "Address": {"properties": {"street": {"type": "string"}}, "type": "object"}
+        },
+        "properties": {
+            "name": {"description": "name", "type": "string"},
+            "address": {"$ref": "#/definitions/Address"}
+        },
+        "type": "object"
+    }"""
+    registered_schemas = {
+        "customers-value": RegisteredSchema(
+            schema_id=1,
+            schema=Schema(protobuf_schema_str, "PROTOBUF", []),
+            subject="customers-value",
+            version=1,
+            guid="test-guid-1",
+        ),
+        "customers-copy-value": RegisteredSchema(
+            schema_id=1,
+            schema=Schema(protobuf_schema_str, "PROTOBUF", []),
+            subject="customers-copy-value",
+            version=3,
+            guid="test-guid-1",
+        ),
+        "users-value": RegisteredSchema(
+            schema_id=2,
+            schema=Schema(json_schema_str, "JSON", []),
+            subject="users-value",
+            version=1,
+            guid="test-guid-2",
+        ),
+    }
+    customers_columns = [
+        ColumnMetadata(column_name="email"),
+        ColumnMetadata(column_name="phones"),
+        ColumnMetadata(column_name="phones.number"),
+    ]
+    expected = [
+        ("customers-value", customers_columns),
+        ("customers-copy-value", customers_columns),
+        (
+            "users-value",
+            [
+                ColumnMetadata(column_name="name", column_comment="name"),
+                ColumnMetadata(column_name="address"),
+                ColumnMetadata(column_name="address.street"),
+            ],
+        ),
+    ]
+
+    source = KafkaSchemaRegistrySource(url="url", bulk_metadata=True)
+    mock_connection.get_subjects.return_value = list(registered_schemas)
+    mock_connection.get_latest_version.side_effect = registered_schemas.get
+    source._connection = mock_connection
+
+    with patch(
+        "metadata_guardian.source.external.kafka_schema_registry_source._schema_fields",
+        wraps=_schema_fields,
+    ) as mock_schema_fields:
+        database_column_names = list(
+            source.get_database_column_names(database_name=None, include_comment=True)
+        )
+
+    assert source.supports_database_column_names()
+    assert database_column_names == expected
+    assert mock_schema_fields.call_count == 2
+
+
+def test_schema_fields_protobuf_should_walk_the_maps_oneofs_and_field_options():
+    protobuf_schema_str = """
+        syntax = "proto3";
+        import "validate/validate.proto";
+        message Customer {
+            string email = 1 [(validate.rules).string = {email: true, max_len: 256}];
+            map<string, Address> addresses = 2 [deprecated = true];
+            oneof contact {
+                Phone phone = 3;
+                string fax = 4 [(validate.rules).string = {pattern: "[0-9]+"}];
+            }
+            option (custom.message) = {name: "customer"};
+            message Phone {
+                string number = 1;
+            }
+            string name = 5;
+        }
+        message Address {
+            string street = 1;
+        }
+    """
+
+    assert _schema_fields(protobuf_schema_str, "PROTOBUF", "doc") == [
+        ("email", None),
+        ("addresses", None),
+        ("addresses.street", None),
+        ("phone", None),
+        ("phone.number", None),
+        ("fax", None),
+        ("name", None),
+    ]
+
+
+def test_kafka_schema_registry_source_acreate_connection_with_httpx():
+    mock_httpx = MagicMock()
+    source = KafkaSchemaRegistrySource(
+        url="https://registry",
+        extra_connection_args={
+            "basic.auth.user.info": "user:pass:word",
+            "ssl.ca.location": "ca.pem",
+        },
+        max_connections=10,
+    )
+
+    with (
+        patch(
+            "metadata_guardian.source.external.kafka_schema_registry_source.HTTPX_INSTALLED",
+            True,
+        ),
+        patch(
+            "metadata_guardian.source.external.kafka_schema_registry_source.httpx",
+            mock_httpx,
+            create=True,
+        ),
+    ):
+        asyncio.run(source.acreate_connection())
+        asyncio.run(source.acreate_connection())
+
+    assert source._async_connection is mock_httpx.AsyncClient.return_value
+    mock_httpx.AsyncClient.assert_called_once_with(
+        base_url="https://registry",
+        auth=("user", "pass:word"),
+        cert=None,
+        verify="ca.pem",
+        limits=mock_httpx.Limits.return_value,
+    )
+    mock_httpx.Limits.assert_called_once_with(max_connections=10)
+
+
+def test_kafka_schema_registry_source_aget_column_names_with_httpx():
+    schema_str = json.dumps(
+        {
+            "fields": [
+                {"name": "key", "type": "string"},
+                {"name": "value", "type": "string", "doc": "doc"},
+            ],
+            "name": "test_one",
+            "type": "record",
+        }
+    )
+    responses = {
+        "/subjects": ["test/one"],
+        "/subjects/test%2Fone/versions/latest": {"id": 1, "schema": schema_str},
+    }
+
+    async def get(path):
+        response = MagicMock()
+        response.json.return_value = responses[path]
+        return response
+
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(side_effect=get)
+    source = KafkaSchemaRegistrySource(url="url")
+    source._async_connection = mock_client
+
+    with patch(
+        "metadata_guardian.source.external.kafka_schema_registry_source.HTTPX_INSTALLED",
+        True,
+    ):
+        table_names_list = asyncio.run(source.aget_table_names_list(database_name=None))
+        column_names = asyncio.run(
+            source.aget_column_names(
+                database_name=None, table_name="test/one", include_comment=True
+            )
+        )
+
+    assert table_names_list == ["test/one"]
+    assert column_names == [
+        ColumnMetadata(column_name="key"),
+        ColumnMetadata(column_name="value", column_comment="doc"),
+    ]
+    assert [call_args.args[0] for call_args in mock_client.get.await_args_list] == [
+        "/subjects",
+        "/subjects/test%2Fone/versions/latest",
+    ]
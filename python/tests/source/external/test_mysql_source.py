@@ -1,4 +1,7 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pymysql
 
 from metadata_guardian.source import ColumnMetadata, MySQLAuthenticator, MySQLSource
 
@@ -83,3 +86,169 @@ def test_mysql_source_get_table_names_list(mock_connection):
 
     assert list(table_names) == expected
     assert source.authenticator == MySQLAuthenticator.USER_PWD
+
+
+@patch("pymysql.connect")
+def test_mysql_source_get_database_column_names_in_bulk(mock_connection):
+    database_name = "test"
+    mock_connection.cursor.return_value = mock_connection
+    mock_connection.__iter__.return_value = iter(
+        [
+            {"table_name": "t1", "column_name": "words", "column_comment": "words"},
+            {"table_name": "t1", "column_name": "name", "column_comment": ""},
+            {"table_name": "t2", "column_name": "email", "column_comment": ""},
+        ]
+    )
+    expected = [
+        (
+            "t1",
+            [
+                ColumnMetadata(column_name="words", column_comment="words"),
+                ColumnMetadata(column_name="name"),
+            ],
+        ),
+        ("t2", [ColumnMetadata(column_name="email")]),
+    ]
+
+    source = MySQLSource(
+        host="localhost", user="user", password="password", bulk_metadata=True
+    )
+    source._connection = mock_connection
+
+    database_column_names = source.get_database_column_names(
+        database_name=database_name, include_comment=True
+    )
+
+    assert list(database_column_names) == expected
+    assert source.supports_database_column_names()
+    mock_connection.cursor.assert_called_once_with(pymysql.cursors.SSDictCursor)
+    assert mock_connection.execute.call_args[0][1] == (database_name,)
+    mock_connection.close.assert_called_once()
+
+
+@patch("pymysql.connect")
+def test_mysql_source_aget_column_names_fallback(mock_connection):
+    mock_connection.cursor.return_value = mock_connection
+    mock_connection.fetchall.return_value = [{"Field": "words", "Comment": "words"}]
+    expected = [ColumnMetadata(column_name="words", column_comment="words")]
+
+    source = MySQLSource(host="localhost", user="user", password="password")
+    source._connection = mock_connection
+
+    with patch(
+        "metadata_guardian.source.external.mysql_source.AIOMYSQL_INSTALLED", False
+    ):
+        column_names = asyncio.run(
+            source.aget_column_names(
+                database_name="test", table_name="test_table", include_comment=True
+            )
+        )
+
+    assert column_names == expected
+
+
+def test_mysql_source_aget_column_names_with_pool():
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.fetchall = AsyncMock(
+        return_value=[
+            {"Field": "words", "Comment": "Use column to contain words"},
+            {"Field": "name", "Comment": ""},
+        ]
+    )
+    mock_connection = MagicMock()
+    mock_connection.cursor.return_value.__aenter__.return_value = mock_cursor
+    mock_pool = MagicMock()
+    mock_pool.acquire.return_value.__aenter__.return_value = mock_connection
+    expected = [
+        ColumnMetadata(
+            column_name="words", column_comment="Use column to contain words"
+        ),
+        ColumnMetadata(column_name="name"),
+    ]
+
+    source = MySQLSource(host="localhost", user="user", password="password")
+    source._async_connection = mock_pool
+
+    with patch(
+        "metadata_guardian.source.external.mysql_source.AIOMYSQL_INSTALLED", True
+    ):
+        column_names = asyncio.run(
+            source.aget_column_names(
+                database_name="test", table_name="test_table", include_comment=True
+            )
+        )
+
+    assert column_names == expected
+    mock_cursor.execute.assert_awaited_once_with(
+        "SHOW FULL COLUMNS FROM test.test_table"
+    )
+
+
+def test_mysql_source_acreate_connection_once():
+    mock_pool = MagicMock()
+
+    async def create_pool(**kwargs):
+        await asyncio.sleep(0)
+        return mock_pool
+
+    mock_aiomysql = MagicMock()
+    mock_aiomysql.create_pool = AsyncMock(side_effect=create_pool)
+    source = MySQLSource(host="localhost", user="user", password="password")
+
+    async def acreate_connections():
+        await asyncio.gather(*(source.acreate_connection() for _ in range(8)))
+
+    with (
+        patch(
+            "metadata_guardian.source.external.mysql_source.AIOMYSQL_INSTALLED", True
+        ),
+        patch(
+            "metadata_guardian.source.external.mysql_source.aiomysql",
+            mock_aiomysql,
+            create=True,
+        ),
+    ):
+        asyncio.run(acreate_connections())
+
+    assert source._async_connection is mock_pool
+    mock_aiomysql.create_pool.assert_awaited_once()
+
+
+@patch("pymysql.connect")
+def test_mysql_source_connection_pool(mock_connect):
+    connections = [MagicMock(name=f"connection_{index}") for index in range(3)]
+    for connection in connections:
+        connection.cursor.return_value.fetchall.return_value = [
+            {"Field": "words", "Comment": ""}
+        ]
+    mock_connect.side_effect = connections
+    connections[0].ping.side_effect = pymysql.err.OperationalError()
+
+    source = MySQLSource(
+        host="localhost", user="user", password="password", pool_size=2
+    )
+
+    with source.checkout_connection():
+        first_connection = source._connection
+        with source.checkout_connection():
+            second_connection = source._connection
+    with source.checkout_connection():
+        reused_connection = source._connection
+    with patch(
+        "metadata_guardian.source.external.mysql_source.AIOMYSQL_INSTALLED", False
+    ):
+        column_names = asyncio.run(
+            source.aget_column_names(database_name="test", table_name="test_table")
+        )
+    source.close_connection_pool()
+
+    assert first_connection is connections[0]
+    assert second_connection is connections[1]
+    assert reused_connection is connections[2]
+    assert column_names == [ColumnMetadata(column_name="words")]
+    assert source._connection is None
+    assert mock_connect.call_count == 3
+    connections[0].close.assert_called_once()
+    connections[1].close.assert_called_once()
+    connections[2].close.assert_called_once()
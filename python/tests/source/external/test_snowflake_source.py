@@ -1,5 +1,8 @@
 from unittest.mock import patch
 
+import pyarrow as pa
+
+from metadata_guardian import AvailableCategory, ColumnScanner, DataRules
 from metadata_guardian.source import (
     ColumnMetadata,
     SnowflakeAuthenticator,
@@ -72,3 +75,54 @@ def test_snowflake_source_get_table_names_list(mock_connection):
 
     assert list(table_names) == expected
     assert source.authenticator == SnowflakeAuthenticator.USER_PWD
+
+
+@patch("snowflake.connector")
+def test_snowflake_source_get_database_column_names_in_bulk(mock_connection):
+    database_name = "test_database"
+    mocked_cursor_one = mock_connection.connect().cursor.return_value
+    mocked_cursor_one.fetch_arrow_batches.return_value = iter(
+        [
+            pa.table(
+                {
+                    "TABLE_NAME": ["test_table", "test_table"],
+                    "COLUMN_NAME": ["column1", "master"],
+                    "COMMENT": ["comment1", None],
+                }
+            ),
+            pa.table(
+                {
+                    "TABLE_NAME": ["test_table", "test_table2"],
+                    "COLUMN_NAME": ["column3", "column4"],
+                    "COMMENT": [None, "slave"],
+                }
+            ),
+        ]
+    )
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+        bulk_metadata=True,
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    report = ColumnScanner(data_rules=data_rules).scan_external(
+        source, database_name=database_name, include_comment=True
+    )
+
+    mocked_cursor_one.execute.assert_called_once()
+    assert "INFORMATION_SCHEMA.COLUMNS" in mocked_cursor_one.execute.call_args[0][0]
+    assert mocked_cursor_one.execute.call_args[0][1] == ("PUBLIC",)
+    assert [
+        (
+            report_results.source,
+            [result.content for result in report_results.results],
+        )
+        for report_results in report.report_results
+    ] == [
+        (f"{database_name}.TEST_TABLE", ["master"]),
+        (f"{database_name}.TEST_TABLE2", ["slave"]),
+    ]
@@ -27,3 +27,26 @@ def test_avro_schema_source_namespace(local_file):
     expected = "example.avro"
 
     assert expected == source.namespace
+
+
+@pytest.mark.parametrize(
+    "local_file", ["customers_avro_schema.json"], indirect=["local_file"]
+)
+def test_avro_schema_source_flatten_nested(local_file):
+    source = AvroSchemaSource(local_path=local_file, flatten_nested=True)
+    expected = [
+        ColumnMetadata(column_name="name"),
+        ColumnMetadata(column_name="address"),
+        ColumnMetadata(column_name="address.street"),
+        ColumnMetadata(column_name="phones"),
+        ColumnMetadata(column_name="phones.number"),
+        ColumnMetadata(column_name="addresses"),
+        ColumnMetadata(column_name="addresses.street"),
+        ColumnMetadata(column_name="friend"),
+        ColumnMetadata(column_name="friend.email"),
+        ColumnMetadata(column_name="friend.next"),
+    ]
+
+    column_names = source.get_column_names()
+
+    assert list(column_names) == expected
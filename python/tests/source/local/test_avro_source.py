@@ -1,4 +1,7 @@
 import pytest
+from avro.datafile import DataFileWriter
+from avro.io import DatumWriter
+from avro.schema import parse
 
 from metadata_guardian.source import ColumnMetadata
 from metadata_guardian.source.local.avro_source import AvroSource
@@ -38,3 +41,39 @@ def test_avro_source_attribute_type(local_file):
     field_attribute_type = source.get_field_attribute(attribute_name="type")
 
     assert expected == field_attribute_type
+
+
+@pytest.mark.parametrize(
+    "local_file", ["customers_avro_schema.json"], indirect=["local_file"]
+)
+def test_avro_source_flatten_nested(local_file, tmp_path):
+    avro_file = str(tmp_path / "customers.avro")
+    with open(local_file) as schema_file, open(avro_file, "wb") as file:
+        writer = DataFileWriter(file, DatumWriter(), parse(schema_file.read()))
+        writer.append(
+            {
+                "name": "name",
+                "address": {"street": "street"},
+                "phones": [{"number": "number"}],
+                "addresses": {"home": {"street": "street"}},
+                "friend": {"email": "email", "next": {"email": "email", "next": None}},
+            }
+        )
+        writer.close()
+    source = AvroSource(local_path=avro_file, flatten_nested=True)
+    expected = [
+        ColumnMetadata(column_name="name"),
+        ColumnMetadata(column_name="address"),
+        ColumnMetadata(column_name="address.street"),
+        ColumnMetadata(column_name="phones"),
+        ColumnMetadata(column_name="phones.number"),
+        ColumnMetadata(column_name="addresses"),
+        ColumnMetadata(column_name="addresses.street"),
+        ColumnMetadata(column_name="friend"),
+        ColumnMetadata(column_name="friend.email"),
+        ColumnMetadata(column_name="friend.next"),
+    ]
+
+    column_names = source.get_column_names()
+
+    assert list(column_names) == expected
@@ -25,3 +25,24 @@ def test_orc_source(local_file):
     column_names = source.get_column_names()
 
     assert list(column_names) == expected
+
+
+@pytest.mark.parametrize("local_file", ["example.orc"], indirect=["local_file"])
+def test_orc_source_flatten_nested(local_file):
+    source = ORCSource(local_path=local_file, flatten_nested=True)
+    expected = [
+        ColumnMetadata(column_name="middle"),
+        ColumnMetadata(column_name="middle.list"),
+        ColumnMetadata(column_name="middle.list.int1"),
+        ColumnMetadata(column_name="middle.list.string1"),
+        ColumnMetadata(column_name="list"),
+        ColumnMetadata(column_name="list.int1"),
+        ColumnMetadata(column_name="list.string1"),
+        ColumnMetadata(column_name="map"),
+        ColumnMetadata(column_name="map.int1"),
+        ColumnMetadata(column_name="map.string1"),
+    ]
+
+    column_names = source.get_column_names()
+
+    assert list(column_names)[9:] == expected
@@ -1,3 +1,5 @@
+import pyarrow
+import pyarrow.parquet
 import pytest
 
 from metadata_guardian.source import ColumnMetadata
@@ -18,3 +20,45 @@ def test_parquet_source_column_names(local_file):
     column_names = source.get_column_names()
 
     assert list(column_names) == expected
+
+
+def test_parquet_source_flatten_nested(tmp_path):
+    local_path = str(tmp_path / "customers.parquet")
+    contact_type = pyarrow.struct([("email", pyarrow.string())])
+    table = pyarrow.table(
+        {
+            "customer": pyarrow.array(
+                [{"contact": {"email": "email"}, "phones": [{"number": "0"}]}],
+                type=pyarrow.struct(
+                    [
+                        ("contact", contact_type),
+                        (
+                            "phones",
+                            pyarrow.list_(
+                                pyarrow.struct([("number", pyarrow.string())])
+                            ),
+                        ),
+                    ]
+                ),
+            ),
+            "addresses": pyarrow.array(
+                [[("home", {"email": "email"})]],
+                type=pyarrow.map_(pyarrow.string(), contact_type),
+            ),
+        }
+    )
+    pyarrow.parquet.write_table(table, local_path)
+    source = ParquetSource(local_path=local_path, flatten_nested=True)
+    expected = [
+        ColumnMetadata(column_name="customer"),
+        ColumnMetadata(column_name="customer.contact"),
+        ColumnMetadata(column_name="customer.contact.email"),
+        ColumnMetadata(column_name="customer.phones"),
+        ColumnMetadata(column_name="customer.phones.number"),
+        ColumnMetadata(column_name="addresses"),
+        ColumnMetadata(column_name="addresses.email"),
+    ]
+
+    column_names = source.get_column_names()
+
+    assert list(column_names) == expected
@@ -1,4 +1,4 @@
-from metadata_guardian.source import ColumnMetadata
+from metadata_guardian.source import ColumnMetadata, ColumnRecord
 
 
 def test_column_metadata():
@@ -11,3 +11,21 @@ def test_column_metadata():
     )
 
     assert list(column_metadata.as_list()) == expected
+
+
+def test_column_record():
+    column_name = "Column_Name"
+    column_comment = "Column_Comment"
+    expected = ["column_name", "column_comment"]
+
+    column_record = ColumnRecord(column_name=column_name, column_comment=column_comment)
+    column_metadata = ColumnMetadata(
+        column_name=column_name, column_comment=column_comment
+    )
+
+    assert list(column_record.as_list()) == expected
+    assert list(ColumnRecord(column_name=column_name).as_list()) == ["column_name"]
+    assert column_record == column_metadata
+    assert [column_metadata] == [column_record]
+    assert column_record != ColumnRecord(column_name=column_name)
+    assert column_record.to_column_metadata() == column_metadata
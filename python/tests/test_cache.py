@@ -0,0 +1,216 @@
+import os
+from unittest.mock import patch
+
+from metadata_guardian import (
+    AvailableCategory,
+    ContentFilesCache,
+    DataRule,
+    DataRules,
+    MetadataGuardianResults,
+    WordsMatchesCache,
+)
+from metadata_guardian.cache import _hash_file_content
+
+
+def get_results() -> list[MetadataGuardianResults]:
+    return [
+        MetadataGuardianResults(
+            category="category",
+            content="content",
+            data_rules=[
+                DataRule(
+                    rule_name="rule_name",
+                    regex_pattern="pattern",
+                    documentation="documentation",
+                )
+            ],
+        )
+    ]
+
+
+def test_content_files_cache_should_reuse_unchanged_files(tmpdir):
+    file_path = str(tmpdir.join("file.txt"))
+    with open(file_path, "w") as file:
+        file.write("content")
+    results = get_results()
+
+    with ContentFilesCache(path=str(tmpdir.join("cache.db"))) as cache:
+        cache.set_results(
+            files_results={file_path: results},
+            files_fingerprints=cache.get_fingerprints(file_paths=[file_path]),
+            rules_fingerprint="fingerprint",
+        )
+
+        assert cache.get_results(
+            file_paths=[file_path], rules_fingerprint="fingerprint"
+        ) == {file_path: results}
+        assert (
+            cache.get_results(
+                file_paths=[file_path], rules_fingerprint="other_fingerprint"
+            )
+            == {}
+        )
+
+
+def test_content_files_cache_should_compare_content_when_modification_time_changed(
+    tmpdir,
+):
+    file_path = str(tmpdir.join("file.txt"))
+    with open(file_path, "w") as file:
+        file.write("content")
+    results = get_results()
+
+    with ContentFilesCache(path=str(tmpdir.join("cache.db"))) as cache:
+        cache.set_results(
+            files_results={file_path: results},
+            files_fingerprints=cache.get_fingerprints(file_paths=[file_path]),
+            rules_fingerprint="fingerprint",
+        )
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert (
+            cache.get_results(file_paths=[file_path], rules_fingerprint="fingerprint")
+            == {}
+        )
+
+        cache.set_results(
+            files_results={file_path: results},
+            files_fingerprints=cache.get_fingerprints(file_paths=[file_path]),
+            rules_fingerprint="fingerprint",
+        )
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+
+        assert cache.get_results(
+            file_paths=[file_path], rules_fingerprint="fingerprint"
+        ) == {file_path: results}
+
+        with open(file_path, "w") as file:
+            file.write("changed")
+
+        assert (
+            cache.get_results(file_paths=[file_path], rules_fingerprint="fingerprint")
+            == {}
+        )
+
+
+def test_content_files_cache_should_only_hash_the_files_with_the_same_size(tmpdir):
+    file_path = str(tmpdir.join("file.txt"))
+    with open(file_path, "w") as file:
+        file.write("content")
+    results = get_results()
+
+    with (
+        ContentFilesCache(path=str(tmpdir.join("cache.db"))) as cache,
+        patch(
+            "metadata_guardian.cache._hash_file_content",
+            wraps=_hash_file_content,
+        ) as hash_file_content,
+    ):
+        cache.set_results(
+            files_results={file_path: results},
+            files_fingerprints=cache.get_fingerprints(file_paths=[file_path]),
+            rules_fingerprint="fingerprint",
+        )
+        with open(file_path, "w") as file:
+            file.write("changed content")
+        cache.get_results(file_paths=[file_path], rules_fingerprint="fingerprint")
+        cache.set_results(
+            files_results={file_path: results},
+            files_fingerprints=cache.get_fingerprints(file_paths=[file_path]),
+            rules_fingerprint="fingerprint",
+        )
+
+        assert hash_file_content.call_count == 0
+
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cache.get_results(file_paths=[file_path], rules_fingerprint="fingerprint")
+        cache.get_fingerprints(file_paths=[file_path])
+
+        assert hash_file_content.call_count == 1
+
+
+def test_content_files_cache_should_keep_the_fingerprint_taken_before_the_scan(
+    tmpdir,
+):
+    file_path = str(tmpdir.join("file.txt"))
+    deleted_file_path = str(tmpdir.join("deleted.txt"))
+    for path in (file_path, deleted_file_path):
+        with open(path, "w") as file:
+            file.write("content")
+    results = get_results()
+
+    with ContentFilesCache(path=str(tmpdir.join("cache.db"))) as cache:
+        files_fingerprints = cache.get_fingerprints(
+            file_paths=[file_path, deleted_file_path, str(tmpdir.join("missing.txt"))]
+        )
+        with open(file_path, "w") as file:
+            file.write("modified during the scan")
+        cache.set_results(
+            files_results={file_path: results, deleted_file_path: results},
+            files_fingerprints=files_fingerprints,
+            rules_fingerprint="fingerprint",
+        )
+        os.remove(deleted_file_path)
+
+        assert set(files_fingerprints) == {file_path, deleted_file_path}
+        assert (
+            cache.get_results(
+                file_paths=[file_path, deleted_file_path],
+                rules_fingerprint="fingerprint",
+            )
+            == {}
+        )
+
+
+def test_words_matches_cache_should_validate_each_word_once():
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+    words_cache = WordsMatchesCache(max_size=3)
+    words = ["id", "email", "created_at", "email"]
+
+    with patch.object(
+        DataRules, "match_words", autospec=True, side_effect=DataRules.match_words
+    ) as match_words:
+        results = words_cache.validate_words(data_rules=data_rules, words=words)
+        other_results = words_cache.validate_words(data_rules=data_rules, words=words)
+
+    assert results == data_rules.validate_words(words=words)
+    assert other_results == results
+    match_words.assert_called_once_with(data_rules, words=["id", "email", "created_at"])
+    assert (words_cache.hits, words_cache.misses, words_cache.evictions) == (3, 3, 0)
+    record_batch = words_cache.validate_words_arrow(data_rules=data_rules, words=words)
+    assert record_batch.equals(data_rules.validate_words_arrow(words=words))
+
+    words_cache.validate_words(data_rules=data_rules, words=["user_id"])
+    assert len(words_cache) == 3
+    assert words_cache.evictions == 1
+
+
+def test_cached_record_batches_should_be_the_validate_words_arrow_batches():
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+    words_batch = [["id", "email", "created_at"], [], ["email", "phone", "address"]]
+    words_cache = WordsMatchesCache()
+
+    cached_record_batches = [
+        words_cache.validate_words_arrow(data_rules=data_rules, words=words)
+        for words in words_batch
+    ]
+    batched_record_batches = [
+        data_rules.record_batch_from_matches(words=words, words_matches=words_matches)
+        for words, words_matches in zip(
+            words_batch, data_rules.match_words_batch(words_batch=words_batch)
+        )
+    ]
+
+    for words, cached_record_batch, batched_record_batch in zip(
+        words_batch, cached_record_batches, batched_record_batches
+    ):
+        expected = data_rules.validate_words_arrow(words=words)
+        assert cached_record_batch.schema.equals(expected.schema)
+        assert batched_record_batch.schema.equals(expected.schema)
+        assert cached_record_batch.to_pydict() == expected.to_pydict()
+        assert batched_record_batch.to_pydict() == expected.to_pydict()
+        assert cached_record_batch.equals(expected)
+        assert batched_record_batch.equals(expected)
+    assert cached_record_batches[2].num_rows > 0
@@ -1,3 +1,4 @@
+import pyarrow
 import pytest
 
 from metadata_guardian.data_rules import AvailableCategory, DataRules
@@ -74,3 +75,88 @@ def test_get_data_rules_from_category_inclusion_violation_content(local_file):
         "history. Prefer describing a hierarchical relationship between nodes more precisely. Prefer using\n"
         "leader/follower, primary/replica or primary/standby.\n"
     )
+
+
+@pytest.mark.parametrize(
+    "local_file", ["inclusion_violation.txt"], indirect=["local_file"]
+)
+def test_get_data_rules_from_category_inclusion_violation_content_memory_map(
+    local_file,
+):
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    content_files_scanner = ContentFilesScanner(data_rules=data_rules)
+
+    md_results = content_files_scanner.scan_local_file(local_file, memory_map=True)
+
+    assert md_results == content_files_scanner.scan_local_file(local_file)
+    assert len(md_results.report_results[0].results) == 1
+    result = md_results.report_results[0].results[0]
+    assert (
+        result.content
+        == "feudal age in that they were not bound to the soil but to the master."
+    )
+    assert result.data_rules[0].rule_name == "master"
+
+
+@pytest.mark.parametrize(
+    "local_file", ["users_avro_schema.json"], indirect=["local_file"]
+)
+def test_get_data_rules_from_category_pii_with_violation_arrow_results(local_file):
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+    source = AvroSchemaSource(local_path=local_file)
+
+    md_results = ColumnScanner(data_rules=data_rules, arrow_results=True).scan_local(
+        source=source
+    )
+
+    record_batch = md_results.report_results[0].record_batch
+    assert record_batch.num_rows == 1
+    assert record_batch.schema.field("rule_name").type.value_type == "string"
+    row = record_batch.to_pylist()[0]
+    assert row["content"] == "name"
+    assert row["category"] == "PII"
+    assert row["rule_name"] == "person"
+    assert (
+        row["documentation"] == "The person is a personal identifiable information.\n"
+    )
+    assert data_rules.validate_words(words=["name"])[0].data_rules[0].rule_name == (
+        data_rules._data_rules.data_rules[row["rule_index"]].rule_name
+    )
+
+
+def test_data_rules_validate_arrow():
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+    column_names = pyarrow.chunked_array([["ID", "Email"], [None, "address", "email"]])
+    table_ids = pyarrow.array([0, 0, 1, 1, 2], type=pyarrow.int32())
+
+    record_batch = data_rules.validate_arrow(column_names, table_ids=table_ids)
+
+    rows = record_batch.select(["content", "row_index", "table_id"]).to_pylist()
+    assert {row["row_index"] for row in rows} == {1, 3, 4}
+    assert {(row["content"], row["row_index"], row["table_id"]) for row in rows} == {
+        ("email", 1, 0),
+        ("address", 3, 1),
+        ("email", 4, 2),
+    }
+    assert (
+        record_batch.schema.names[:5]
+        == data_rules.validate_words_arrow(words=["email"]).schema.names
+    )
+
+
+def test_data_rules_fingerprint():
+    data_rules = DataRules.from_available_category(category=AvailableCategory.PII)
+
+    fingerprint = data_rules.fingerprint()
+
+    assert data_rules.fingerprint() == fingerprint
+    assert (
+        DataRules.from_available_category(category=AvailableCategory.PII).fingerprint()
+        == fingerprint
+    )
+    assert (
+        DataRules.from_available_category(
+            category=AvailableCategory.INCLUSION
+        ).fingerprint()
+        != fingerprint
+    )
@@ -0,0 +1,379 @@
+import asyncio
+from unittest.mock import patch
+
+from metadata_guardian import (
+    AvailableCategory,
+    ColumnScanner,
+    DataRules,
+    ReportResults,
+    ScanJournal,
+    TablesStateStore,
+)
+from metadata_guardian.source import MySQLSource, SnowflakeSource
+
+
+def test_scan_journal_should_record_report_results(tmpdir):
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    report_results = [
+        ReportResults(
+            source="database.table",
+            results=data_rules.validate_words(words=["master"]),
+        ),
+        ReportResults(
+            source="database.arrow_table",
+            record_batch=data_rules.validate_words_arrow(words=["master"]),
+        ),
+    ]
+
+    with ScanJournal(path=str(tmpdir.join("journal.db"))) as journal:
+        journal.add_report_results(
+            source_identity="Snowflake:account",
+            database_name="database",
+            report_results=report_results,
+            scan_fingerprint="fingerprint",
+        )
+        recorded_results = journal.get_report_results(
+            source_identity="Snowflake:account",
+            sources=["database.table", "database.arrow_table", "database.other"],
+            scan_fingerprint="fingerprint",
+        )
+        other_rules_results = journal.get_report_results(
+            source_identity="Snowflake:account",
+            sources=["database.table"],
+            scan_fingerprint="other_fingerprint",
+        )
+        other_source_results = journal.get_report_results(
+            source_identity="Snowflake:other_account",
+            sources=["database.table"],
+            scan_fingerprint="fingerprint",
+        )
+
+    assert list(recorded_results) == ["database.table", "database.arrow_table"]
+    assert recorded_results["database.table"] == report_results[0]
+    assert recorded_results["database.arrow_table"].record_batch.equals(
+        report_results[1].record_batch
+    )
+    assert other_rules_results == {}
+    assert other_source_results == {}
+
+
+def test_scan_journal_should_only_clear_the_finished_scan(tmpdir):
+    def add_report_results(journal, source_identity, database_name, table_names):
+        journal.add_report_results(
+            source_identity=source_identity,
+            database_name=database_name,
+            report_results=[
+                ReportResults(source=f"{database_name}.{table_name}", results=[])
+                for table_name in table_names
+            ],
+            scan_fingerprint="fingerprint",
+        )
+
+    def recorded_sources(journal, source_identity, sources):
+        return list(
+            journal.get_report_results(
+                source_identity=source_identity,
+                sources=sources,
+                scan_fingerprint="fingerprint",
+            )
+        )
+
+    with ScanJournal(path=str(tmpdir.join("journal.db"))) as journal:
+        add_report_results(journal, "MySQL:first", "database", ["t1", "t2"])
+        add_report_results(journal, "MySQL:first", "other_database", ["t1"])
+        add_report_results(journal, "MySQL:second", "database", ["t1"])
+        journal.clear(
+            source_identity="MySQL:first",
+            database_name="database",
+            sources=["database.t1"],
+        )
+        first_sources_after_table_scan = recorded_sources(
+            journal, "MySQL:first", ["database.t1", "database.t2", "other_database.t1"]
+        )
+        journal.clear(source_identity="MySQL:first", database_name="database")
+        first_sources_after_database_scan = recorded_sources(
+            journal, "MySQL:first", ["database.t1", "database.t2", "other_database.t1"]
+        )
+        second_sources = recorded_sources(journal, "MySQL:second", ["database.t1"])
+
+    assert first_sources_after_table_scan == ["database.t2", "other_database.t1"]
+    assert first_sources_after_database_scan == ["other_database.t1"]
+    assert second_sources == ["database.t1"]
+
+
+@patch("snowflake.connector")
+def test_column_scanner_should_resume_from_the_journal(mock_connection, tmpdir):
+    database_name = "DATABASE"
+    failing_tables = {"TABLE_2"}
+    mocked_cursor = mock_connection.connect().cursor.return_value
+
+    def fetchall():
+        query = mocked_cursor.execute.call_args[0][0]
+        if query.startswith("SHOW TABLES"):
+            return [(database_name, "TABLE_1"), (database_name, "TABLE_2")]
+        table_name = query.split(".")[-1].strip('"')
+        if table_name in failing_tables:
+            raise ConnectionError("connection reset")
+        return [(database_name, table_name, "master", "", "", "", "", "", "")]
+
+    mocked_cursor.fetchall.side_effect = fetchall
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+        pool_size=1,
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with ScanJournal(path=str(tmpdir.join("journal.db"))) as journal:
+        column_scanner = ColumnScanner(
+            data_rules=data_rules, journal=journal, retries=1, retry_backoff=0
+        )
+        report = asyncio.run(
+            column_scanner.scan_external_async(
+                source=source, database_name=database_name
+            )
+        )
+        sources = [f"{database_name}.TABLE_1", f"{database_name}.TABLE_2"]
+        recorded_sources = list(
+            journal.get_report_results(
+                source_identity=source.identity(),
+                sources=sources,
+                scan_fingerprint=f"{data_rules.fingerprint()}:False",
+            )
+        )
+        with_comments_results = journal.get_report_results(
+            source_identity=source.identity(),
+            sources=sources,
+            scan_fingerprint=f"{data_rules.fingerprint()}:True",
+        )
+        failing_tables.clear()
+        mocked_cursor.execute.reset_mock()
+        resumed_report = asyncio.run(
+            column_scanner.scan_external_async(
+                source=source, database_name=database_name
+            )
+        )
+        cleared_results = journal.get_report_results(
+            source_identity=source.identity(),
+            sources=sources,
+            scan_fingerprint=f"{data_rules.fingerprint()}:False",
+        )
+
+    assert [report_results.source for report_results in report.report_results] == [
+        f"{database_name}.TABLE_1"
+    ]
+    assert list(report.failed_sources) == [f"{database_name}.TABLE_2"]
+    assert recorded_sources == [f"{database_name}.TABLE_1"]
+    assert with_comments_results == {}
+    assert cleared_results == {}
+    assert [
+        report_results.source for report_results in resumed_report.report_results
+    ] == [f"{database_name}.TABLE_1", f"{database_name}.TABLE_2"]
+    assert resumed_report.failed_sources == {}
+    assert resumed_report.report_results[0] == report.report_results[0]
+    assert [
+        call_args[0][0]
+        for call_args in mocked_cursor.execute.call_args_list
+        if call_args[0][0].startswith("SHOW COLUMNS")
+    ] == [f'SHOW COLUMNS IN "{database_name}"."PUBLIC"."TABLE_2"']
+
+
+@patch("snowflake.connector")
+def test_column_scanner_should_only_rescan_the_changed_tables(mock_connection, tmpdir):
+    database_name = "DATABASE"
+    tables_versions = {"TABLE_1": "2024-01-01", "TABLE_2": "2024-01-01"}
+    mocked_cursor = mock_connection.connect().cursor.return_value
+
+    def fetchall():
+        query = mocked_cursor.execute.call_args[0][0]
+        if query.startswith("SHOW TABLES"):
+            return [(database_name, table_name) for table_name in tables_versions]
+        if "INFORMATION_SCHEMA.TABLES" in query:
+            return list(tables_versions.items())
+        table_name = query.split(".")[-1].strip('"')
+        return [(database_name, table_name, "master", "", "", "", "", "", "")]
+
+    mocked_cursor.fetchall.side_effect = fetchall
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with TablesStateStore(path=str(tmpdir.join("state.db"))) as state_store:
+        column_scanner = ColumnScanner(data_rules=data_rules, state_store=state_store)
+        report = column_scanner.scan_external(
+            source=source, database_name=database_name
+        )
+        tables_versions["TABLE_2"] = "2024-01-02"
+        mocked_cursor.execute.reset_mock()
+        incremental_report = column_scanner.scan_external(
+            source=source, database_name=database_name
+        )
+
+    assert incremental_report == report
+    assert [
+        call_args[0][0]
+        for call_args in mocked_cursor.execute.call_args_list
+        if call_args[0][0].startswith("SHOW COLUMNS")
+    ] == [f'SHOW COLUMNS IN "{database_name}"."PUBLIC"."TABLE_2"']
+
+
+@patch("snowflake.connector")
+def test_column_scanner_should_only_fingerprint_the_scanned_table(
+    mock_connection, tmpdir
+):
+    database_name = "DATABASE"
+    tables_versions = {"TABLE_1": "2024-01-01", "TABLE_2": "2024-01-01"}
+    mocked_cursor = mock_connection.connect().cursor.return_value
+
+    def fetchall():
+        query = mocked_cursor.execute.call_args[0][0]
+        if "INFORMATION_SCHEMA.TABLES" in query:
+            return list(tables_versions.items())
+        table_name = query.split(".")[-1].strip('"')
+        return [(database_name, table_name, "master", "", "", "", "", "", "")]
+
+    mocked_cursor.fetchall.side_effect = fetchall
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with TablesStateStore(path=str(tmpdir.join("state.db"))) as state_store:
+        column_scanner = ColumnScanner(data_rules=data_rules, state_store=state_store)
+        report = column_scanner.scan_external(
+            source=source, database_name=database_name, table_name="TABLE_2"
+        )
+        fingerprints_calls = [
+            call_args[0]
+            for call_args in mocked_cursor.execute.call_args_list
+            if "INFORMATION_SCHEMA.TABLES" in call_args[0][0]
+        ]
+        assert state_store.get_report_results(
+            source_identity=source.identity(),
+            tables_fingerprints={f"{database_name}.TABLE_2": "2024-01-01"},
+            scan_fingerprint=f"{data_rules.fingerprint()}:False",
+        ) == {f"{database_name}.TABLE_2": report.report_results[0]}
+
+    assert [report_results.source for report_results in report.report_results] == [
+        f"{database_name}.TABLE_2"
+    ]
+    assert len(fingerprints_calls) == 1
+    assert fingerprints_calls[0][0].endswith(" AND TABLE_NAME = %s")
+    assert fingerprints_calls[0][1] == ("PUBLIC", "TABLE_2")
+
+
+@patch("pymysql.connect")
+def test_column_scanner_should_reuse_the_results_of_the_same_columns(
+    mock_connection, tmpdir
+):
+    mock_connection.return_value = mock_connection
+    mock_connection.cursor.return_value = mock_connection
+    mock_connection.fetchall.side_effect = [
+        [{"Tables_in_test": "t1"}],
+        [{"Field": "master", "Comment": ""}],
+        [{"Tables_in_test": "t1"}],
+        [{"Field": "master", "Comment": ""}],
+    ]
+    source = MySQLSource(host="localhost", user="user", password="password")
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with TablesStateStore(path=str(tmpdir.join("state.db"))) as state_store:
+        column_scanner = ColumnScanner(data_rules=data_rules, state_store=state_store)
+        report = column_scanner.scan_external(source=source, database_name="test")
+        with patch.object(DataRules, "validate_words") as validate_words:
+            incremental_report = column_scanner.scan_external(
+                source=source, database_name="test"
+            )
+
+    validate_words.assert_not_called()
+    assert incremental_report == report
+    assert report.report_results[0].results == data_rules.validate_words(["master"])
+
+
+def test_tables_state_store_should_key_the_tables_by_source_identity(tmpdir):
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    report_results = [
+        ReportResults(
+            source="database.table",
+            results=data_rules.validate_words(words=["master"]),
+        ),
+        ReportResults(source="database.dropped_table", results=[]),
+    ]
+    other_report_results = [ReportResults(source="database.table", results=[])]
+    tables_fingerprints = {
+        "database.table": "version",
+        "database.dropped_table": "version",
+    }
+
+    with TablesStateStore(path=str(tmpdir.join("state.db"))) as state_store:
+        state_store.set_report_results(
+            source_identity="Snowflake:account",
+            database_name="database",
+            report_results=report_results,
+            tables_fingerprints=tables_fingerprints,
+            scan_fingerprint="fingerprint",
+        )
+        state_store.set_report_results(
+            source_identity="Snowflake:other_account",
+            database_name="database",
+            report_results=other_report_results,
+            tables_fingerprints=tables_fingerprints,
+            scan_fingerprint="fingerprint",
+        )
+        state_store.prune_tables(
+            source_identity="Snowflake:account",
+            database_name="database",
+            sources={"database.table"},
+        )
+        stored_results = state_store.get_report_results(
+            source_identity="Snowflake:account",
+            tables_fingerprints=tables_fingerprints,
+            scan_fingerprint="fingerprint",
+        )
+        other_stored_results = state_store.get_report_results(
+            source_identity="Snowflake:other_account",
+            tables_fingerprints=tables_fingerprints,
+            scan_fingerprint="fingerprint",
+        )
+
+    assert stored_results == {"database.table": report_results[0]}
+    assert other_stored_results == {"database.table": other_report_results[0]}
+
+
+@patch("pymysql.connect")
+def test_column_scanner_should_prune_the_dropped_tables(mock_connection, tmpdir):
+    mock_connection.return_value = mock_connection
+    mock_connection.cursor.return_value = mock_connection
+    mock_connection.fetchall.side_effect = [
+        [{"Tables_in_test": "t1"}, {"Tables_in_test": "t2"}],
+        [{"Field": "master", "Comment": ""}],
+        [{"Field": "slave", "Comment": ""}],
+        [{"Tables_in_test": "t1"}],
+        [{"Field": "master", "Comment": ""}],
+    ]
+    source = MySQLSource(
+        host="localhost", user="user", password="password", source_id="localhost"
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with TablesStateStore(path=str(tmpdir.join("state.db"))) as state_store:
+        column_scanner = ColumnScanner(data_rules=data_rules, state_store=state_store)
+        column_scanner.scan_external(source=source, database_name="test")
+        column_scanner.scan_external(source=source, database_name="test")
+        stored_sources = state_store.connection.execute(
+            "SELECT source_identity, source FROM tables_state"
+        ).fetchall()
+
+    assert stored_sources == [("MySQL:localhost", "test.t1")]
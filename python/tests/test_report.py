@@ -1,9 +1,18 @@
+import json
+import os
+
 import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
 
 from metadata_guardian import (
+    ArrowIpcReportSink,
+    CsvReportSink,
     DataRule,
+    JsonLinesReportSink,
     MetadataGuardianReport,
     MetadataGuardianResults,
+    ParquetReportSink,
     ReportResults,
 )
 
@@ -69,3 +78,201 @@ def test_report_append_results_and_generate_csv_should_be_ok(tmpdir):
     assert report.report_results[1].results[0].category == second_category
     assert report.report_results[0].results[0].content == content
     assert report.report_results[1].results[0].content == second_content
+
+
+def test_report_with_record_batch_results_generate_csv_should_be_ok(tmpdir):
+    csv_file = tmpdir.mkdir("test").join("results.csv")
+    rules = pa.array(["rule_name", "rule_name_2"])
+    record_batch = pa.RecordBatch.from_arrays(
+        [
+            pa.DictionaryArray.from_arrays(pa.array([0, 0], pa.int32()), ["category"]),
+            pa.array(["content ", "content_2"]),
+            pa.DictionaryArray.from_arrays(pa.array([1, 0], pa.int32()), rules),
+            pa.DictionaryArray.from_arrays(
+                pa.array([1, 0], pa.int32()), ["documentation", "documentation_2"]
+            ),
+            pa.array([1, 0], pa.uint32()),
+        ],
+        names=["category", "content", "rule_name", "documentation", "rule_index"],
+    )
+    report = MetadataGuardianReport(
+        report_results=[
+            ReportResults(
+                source="source1",
+                results=[
+                    MetadataGuardianResults(
+                        category="other_category",
+                        content="other_content",
+                        data_rules=[
+                            DataRule(
+                                rule_name="other_rule",
+                                regex_pattern="pattern",
+                                documentation="other_documentation",
+                            )
+                        ],
+                    )
+                ],
+            ),
+            ReportResults(source="source2", record_batch=record_batch),
+        ]
+    )
+
+    report.to_csv(csv_file)
+    csv_table = pa.csv.read_csv(csv_file)
+
+    assert csv_table.column("source").to_pylist() == ["source1", "source2", "source2"]
+    assert csv_table.column("content").to_pylist() == [
+        "other_content",
+        "content",
+        "content_2",
+    ]
+    assert csv_table.column("name").to_pylist() == [
+        "other_rule",
+        "rule_name_2",
+        "rule_name",
+    ]
+    assert csv_table.column("documentation")[1].as_py() == "documentation_2"
+
+
+def test_report_sinks_write_results_incrementally(tmpdir):
+    directory = tmpdir.mkdir("test")
+    report_results = [
+        ReportResults(
+            source=f"source{index}",
+            results=[
+                MetadataGuardianResults(
+                    category="category",
+                    content=f"content{index}",
+                    data_rules=[
+                        DataRule(
+                            rule_name="rule_name",
+                            regex_pattern="pattern",
+                            documentation="documentation",
+                        )
+                    ],
+                )
+            ],
+        )
+        for index in range(3)
+    ]
+    report = MetadataGuardianReport()
+    csv_sink = CsvReportSink(path=str(directory.join("results.csv")))
+    json_lines_sink = JsonLinesReportSink(path=str(directory.join("results.jsonl")))
+    parquet_sink = ParquetReportSink(path=str(directory.join("results.parquet")))
+
+    for sink in (report, csv_sink, json_lines_sink, parquet_sink):
+        with sink:
+            sink.write(ReportResults(source="empty"))
+            for results in report_results:
+                sink.write(results)
+
+    expected = report.to_arrow()
+    assert expected.column("source").to_pylist() == ["source0", "source1", "source2"]
+    assert pa.csv.read_csv(csv_sink.path).equals(expected)
+    assert pq.read_table(parquet_sink.path).cast(expected.schema).equals(expected)
+    with open(json_lines_sink.path) as file:
+        assert [json.loads(line) for line in file] == expected.to_pylist()
+
+
+def test_report_sinks_sync_should_write_the_buffered_results(tmpdir):
+    directory = tmpdir.mkdir("test")
+    results = ReportResults(
+        source="source",
+        results=[
+            MetadataGuardianResults(
+                category="category",
+                content="content",
+                data_rules=[
+                    DataRule(
+                        rule_name="rule_name",
+                        regex_pattern="pattern",
+                        documentation="documentation",
+                    )
+                ],
+            )
+        ],
+    )
+    csv_sink = CsvReportSink(path=str(directory.join("results.csv")))
+    parquet_sink = ParquetReportSink(
+        path=str(directory.join("results.parquet")), row_group_size=10
+    )
+    arrow_ipc_sink = ArrowIpcReportSink(
+        path=str(directory.join("results.arrow")), row_group_size=10
+    )
+
+    with csv_sink:
+        csv_sink.write(results)
+        csv_sink.sync()
+        assert pa.csv.read_csv(csv_sink.path).num_rows == 1
+    for sink in (parquet_sink, arrow_ipc_sink):
+        with sink:
+            sink.write(results)
+            sink.flush()
+            assert not os.path.exists(sink.path)
+            sink.sync()
+            size = os.path.getsize(sink.path)
+            assert size > 0
+            sink.sync()
+            assert os.path.getsize(sink.path) == size
+            for _ in range(10):
+                sink.write(results)
+                sink.flush()
+            assert os.path.getsize(sink.path) > size
+
+    metadata = pq.ParquetFile(parquet_sink.path).metadata
+    assert [
+        metadata.row_group(index).num_rows for index in range(metadata.num_row_groups)
+    ] == [1, 10]
+    assert [
+        batch.num_rows
+        for batch in ipc.open_file(arrow_ipc_sink.path).read_all().to_batches()
+    ] == [1, 10]
+
+
+def test_report_to_parquet_and_arrow_ipc_are_dictionary_encoded(tmpdir):
+    directory = tmpdir.mkdir("test")
+    parquet_file = str(directory.join("results.parquet"))
+    arrow_ipc_file = str(directory.join("results.arrow"))
+    report = MetadataGuardianReport(
+        report_results=[
+            ReportResults(
+                source=f"source{index % 2}",
+                results=[
+                    MetadataGuardianResults(
+                        category="category",
+                        content=f"content{index}",
+                        data_rules=[
+                            DataRule(
+                                rule_name=f"rule_name{index % 3}",
+                                regex_pattern="pattern",
+                                documentation=f"documentation{index % 3}",
+                            )
+                        ],
+                    )
+                ],
+            )
+            for index in range(5)
+        ]
+    )
+
+    report.to_parquet(parquet_file, row_group_size=2)
+    report.to_arrow_ipc(arrow_ipc_file, row_group_size=2, compression="lz4")
+
+    expected = report.to_arrow()
+    parquet_table = pq.read_table(parquet_file)
+    assert pq.ParquetFile(parquet_file).metadata.num_row_groups == 3
+    assert pq.ParquetFile(parquet_file).metadata.row_group(0).column(0).compression == (
+        "ZSTD"
+    )
+    arrow_ipc_reader = ipc.open_file(arrow_ipc_file)
+    arrow_ipc_table = arrow_ipc_reader.read_all()
+    assert arrow_ipc_reader.num_record_batches == 3
+    for table in (parquet_table, arrow_ipc_table):
+        assert pa.types.is_dictionary(table.schema.field("documentation").type)
+        assert pa.types.is_string(table.schema.field("content").type)
+        assert table.cast(expected.schema).equals(expected)
+    assert arrow_ipc_table.column("name").chunk(2).dictionary.to_pylist() == [
+        "rule_name0",
+        "rule_name1",
+        "rule_name2",
+    ]
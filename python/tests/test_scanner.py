@@ -1,11 +1,18 @@
 import asyncio
+import json
 import os
+import time
 from unittest.mock import patch
 
+from metadata_guardian.cache import ContentFilesCache
 from metadata_guardian.data_rules import AvailableCategory, DataRules
-from metadata_guardian.report import MetadataGuardianReport, ReportResults
+from metadata_guardian.report import (
+    JsonLinesReportSink,
+    MetadataGuardianReport,
+    ReportResults,
+)
 from metadata_guardian.scanner import ColumnScanner, ContentFilesScanner
-from metadata_guardian.source import SnowflakeSource
+from metadata_guardian.source import ColumnMetadata, MySQLSource, SnowflakeSource
 
 
 @patch("snowflake.connector")
@@ -137,3 +144,298 @@ def test_local_directory_scan():
     )
 
     assert "resources/inclusion_violation.txt" in str(report)
+
+
+def test_local_directory_scan_of_a_missing_directory_should_be_empty(tmpdir):
+    directory_path = str(tmpdir.join("missing"))
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    sink = MetadataGuardianReport()
+
+    report = ContentFilesScanner(data_rules=data_rules).scan_directory(
+        directory_path=directory_path, file_names_extension="txt"
+    )
+    ContentFilesScanner(data_rules=data_rules, sink=sink).scan_directory(
+        directory_path=directory_path, file_names_extension="txt"
+    )
+
+    assert report.report_results == []
+    assert sink.report_results == []
+
+
+def test_local_directory_scan_with_sink():
+    directory_path = os.path.join(os.path.dirname(__file__), "resources")
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    sink = MetadataGuardianReport()
+
+    report = ContentFilesScanner(
+        data_rules=data_rules, sink=sink, batch_size=1
+    ).scan_directory(directory_path=directory_path, file_names_extension="txt")
+
+    assert report.report_results == []
+    assert sink == ContentFilesScanner(data_rules=data_rules).scan_directory(
+        directory_path=directory_path, file_names_extension="txt"
+    )
+
+
+def test_local_directory_scan_with_glob_pattern():
+    directory_path = os.path.dirname(__file__)
+
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    report = ContentFilesScanner(data_rules=data_rules).scan_directory(
+        directory_path=directory_path,
+        file_names_extension="txt",
+        glob_pattern="resources/inclusion_*",
+    )
+
+    assert len(report.report_results) == 1
+    assert report.report_results[0].source.endswith("resources/inclusion_violation.txt")
+    assert len(report.report_results[0].results) == 1
+
+
+def test_local_directory_scan_with_cache(tmpdir):
+    directory_path = os.path.join(os.path.dirname(__file__), "resources")
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with ContentFilesCache(path=str(tmpdir.join("cache.db"))) as cache:
+        content_files_scanner = ContentFilesScanner(data_rules=data_rules, cache=cache)
+        report = content_files_scanner.scan_directory(
+            directory_path=directory_path, file_names_extension="txt"
+        )
+        with patch.object(DataRules, "validate_files") as mock_validate_files:
+            cached_report = content_files_scanner.scan_directory(
+                directory_path=directory_path, file_names_extension="txt"
+            )
+
+    mock_validate_files.assert_not_called()
+    assert cached_report == report
+    assert len(report.report_results[0].results) == 1
+
+
+@patch("snowflake.connector")
+def test_column_scanner_database_name_batch(mock_connection):
+    database_name = "test_database"
+    table_names = ["TEST_TABLE", "TEST_TABLE_2", "TEST_TABLE_3"]
+    mocked_cursor_one = mock_connection.connect().cursor.return_value
+    mocked_cursor_one.fetchall.side_effect = [
+        [(database_name, table_name) for table_name in table_names],
+        [(database_name, table_names[0], "master", "", "", "", "", "", "")],
+        [(database_name, table_names[1], "column", "", "", "", "", "", "")],
+        [(database_name, table_names[2], "slave", "", "", "", "", "", "")],
+    ]
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+    column_scanner = ColumnScanner(data_rules=data_rules, batch_size=2)
+
+    with patch.object(
+        DataRules, "match_words", autospec=True, side_effect=DataRules.match_words
+    ) as match_words:
+        report = column_scanner.scan_external(
+            database_name=database_name, source=source
+        )
+
+    assert match_words.call_count == 2
+    assert [report_results.source for report_results in report.report_results] == [
+        f"{database_name}.{table_name}" for table_name in table_names
+    ]
+    assert [
+        [result.content for result in report_results.results]
+        for report_results in report.report_results
+    ] == [["master"], [], ["slave"]]
+    assert report.report_results[0].results == data_rules.validate_words(["master"])
+
+
+@patch("snowflake.connector")
+def test_column_scanner_sweep_with_checkpoint(mock_connection, tmpdir):
+    checkpoint_path = str(tmpdir.join("checkpoint"))
+    with open(checkpoint_path, "w") as checkpoint_file:
+        checkpoint_file.write("DATABASE_1\n")
+    mocked_cursor_one = mock_connection.connect().cursor.return_value
+    mocked_cursor_one.fetchall.side_effect = [
+        [("", "DATABASE_1"), ("", "DATABASE_2")],
+        [("DATABASE_2", "TEST_TABLE")],
+        [("DATABASE_2", "TEST_TABLE", "master", "", "", "", "", "", "")],
+    ]
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    report = asyncio.run(
+        ColumnScanner(data_rules=data_rules).sweep_external_async(
+            source=source, checkpoint_path=checkpoint_path
+        )
+    )
+
+    assert [report_results.source for report_results in report.report_results] == [
+        "DATABASE_2.TEST_TABLE"
+    ]
+    assert report.report_results[0].results == data_rules.validate_words(["master"])
+    with open(checkpoint_path) as checkpoint_file:
+        assert checkpoint_file.read().splitlines() == ["DATABASE_1", "DATABASE_2"]
+
+
+@patch("snowflake.connector")
+def test_column_scanner_sweep_should_not_write_the_interrupted_databases(
+    mock_connection, tmpdir
+):
+    checkpoint_path = str(tmpdir.join("checkpoint"))
+    output_path = str(tmpdir.join("results.jsonl"))
+    mocked_cursor = mock_connection.connect().cursor.return_value
+
+    def fetchall():
+        query = mocked_cursor.execute.call_args[0][0]
+        if query.startswith("SHOW DATABASES"):
+            return [("", "DATABASE_1"), ("", "DATABASE_2")]
+        if query.startswith("SHOW TABLES"):
+            database_name = query.split('"')[1]
+            return [(database_name, "TABLE_1"), (database_name, "TABLE_2")]
+        database_name, _, table_name = [
+            name.strip('"') for name in query.split(" ")[-1].split(".")
+        ]
+        if (database_name, table_name) == ("DATABASE_2", "TABLE_2"):
+            raise RuntimeError("connection lost")
+        return [(database_name, table_name, "master", "", "", "", "", "", "")]
+
+    mocked_cursor.fetchall.side_effect = fetchall
+    source = SnowflakeSource(
+        sf_account="sf_account",
+        sf_user="sf_user",
+        sf_password="sf_password",
+        warehouse="warehouse",
+        schema_name="PUBLIC",
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with JsonLinesReportSink(path=output_path) as sink:
+        report = asyncio.run(
+            ColumnScanner(
+                data_rules=data_rules, sink=sink, retries=0
+            ).sweep_external_async(
+                source=source,
+                tasks_limit=1,
+                databases_limit=1,
+                checkpoint_path=checkpoint_path,
+            )
+        )
+
+    with open(output_path) as output_file:
+        assert {json.loads(line)["source"] for line in output_file} == {
+            "DATABASE_1.TABLE_1",
+            "DATABASE_1.TABLE_2",
+        }
+    with open(checkpoint_path) as checkpoint_file:
+        assert checkpoint_file.read().splitlines() == ["DATABASE_1"]
+    assert list(report.failed_sources) == ["DATABASE_2.TABLE_2"]
+
+
+def test_column_scanner_should_validate_the_bulk_batches_as_they_arrive():
+    sink = MetadataGuardianReport()
+    written_before_the_next_batch = []
+
+    def get_database_column_names(self, database_name, include_comment=False):
+        yield "t1", [ColumnMetadata(column_name="master")]
+        deadline = time.monotonic() + 5
+        while not sink.report_results and time.monotonic() < deadline:
+            time.sleep(0.01)
+        written_before_the_next_batch.append(len(sink.report_results))
+        yield "t2", [ColumnMetadata(column_name="slave")]
+
+    source = MySQLSource(
+        host="localhost", user="user", password="password", bulk_metadata=True
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with patch.object(
+        MySQLSource, "get_database_column_names", get_database_column_names
+    ):
+        asyncio.run(
+            ColumnScanner(data_rules=data_rules, sink=sink).scan_external_async(
+                source=source, database_name="test"
+            )
+        )
+
+    assert written_before_the_next_batch == [1]
+    assert [report_results.source for report_results in sink.report_results] == [
+        "test.t1",
+        "test.t2",
+    ]
+
+
+def test_column_scanner_should_not_wait_for_the_slowest_table():
+    sink = MetadataGuardianReport()
+    written_before_the_slow_table = []
+
+    async def aget_table_names_list(self, database_name):
+        return ["slow", "t1", "t2", "t3"]
+
+    async def aget_column_names(self, database_name, table_name, include_comment=False):
+        if table_name == "slow":
+            deadline = time.monotonic() + 5
+            while len(sink.report_results) < 3 and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            written_before_the_slow_table.append(len(sink.report_results))
+        return [ColumnMetadata(column_name=f"{table_name}_column")]
+
+    source = MySQLSource(host="localhost", user="user", password="password")
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with (
+        patch.object(MySQLSource, "aget_table_names_list", aget_table_names_list),
+        patch.object(MySQLSource, "aget_column_names", aget_column_names),
+    ):
+        asyncio.run(
+            ColumnScanner(
+                data_rules=data_rules, sink=sink, batch_size=1
+            ).scan_external_async(source=source, database_name="test", tasks_limit=2)
+        )
+
+    assert written_before_the_slow_table == [3]
+    assert [report_results.source for report_results in sink.report_results] == [
+        "test.t1",
+        "test.t2",
+        "test.t3",
+        "test.slow",
+    ]
+
+
+def test_column_scanner_should_retry_the_bulk_stream_without_duplicates():
+    sink = MetadataGuardianReport()
+    attempts = []
+
+    def get_database_column_names(self, database_name, include_comment=False):
+        attempts.append(database_name)
+        yield "t1", [ColumnMetadata(column_name="master")]
+        if len(attempts) == 1:
+            raise ConnectionError("connection reset")
+        yield "t2", [ColumnMetadata(column_name="slave")]
+
+    source = MySQLSource(
+        host="localhost", user="user", password="password", bulk_metadata=True
+    )
+    data_rules = DataRules.from_available_category(category=AvailableCategory.INCLUSION)
+
+    with patch.object(
+        MySQLSource, "get_database_column_names", get_database_column_names
+    ):
+        asyncio.run(
+            ColumnScanner(
+                data_rules=data_rules, sink=sink, retries=1, retry_backoff=0
+            ).scan_external_async(source=source, database_name="test")
+        )
+
+    assert len(attempts) == 2
+    assert [report_results.source for report_results in sink.report_results] == [
+        "test.t1",
+        "test.t2",
+    ]
@@ -0,0 +1,93 @@
+use crate::metadata_guardian::MetadataGuardianError;
+use globset::Glob;
+use log::warn;
+use rayon::prelude::*;
+use std::fs;
+use std::io;
+use std::path::{Path, PathBuf};
+
+/// Find the files of a directory and its subdirectories, walked in parallel.
+///
+/// The files are kept when their name ends with the file name extension and, if a glob pattern is
+/// given, when their path relative to the directory matches it. The paths are returned sorted.
+/// A directory that is missing or cannot be read is logged and has no files, like `os.walk`
+/// does, and its subdirectories that cannot be read are skipped.
+pub fn find_files(
+    directory_path: &str,
+    file_names_extension: &str,
+    glob_pattern: Option<&str>,
+) -> Result<Vec<String>, MetadataGuardianError> {
+    let glob_matcher = glob_pattern
+        .map(|pattern| Glob::new(pattern).map(|glob| glob.compile_matcher()))
+        .transpose()?;
+    let directory = Path::new(directory_path);
+    let suffix = format!(".{file_names_extension}");
+
+    let (mut paths, directories) = match read_directory(directory) {
+        Ok(entries) => entries,
+        Err(error) => {
+            warn!("The directory {directory_path} could not be read: {error}");
+            return Ok(Vec::new());
+        }
+    };
+    paths.extend(walk_directories(&directories));
+    let mut files: Vec<String> = paths
+        .into_iter()
+        .filter(|path| {
+            path.file_name()
+                .is_some_and(|name| name.to_string_lossy().ends_with(&suffix))
+        })
+        .filter(|path| {
+            glob_matcher.as_ref().is_none_or(|matcher| {
+                matcher.is_match(path.strip_prefix(directory).unwrap_or(path))
+            })
+        })
+        .map(|path| path.to_string_lossy().into_owned())
+        .collect();
+    files.sort_unstable();
+    Ok(files)
+}
+
+/// Read the entries of a directory, split between its files and its subdirectories.
+///
+/// The symbolic links to directories are not followed, like `os.walk` does by default. The
+/// entries that cannot be read are logged and skipped.
+fn read_directory(directory: &Path) -> io::Result<(Vec<PathBuf>, Vec<PathBuf>)> {
+    let mut files = Vec::new();
+    let mut directories = Vec::new();
+    for entry in fs::read_dir(directory)? {
+        let entry = entry.and_then(|entry| Ok((entry.file_type()?, entry.path())));
+        let (file_type, path) = match entry {
+            Ok(entry) => entry,
+            Err(error) => {
+                warn!("Skip an entry of {}: {error}", directory.display());
+                continue;
+            }
+        };
+        if file_type.is_dir() {
+            directories.push(path);
+        } else if file_type.is_file() || (file_type.is_symlink() && path.is_file()) {
+            files.push(path);
+        }
+    }
+    Ok((files, directories))
+}
+
+/// Walk the directories and their subdirectories in parallel to list all their files.
+///
+/// The directories that cannot be read are logged and skipped, like `os.walk` does by default.
+fn walk_directories(directories: &[PathBuf]) -> Vec<PathBuf> {
+    directories
+        .par_iter()
+        .flat_map_iter(|directory| match read_directory(directory) {
+            Ok((mut files, subdirectories)) => {
+                files.extend(walk_directories(&subdirectories));
+                files
+            }
+            Err(error) => {
+                warn!("Skip the directory {}: {error}", directory.display());
+                Vec::new()
+            }
+        })
+        .collect()
+}
@@ -1,6 +1,7 @@
 extern crate serde;
 extern crate thiserror;
 
+pub mod files;
 pub mod metadata_guardian;
 
 pub use self::metadata_guardian::*;
@@ -1,3 +1,5 @@
+use crate::files::find_files;
+use memmap2::Mmap;
 use rayon::prelude::*;
 use regex::RegexSet;
 use serde::{Deserialize, Serialize};
@@ -5,6 +7,9 @@ use std::fs::File;
 use std::io::BufRead;
 use std::io::BufReader;
 
+/// Size in bytes of the chunks of a memory-mapped file scanned in parallel.
+const MMAP_CHUNK_SIZE: usize = 4 * 1024 * 1024;
+
 /// Metadata Guardian specific error.
 #[derive(thiserror::Error, Debug)]
 pub enum MetadataGuardianError {
@@ -29,6 +34,13 @@ pub enum MetadataGuardianError {
         #[from]
         source: regex::Error,
     },
+    /// The glob pattern used to filter the files is not valid.
+    #[error("Error when parsing the glob pattern {}", .source)]
+    InvalidGlob {
+        /// Glob error details returned.
+        #[from]
+        source: globset::Error,
+    },
 }
 
 /// A Data Rule instance specify a specific rule with a regex pattern.
@@ -101,37 +113,55 @@ impl DataRules {
         Self::new(&temp.category, temp.data_rules)
     }
 
-    /// Validate a word based on the data rules.
-    pub fn validate_word<'a>(&'a self, word: &'a str) -> MetadataGuardianResults<'a> {
-        let data_rules: Vec<&DataRule> = self
-            .regex_set
-            .matches(word)
+    /// Get the indices of the data rules matching the content.
+    ///
+    /// Most of the contents do not match any rule: `is_match` uses the literal prefilters of the
+    /// regex engine and stops at the first match, `matches` evaluates every pattern over the
+    /// whole content so it only runs on the matching contents.
+    fn matched_indices(&self, content: &str) -> Vec<usize> {
+        if !self.regex_set.is_match(content) {
+            return Vec::new();
+        }
+        self.regex_set.matches(content).into_iter().collect()
+    }
+
+    /// Get the data rules matching the content.
+    fn matched_data_rules(&self, content: &str) -> Vec<&DataRule> {
+        self.matched_indices(content)
             .into_iter()
             .map(|index| &self.data_rules[index])
-            .collect();
+            .collect()
+    }
+
+    /// Validate a word based on the data rules.
+    ///
+    /// The word is owned by the results, an owned `String` is moved without being copied.
+    pub fn validate_word(&self, word: impl Into<String>) -> MetadataGuardianResults<'_> {
+        let content = word.into();
         MetadataGuardianResults {
             category: &self.category,
-            content: word.to_string(),
-            data_rules,
+            data_rules: self.matched_data_rules(&content),
+            content,
         }
     }
 
     /// Validate a list of words based on the data rules.
-    pub fn validate_words<'a>(&'a self, words: Vec<&'a str>) -> Vec<MetadataGuardianResults<'a>> {
+    ///
+    /// The words are owned by the results, the matching owned `String` words are moved without
+    /// being copied.
+    pub fn validate_words<S>(&self, words: Vec<S>) -> Vec<MetadataGuardianResults<'_>>
+    where
+        S: AsRef<str> + Into<String> + Send,
+    {
         words
             .into_par_iter()
-            .filter(|line| !line.is_empty())
-            .flat_map(|content| {
-                let data_rules: Vec<&DataRule> = self
-                    .regex_set
-                    .matches(content)
-                    .into_iter()
-                    .map(|index| &self.data_rules[index])
-                    .collect();
+            .filter(|word| !word.as_ref().is_empty())
+            .flat_map(|word| {
+                let data_rules = self.matched_data_rules(word.as_ref());
                 if !data_rules.is_empty() {
                     Some(MetadataGuardianResults {
                         category: &self.category,
-                        content: content.to_string(),
+                        content: word.into(),
                         data_rules,
                     })
                 } else {
@@ -141,25 +171,47 @@ impl DataRules {
             .collect()
     }
 
-    /// Validate a file content based on the data rules.
+    /// Validate a list of words based on the data rules, referencing the words and the rules by index.
+    pub fn match_words<S: AsRef<str> + Sync>(&self, words: &[S]) -> Vec<MetadataGuardianMatches> {
+        words
+            .par_iter()
+            .enumerate()
+            .filter_map(|(content_index, word)| {
+                let word = word.as_ref();
+                if word.is_empty() {
+                    return None;
+                }
+                let data_rules_indices = self.matched_indices(word);
+                if !data_rules_indices.is_empty() {
+                    Some(MetadataGuardianMatches {
+                        content_index,
+                        data_rules_indices,
+                    })
+                } else {
+                    None
+                }
+            })
+            .collect()
+    }
+
+    /// Validate a file content based on the data rules. Lines that are not valid UTF-8 are skipped.
     pub fn validate_file<'a>(
         &'a self,
-        uri: &'a str,
+        uri: &str,
     ) -> Result<Vec<MetadataGuardianResults<'a>>, MetadataGuardianError> {
         let file = File::open(uri)?;
         let reader = BufReader::new(file);
 
         let results = reader
-            .lines()
+            .split(b'\n')
             .map_while(Result::ok)
             .par_bridge()
-            .flat_map(|content| {
-                let data_rules: Vec<&DataRule> = self
-                    .regex_set
-                    .matches(&content)
-                    .into_iter()
-                    .map(|index| &self.data_rules[index])
-                    .collect();
+            .flat_map(|mut line| {
+                if line.last() == Some(&b'\r') {
+                    line.pop();
+                }
+                let content = String::from_utf8(line).ok()?;
+                let data_rules = self.matched_data_rules(&content);
 
                 if !data_rules.is_empty() {
                     Some(MetadataGuardianResults {
@@ -175,6 +227,103 @@ impl DataRules {
 
         Ok(results)
     }
+
+    /// Validate a file content based on the data rules by memory-mapping the file.
+    ///
+    /// The file is split into newline-aligned chunks validated in parallel. The lines are matched
+    /// as borrowed slices of the mapping and only the matching lines are copied into the results,
+    /// which are returned in the order of the file. Lines that are not valid UTF-8 are skipped.
+    pub fn validate_file_mmap<'a>(
+        &'a self,
+        uri: &str,
+    ) -> Result<Vec<MetadataGuardianResults<'a>>, MetadataGuardianError> {
+        let file = File::open(uri)?;
+        if file.metadata()?.len() == 0 {
+            return Ok(Vec::new());
+        }
+        // SAFETY: the mapping is read-only and dropped before returning, the file is expected
+        // not to be truncated by another process while it is scanned.
+        let mmap = unsafe { Mmap::map(&file)? };
+
+        let results = split_lines_chunks(&mmap, MMAP_CHUNK_SIZE)
+            .into_par_iter()
+            .flat_map_iter(|chunk| {
+                chunk
+                    .strip_suffix(b"\n")
+                    .unwrap_or(chunk)
+                    .split(|byte| *byte == b'\n')
+                    .filter_map(|line| {
+                        let line = line.strip_suffix(b"\r").unwrap_or(line);
+                        let content = std::str::from_utf8(line).ok()?;
+                        let data_rules = self.matched_data_rules(content);
+                        if !data_rules.is_empty() {
+                            Some(MetadataGuardianResults {
+                                category: &self.category,
+                                content: content.to_string(),
+                                data_rules,
+                            })
+                        } else {
+                            None
+                        }
+                    })
+            })
+            .collect();
+
+        Ok(results)
+    }
+
+    /// Validate the content of multiple files in parallel based on the data rules.
+    pub fn validate_files<'a>(
+        &'a self,
+        paths: &[String],
+        memory_map: bool,
+    ) -> Result<Vec<MetadataGuardianFileResults<'a>>, MetadataGuardianError> {
+        paths
+            .par_iter()
+            .map(|path| {
+                let results = if memory_map {
+                    self.validate_file_mmap(path)?
+                } else {
+                    self.validate_file(path)?
+                };
+                Ok(MetadataGuardianFileResults {
+                    path: path.clone(),
+                    results,
+                })
+            })
+            .collect()
+    }
+
+    /// Validate the content of the files of a directory based on the data rules.
+    ///
+    /// The directory is walked in parallel and the files with the file name extension, matching
+    /// the optional glob pattern, are validated in parallel.
+    pub fn validate_directory<'a>(
+        &'a self,
+        directory_path: &str,
+        file_names_extension: &str,
+        glob_pattern: Option<&str>,
+        memory_map: bool,
+    ) -> Result<Vec<MetadataGuardianFileResults<'a>>, MetadataGuardianError> {
+        let paths = find_files(directory_path, file_names_extension, glob_pattern)?;
+        self.validate_files(&paths, memory_map)
+    }
+}
+
+/// Split the content into chunks of at least `chunk_size` bytes ending on a line boundary.
+fn split_lines_chunks(content: &[u8], chunk_size: usize) -> Vec<&[u8]> {
+    let mut chunks = Vec::new();
+    let mut start = 0;
+    while start < content.len() {
+        let end = (start + chunk_size).min(content.len());
+        let end = content[end..]
+            .iter()
+            .position(|byte| *byte == b'\n')
+            .map_or(content.len(), |position| end + position + 1);
+        chunks.push(&content[start..end]);
+        start = end;
+    }
+    chunks
 }
 
 /// Metadata Guardian results.
@@ -188,6 +337,24 @@ pub struct MetadataGuardianResults<'a> {
     pub data_rules: Vec<&'a DataRule>,
 }
 
+/// Metadata Guardian matches, referencing the content and the data rules by index.
+#[derive(Debug, PartialEq, Eq)]
+pub struct MetadataGuardianMatches {
+    /// Index of the content in the validated contents.
+    pub content_index: usize,
+    /// Indices of the data rules that match the content.
+    pub data_rules_indices: Vec<usize>,
+}
+
+/// Metadata Guardian results of a file.
+#[derive(Debug, PartialEq, Eq)]
+pub struct MetadataGuardianFileResults<'a> {
+    /// Path of the file.
+    pub path: String,
+    /// The results of the file content.
+    pub results: Vec<MetadataGuardianResults<'a>>,
+}
+
 /// Returns rust crate version, can be use used in language bindings to expose Rust core version
 pub fn crate_version() -> &'static str {
     env!("CARGO_PKG_VERSION")
@@ -1,4 +1,7 @@
+use metadata_guardian::files::find_files;
 use metadata_guardian::metadata_guardian::{DataRule, DataRules};
+use regex::RegexSet;
+use std::fs;
 use std::path::PathBuf;
 
 #[test]
@@ -111,3 +114,283 @@ fn test_validate_file_with_inclusion_should_contains_results() {
     );
     assert_eq!(result.data_rules[0], &data_rules[0]);
 }
+
+#[test]
+fn test_validate_file_mmap_with_inclusion_should_contains_results() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let mut file = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    file.push("tests");
+    file.push("resources");
+    file.push("inclusion_violations.txt");
+    let path = file.into_os_string().into_string().unwrap();
+    let results = data_guardian.validate_file_mmap(&path).unwrap();
+    let expected_results = data_guardian.validate_file(&path).unwrap();
+    assert_eq!(results, expected_results);
+    assert_eq!(results.len(), 1);
+    assert_eq!(
+        results[0].content,
+        "unpaid and unfree workers. Any particular slave may fulfill one, several, or"
+    );
+}
+
+#[test]
+fn test_validate_file_should_skip_the_invalid_utf8_lines() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let file = std::env::temp_dir().join(format!(
+        "metadata_guardian_invalid_utf8_{}.txt",
+        std::process::id()
+    ));
+    fs::write(
+        &file,
+        b"the master node\r\ninvalid \xff slave\nthe slave node\n".as_slice(),
+    )
+    .unwrap();
+    let path = file.to_str().unwrap();
+
+    let mut results = data_guardian.validate_file(path).unwrap();
+    let mmap_results = data_guardian.validate_file_mmap(path);
+    fs::remove_file(&file).unwrap();
+
+    results.sort_by(|left, right| left.content.cmp(&right.content));
+    assert_eq!(results, mmap_results.unwrap());
+    assert_eq!(results.len(), 2);
+    assert_eq!(results[0].content, "the master node");
+    assert_eq!(results[1].content, "the slave node");
+}
+
+#[test]
+fn test_validate_directory_with_inclusion_should_contains_results() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let mut directory = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    directory.push("tests");
+    let directory_path = directory.into_os_string().into_string().unwrap();
+    let files_results = data_guardian
+        .validate_directory(&directory_path, "txt", None, false)
+        .unwrap();
+    assert_eq!(files_results.len(), 1);
+    let file_results = &files_results[0];
+    assert!(file_results.path.ends_with("inclusion_violations.txt"));
+    assert_eq!(file_results.results.len(), 1);
+    assert_eq!(
+        file_results.results[0].content,
+        "unpaid and unfree workers. Any particular slave may fulfill one, several, or"
+    );
+}
+
+#[test]
+fn test_validate_directory_with_glob_pattern_should_filter_files() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let mut directory = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    directory.push("tests");
+    let directory_path = directory.into_os_string().into_string().unwrap();
+    let files_results = data_guardian
+        .validate_directory(&directory_path, "yaml", Some("resources/pii_*"), true)
+        .unwrap();
+    assert_eq!(files_results.len(), 1);
+    assert!(files_results[0].path.ends_with("pii_rules.yaml"));
+}
+
+#[test]
+fn test_validate_directory_with_missing_directory_should_be_empty() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let mut directory = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    directory.push("tests");
+    directory.push("missing");
+    let directory_path = directory.into_os_string().into_string().unwrap();
+
+    assert!(find_files(&directory_path, "txt", None).unwrap().is_empty());
+    assert!(data_guardian
+        .validate_directory(&directory_path, "txt", None, false)
+        .unwrap()
+        .is_empty());
+}
+
+#[cfg(unix)]
+#[test]
+fn test_validate_directory_should_skip_the_unreadable_subdirectories() {
+    use std::os::unix::fs::PermissionsExt;
+
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let directory = std::env::temp_dir().join(format!("metadata_guardian_{}", std::process::id()));
+    let unreadable_directory = directory.join("unreadable");
+    fs::create_dir_all(&unreadable_directory).unwrap();
+    fs::write(directory.join("violations.txt"), "slave\n").unwrap();
+    fs::write(unreadable_directory.join("violations.txt"), "slave\n").unwrap();
+    fs::set_permissions(&unreadable_directory, fs::Permissions::from_mode(0o000)).unwrap();
+    // The permissions are not enforced for a privileged user.
+    let unreadable = fs::read_dir(&unreadable_directory).is_err();
+
+    let files_results =
+        data_guardian.validate_directory(directory.to_str().unwrap(), "txt", None, false);
+    fs::set_permissions(&unreadable_directory, fs::Permissions::from_mode(0o755)).unwrap();
+    fs::remove_dir_all(&directory).unwrap();
+
+    let files_results = files_results.unwrap();
+    assert_eq!(files_results.len(), if unreadable { 1 } else { 2 });
+    assert!(files_results[0]
+        .path
+        .ends_with(&format!("{}violations.txt", std::path::MAIN_SEPARATOR)));
+}
+
+#[test]
+fn test_validate_words_with_pii_should_match_as_the_regex_set() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("pii_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let regex_set = RegexSet::new(
+        data_guardian
+            .data_rules
+            .iter()
+            .map(|data_rule| &data_rule.pattern),
+    )
+    .unwrap();
+    let content = vec![
+        "id",
+        "created_at",
+        "email",
+        "user_email",
+        "relationship",
+        "ip",
+        "test@gmail.com",
+        "email test@gmail.com",
+        "phone 192.168.0.1",
+        "75001",
+        "username",
+        "no pii",
+        "",
+    ];
+    let expected_matches: Vec<(usize, Vec<usize>)> = content
+        .iter()
+        .enumerate()
+        .filter(|(_, word)| !word.is_empty())
+        .map(|(index, word)| (index, regex_set.matches(word).into_iter().collect()))
+        .filter(|(_, data_rules_indices): &(usize, Vec<usize>)| !data_rules_indices.is_empty())
+        .collect();
+    assert!(expected_matches.len() < content.len() - 1);
+    assert!(expected_matches
+        .iter()
+        .any(|(_, data_rules_indices)| data_rules_indices.len() > 1));
+
+    let matches: Vec<(usize, Vec<usize>)> = data_guardian
+        .match_words(&content)
+        .into_iter()
+        .map(|word_matches| (word_matches.content_index, word_matches.data_rules_indices))
+        .collect();
+    assert_eq!(matches, expected_matches);
+
+    let results: Vec<(String, Vec<&str>)> = data_guardian
+        .validate_words(content.clone())
+        .into_iter()
+        .map(|result| {
+            (
+                result.content,
+                result
+                    .data_rules
+                    .iter()
+                    .map(|data_rule| data_rule.rule_name.as_str())
+                    .collect(),
+            )
+        })
+        .collect();
+    let expected_results: Vec<(String, Vec<&str>)> = expected_matches
+        .iter()
+        .map(|(index, data_rules_indices)| {
+            (
+                content[*index].to_string(),
+                data_rules_indices
+                    .iter()
+                    .map(|data_rule_index| {
+                        data_guardian.data_rules[*data_rule_index]
+                            .rule_name
+                            .as_str()
+                    })
+                    .collect(),
+            )
+        })
+        .collect();
+    assert_eq!(results, expected_results);
+    for (index, word) in content.iter().enumerate() {
+        let word_rules_count = expected_matches
+            .iter()
+            .find(|(matched_index, _)| *matched_index == index)
+            .map_or(0, |(_, data_rules_indices)| data_rules_indices.len());
+        assert_eq!(
+            data_guardian.validate_word(*word).data_rules.len(),
+            word_rules_count
+        );
+    }
+}
+
+#[test]
+fn test_match_words_with_inclusion_should_reference_the_words_and_rules() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let content = vec!["no error", "", "master", "no error 2", "slave"];
+    let matches = data_guardian.match_words(&content);
+    assert_eq!(matches.len(), 2);
+    assert_eq!(matches[0].content_index, 2);
+    assert_eq!(matches[1].content_index, 4);
+    let data_rule = &data_guardian.data_rules[matches[0].data_rules_indices[0]];
+    assert_eq!(data_rule.rule_name, "master");
+    assert_eq!(matches[0].data_rules_indices, matches[1].data_rules_indices);
+}
+
+#[test]
+fn test_validate_words_with_owned_words_across_threads() {
+    let mut path = PathBuf::from(env!("CARGO_MANIFEST_DIR"));
+    path.push("tests");
+    path.push("resources");
+    path.push("inclusion_rules.yaml");
+    let data_guardian =
+        DataRules::from_path(&path.into_os_string().into_string().unwrap()).unwrap();
+    let results_counts: Vec<usize> = std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..4)
+            .map(|_| {
+                let words = vec!["master".to_string(), "primary".to_string()];
+                scope.spawn(|| data_guardian.validate_words(words).len())
+            })
+            .collect();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().unwrap())
+            .collect()
+    });
+    assert_eq!(results_counts, vec![1; 4]);
+}